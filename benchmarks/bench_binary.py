@@ -0,0 +1,74 @@
+"""Benchmarks for binary serialization of instances with large arrays."""
+
+import json
+import pickle
+
+import attrs
+import numpy as np
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+SIZE = 1_000_000
+
+
+@attrs.define
+class Spectrum:
+    w = pinttr.field(units=ureg.nm)
+    radiance = pinttr.field(units=ureg.W / ureg.m**2 / ureg.sr / ureg.nm)
+
+
+@pytest.fixture(scope="module")
+def spectrum():
+    return Spectrum(np.linspace(400.0, 700.0, SIZE), np.random.random(SIZE))
+
+
+def _dump_json(obj, path):
+    data = pinttr.unstructure(obj)
+    for value in data.values():
+        value["value"] = value["value"].tolist()
+    path.write_text(json.dumps(data))
+
+
+def _load_json(path):
+    return pinttr.structure(Spectrum, json.loads(path.read_text()))
+
+
+def _dump_pickle(obj, path):
+    path.write_bytes(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _load_pickle(path):
+    return pickle.loads(path.read_bytes())
+
+
+def test_save_json(benchmark, spectrum, tmp_path):
+    benchmark(_dump_json, spectrum, tmp_path / "spectrum.json")
+
+
+def test_save_pickle(benchmark, spectrum, tmp_path):
+    benchmark(_dump_pickle, spectrum, tmp_path / "spectrum.pickle")
+
+
+def test_save_binary(benchmark, spectrum, tmp_path):
+    benchmark(pinttr.save_binary, spectrum, tmp_path / "spectrum.bin")
+
+
+def test_load_json(benchmark, spectrum, tmp_path):
+    path = tmp_path / "spectrum.json"
+    _dump_json(spectrum, path)
+    benchmark(_load_json, path)
+
+
+def test_load_pickle(benchmark, spectrum, tmp_path):
+    path = tmp_path / "spectrum.pickle"
+    _dump_pickle(spectrum, path)
+    benchmark(_load_pickle, path)
+
+
+def test_load_binary(benchmark, spectrum, tmp_path):
+    path = tmp_path / "spectrum.bin"
+    pinttr.save_binary(spectrum, path)
+    benchmark(pinttr.load_binary, path, Spectrum)
@@ -0,0 +1,38 @@
+"""
+Benchmarks for the conversion of large arrays: pint's ``Quantity.to()``,
+compared to chunked conversions allocating their output or writing to a
+preallocated array. Chunked conversions scale with the number of cores.
+"""
+
+import numpy as np
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+#: Number of array elements (128 MiB of 64-bit floats).
+SIZE = 1 << 24
+
+
+@pytest.fixture(scope="module", params=["scale", "offset"])
+def quantity(request):
+    units = ureg.km if request.param == "scale" else ureg.degC
+    return np.random.default_rng(0).random(SIZE) * units
+
+
+def _target(quantity):
+    return ureg.m if quantity.units == ureg.km else ureg.K
+
+
+def test_pint(benchmark, quantity):
+    benchmark(quantity.to, _target(quantity))
+
+
+def test_chunked(benchmark, quantity):
+    benchmark(pinttr.convert_array, quantity, _target(quantity))
+
+
+def test_chunked_out(benchmark, quantity):
+    out = np.empty(SIZE)
+    benchmark(pinttr.convert_array, quantity, _target(quantity), out=out)
@@ -0,0 +1,91 @@
+"""Benchmarks for loading tabular data with units."""
+
+import csv
+
+import attrs
+import numpy as np
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+ROWS = 100_000
+
+
+@attrs.define
+class Record:
+    t = pinttr.field(units=ureg.s)
+    altitude = pinttr.field(units=ureg.m)
+    speed = pinttr.field(units=ureg.m / ureg.s)
+
+
+@pytest.fixture(scope="module")
+def path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("columnar") / "telemetry.csv"
+    data = np.random.random((ROWS, 3))
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["t", "altitude", "speed"])
+        writer.writerow(["s", "km", "km/h"])
+        writer.writerows(data.tolist())
+    return path
+
+
+def _read_rows(path):
+    # Row-by-row conversion through interpret_units()
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        names = next(reader)
+        units = next(reader)
+        return [
+            Record(
+                **pinttr.interpret_units(
+                    {
+                        **{name: float(value) for name, value in zip(names, row)},
+                        **{f"{name}_units": u for name, u in zip(names, units)},
+                    }
+                )
+            )
+            for row in reader
+        ]
+
+
+def test_read_rows(benchmark, path):
+    benchmark.pedantic(_read_rows, (path,), rounds=1, iterations=1)
+
+
+def test_read_columns(benchmark, path):
+    benchmark(pinttr.read_columns, path, Record)
+
+
+@pytest.fixture(scope="module")
+def records():
+    data = np.random.random((ROWS, 3)).tolist()
+    return [
+        {
+            "t": t,
+            "t_units": "s",
+            "altitude": altitude,
+            "altitude_units": "km",
+            "speed": speed,
+            "speed_units": "km/h",
+        }
+        for t, altitude, speed in data
+    ]
+
+
+def test_interpret_units_records(benchmark, records):
+    benchmark.pedantic(
+        lambda: [pinttr.interpret_units(record) for record in records], rounds=3
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_interpret_records(benchmark, records, max_workers):
+    benchmark.pedantic(
+        pinttr.interpret_records,
+        args=(records,),
+        kwargs={"chunk_size": ROWS // 8, "max_workers": max_workers},
+        rounds=3,
+    )
@@ -0,0 +1,30 @@
+"""Benchmarks for unit context overrides."""
+
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+
+@pytest.mark.parametrize("n", [1, 10, 100])
+def test_override(benchmark, n):
+    ctx = pinttr.UnitContext({f"key{i}": ureg.m for i in range(n)})
+    overrides = {f"key{i}": ureg.km for i in range(n)}
+
+    def override():
+        with ctx.override(overrides):
+            pass
+
+    benchmark(override)
+
+
+def test_override_str(benchmark):
+    ctx = pinttr.UnitContext({f"key{i}": ureg.m for i in range(10)}, interpret_str=True)
+    overrides = {f"key{i}": "km" for i in range(10)}
+
+    def override():
+        with ctx.override(overrides):
+            pass
+
+    benchmark(override)
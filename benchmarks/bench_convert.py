@@ -0,0 +1,42 @@
+"""Benchmarks for converting instances to a target unit system."""
+
+import attrs
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+BATCH = 10_000
+
+
+@attrs.define
+class Motion:
+    distance = pinttr.field(units=ureg.km)
+    speed = pinttr.field(units=ureg.km / ureg.h)
+    duration = pinttr.field(units=ureg.h)
+
+
+@pytest.fixture(scope="module")
+def batch():
+    return [Motion(float(i), 2.0 * i, 0.5) for i in range(BATCH)]
+
+
+def _loop(objs):
+    # Conversion with a loop over fields, re-running converters and validators
+    result = []
+    for obj in objs:
+        changes = {
+            field.name: getattr(obj, field.name).to_base_units()
+            for field in attrs.fields(Motion)
+        }
+        result.append(attrs.evolve(obj, **changes))
+    return result
+
+
+def test_loop(benchmark, batch):
+    benchmark(_loop, batch)
+
+
+def test_convert_units(benchmark, batch):
+    benchmark(pinttr.convert_units, batch, "SI")
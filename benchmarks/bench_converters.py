@@ -0,0 +1,35 @@
+"""Benchmarks for the converters."""
+
+import pytest
+
+import pinttr
+from pinttr.converters import ensure_units, to_quantity
+
+ureg = pinttr.get_unit_registry()
+
+
+def test_ensure_units_magnitude(benchmark):
+    benchmark(ensure_units, 1.0, default_units=ureg.m)
+
+
+def test_ensure_units_quantity(benchmark):
+    benchmark(ensure_units, 1.0 * ureg.km, default_units=ureg.m)
+
+
+def test_ensure_units_convert(benchmark):
+    benchmark(ensure_units, 1.0 * ureg.km, default_units=ureg.m, convert=True)
+
+
+def test_ensure_units_generator(benchmark):
+    benchmark(ensure_units, 1.0, default_units=pinttr.UnitGenerator(ureg.m))
+
+
+def test_to_quantity_dict(benchmark):
+    benchmark(to_quantity, {"value": 1.0, "units": "km"})
+
+
+def test_to_quantity_dataarray(benchmark):
+    xr = pytest.importorskip("xarray")
+    np = pytest.importorskip("numpy")
+    data = xr.DataArray(np.arange(1000.0), attrs={"units": "km"})
+    benchmark(to_quantity, data)
@@ -0,0 +1,35 @@
+"""
+Benchmarks for copies of instances with large array fields, with and without
+copy-on-write sharing of magnitudes.
+"""
+
+import copy
+
+import attrs
+import numpy as np
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+#: Number of array fields and elements per array.
+FIELDS = 10
+SIZE = 100_000
+
+_attrs = {f"x{i}": pinttr.field(units=ureg.m) for i in range(FIELDS)}
+Plain = attrs.make_class("Plain", dict(_attrs))
+Shared = pinttr.copy_on_write(attrs.make_class("Shared", dict(_attrs)))
+
+COPIERS = {
+    "deepcopy": copy.deepcopy,
+    "attrs.evolve": attrs.evolve,
+    "evolve": pinttr.evolve,
+}
+
+
+@pytest.mark.parametrize("cls", [Plain, Shared], ids=["plain", "cow"])
+@pytest.mark.parametrize("copier", list(COPIERS), ids=list(COPIERS))
+def test_copy(benchmark, cls, copier):
+    inst = cls(**{f"x{i}": np.zeros(SIZE) for i in range(FIELDS)})
+    benchmark(COPIERS[copier], inst)
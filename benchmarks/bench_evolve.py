@@ -0,0 +1,25 @@
+"""Benchmarks for instance evolution."""
+
+import attrs
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+
+@attrs.define
+class State:
+    x = pinttr.field(units=ureg.m)
+    y = pinttr.field(units=ureg.m)
+    z = pinttr.field(units=ureg.m)
+    t = pinttr.field(units=ureg.s)
+
+
+def test_evolve_attrs(benchmark):
+    state = State(1.0, 2.0, 3.0, 0.0)
+    benchmark(attrs.evolve, state, t=1.0)
+
+
+def test_evolve_pinttr(benchmark):
+    state = State(1.0, 2.0, 3.0, 0.0)
+    benchmark(pinttr.evolve, state, t=1.0)
@@ -0,0 +1,28 @@
+"""Benchmarks for the instantiation of classes with unit fields."""
+
+import attrs
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+
+def _make_class(n):
+    return attrs.make_class(
+        f"Fields{n}", {f"x{i}": pinttr.field(units=ureg.m) for i in range(n)}
+    )
+
+
+@pytest.mark.parametrize("n", [1, 10, 50])
+def test_init_magnitudes(benchmark, n):
+    cls = _make_class(n)
+    kwargs = {f"x{i}": 1.0 for i in range(n)}
+    benchmark(lambda: cls(**kwargs))
+
+
+@pytest.mark.parametrize("n", [1, 10, 50])
+def test_init_quantities(benchmark, n):
+    cls = _make_class(n)
+    kwargs = {f"x{i}": 1.0 * ureg.km for i in range(n)}
+    benchmark(lambda: cls(**kwargs))
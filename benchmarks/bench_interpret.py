@@ -0,0 +1,15 @@
+"""Benchmarks for unit interpretation in dictionaries."""
+
+import pytest
+
+import pinttr
+
+UNITS = ["m", "km", "s", "ms", "kg", "K", "W/m^2", "nm"]
+
+
+@pytest.mark.parametrize("n", [10, 100])
+def test_interpret_units(benchmark, n):
+    d = {f"x{i}": float(i) for i in range(n)}
+    d.update({f"x{i}_units": UNITS[i % len(UNITS)] for i in range(n)})
+    d.update({f"label{i}": "a" for i in range(n)})
+    benchmark(pinttr.interpret_units, d)
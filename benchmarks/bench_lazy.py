@@ -0,0 +1,47 @@
+"""Benchmarks for building instances from arrays stored on disk."""
+
+import attrs
+import numpy as np
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+SIZE = 10_000_000
+
+
+@attrs.define
+class Spectrum:
+    w = pinttr.field(units=ureg.nm)
+
+
+@pytest.fixture(scope="module")
+def path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("lazy") / "w.npy"
+    pinttr.save_npy(path, np.linspace(400.0, 700.0, SIZE) * ureg.nm)
+    return path
+
+
+def _eager(path):
+    return Spectrum(pinttr.load_npy(path).load())
+
+
+def _lazy(path):
+    return Spectrum(pinttr.load_npy(path))
+
+
+def _eager_in_memory(path):
+    return Spectrum(pinttr.load_npy(path, mmap_mode=None).load())
+
+
+def test_init_in_memory(benchmark, path):
+    benchmark(_eager_in_memory, path)
+
+
+def test_init_memmap(benchmark, path):
+    benchmark(_eager, path)
+
+
+def test_init_lazy(benchmark, path):
+    benchmark(_lazy, path)
@@ -0,0 +1,60 @@
+"""Benchmarks for the asynchronous loading of record files."""
+
+import asyncio
+import json
+
+import attrs
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+N_FILES = 200
+
+
+@attrs.define
+class Scene:
+    altitude = pinttr.field(units=ureg.m)
+    temperature = pinttr.field(units=ureg.K)
+    pressure = pinttr.field(units=ureg.Pa)
+
+
+@pytest.fixture(scope="module")
+def paths(tmp_path_factory):
+    root = tmp_path_factory.mktemp("scenes")
+    result = []
+    for i in range(N_FILES):
+        path = root / f"scene{i}.json"
+        record = {
+            "altitude": float(i),
+            "altitude_units": "km",
+            "temperature": 288.0,
+            "temperature_units": "K",
+            "pressure": 1013.0,
+            "pressure_units": "hPa",
+        }
+        path.write_text(json.dumps(record))
+        result.append(path)
+    return result
+
+
+def test_load_sequential(benchmark, paths):
+    def load():
+        results = []
+        for path in paths:
+            with open(path) as f:
+                record = pinttr.interpret_units(json.load(f))
+            results.append(Scene(**record))
+        return results
+
+    benchmark(load)
+
+
+@pytest.mark.parametrize("max_workers", [1, 8])
+def test_aload_records(benchmark, paths, max_workers):
+    benchmark(
+        lambda: asyncio.run(
+            pinttr.aload_records(paths, cls=Scene, max_workers=max_workers)
+        )
+    )
@@ -0,0 +1,32 @@
+"""
+Benchmarks for memoized function calls: cache hits with scalar and array
+arguments (whose cost is dominated by argument normalization and hashing).
+"""
+
+import numpy as np
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+
+def _speed(distance, duration):
+    return distance / duration
+
+
+speed = pinttr.memoize(_speed, units={"distance": ureg.m, "duration": ureg.s})
+
+
+def test_uncached(benchmark):
+    benchmark(_speed, 1.0 * ureg.km, 10.0 * ureg.s)
+
+
+def test_hit_scalar(benchmark):
+    benchmark(speed, 1.0 * ureg.km, 10.0 * ureg.s)
+
+
+@pytest.mark.parametrize("size", [1000, 1_000_000])
+def test_hit_array(benchmark, size):
+    distance = np.arange(float(size)) * ureg.m
+    benchmark(speed, distance, 10.0 * ureg.s)
@@ -0,0 +1,86 @@
+"""
+Memory footprint of unit-aware objects, measured with tracemalloc.
+
+Footprints are compared with the budget stored in ``memory_budget.json``;
+after an intended change, update it with ``--memory-budget-update``.
+"""
+
+import gc
+import sys
+import tracemalloc
+
+import attrs
+import numpy as np
+import pytest
+
+import pinttr
+from pinttr.converters import to_quantity
+
+ureg = pinttr.get_unit_registry()
+
+#: Number of objects created per measurement.
+N = 1000
+
+
+def _measure(factory, inputs):
+    """
+    Return the number of bytes allocated per object when calling ``factory``
+    on each of ``inputs``. Inputs are created beforehand and not counted.
+    """
+    factory(inputs[0])  # Warm up caches
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objs = [factory(x) for x in inputs]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before - sys.getsizeof(objs)) / len(objs)
+
+
+def _make_class(n, **kwargs):
+    return attrs.make_class(
+        f"Fields{n}", {f"x{i}": pinttr.field(units=ureg.m, **kwargs) for i in range(n)}
+    )
+
+
+@pytest.mark.parametrize("n", [1, 10])
+def test_memory_scalar_fields(memory_budget, n):
+    cls = _make_class(n)
+    inputs = [{f"x{i}": float(j) for i in range(n)} for j in range(N)]
+    per_instance = _measure(lambda kwargs: cls(**kwargs), inputs)
+    memory_budget.check(f"scalar_fields[{n}]", per_instance, per_instance / n)
+
+
+@pytest.mark.parametrize("n", [1, 10])
+def test_memory_array_fields(memory_budget, n):
+    # Array data is allocated beforehand: only the wrapping overhead is counted
+    cls = _make_class(n, dtype="float64", shape=(None,))
+    inputs = [{f"x{i}": np.zeros(100) for i in range(n)} for _ in range(N)]
+    per_instance = _measure(lambda kwargs: cls(**kwargs), inputs)
+    memory_budget.check(f"array_fields[{n}]", per_instance, per_instance / n)
+
+
+@pytest.mark.parametrize("n", [10, 100])
+def test_memory_unit_context(memory_budget, n):
+    inputs = [{f"key{i}": ureg.m for i in range(n)} for _ in range(N // 10)]
+    per_instance = _measure(pinttr.UnitContext, inputs)
+    memory_budget.check(f"unit_context[{n}]", per_instance, per_instance / n)
+
+
+def test_memory_interpret_units(memory_budget):
+    n = 10
+    inputs = []
+    for j in range(N):
+        d = {f"x{i}": float(j) for i in range(n)}
+        d.update({f"x{i}_units": "km" for i in range(n)})
+        inputs.append(d)
+    per_instance = _measure(pinttr.interpret_units, inputs)
+    memory_budget.check("interpret_units", per_instance, per_instance / n)
+
+
+def test_memory_to_quantity(memory_budget):
+    inputs = [{"value": float(j), "units": "km"} for j in range(N)]
+    per_instance = _measure(to_quantity, inputs)
+    memory_budget.check("to_quantity", per_instance, per_instance)
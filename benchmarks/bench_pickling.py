@@ -0,0 +1,101 @@
+"""Benchmarks for sending instances to process pool workers."""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import attrs
+import numpy as np
+import pytest
+
+import pinttr
+from pinttr import pickling
+
+ureg = pinttr.get_unit_registry()
+
+BATCH = 1000
+
+
+@attrs.define
+class Sample:
+    wavelength = pinttr.field(units=ureg.nm)
+    radiance = pinttr.field(units=ureg.W / ureg.m**2 / ureg.sr / ureg.nm)
+    temperature = pinttr.field(units=ureg.K)
+
+
+@pytest.fixture(scope="module")
+def batch():
+    return [Sample(550.0, np.random.random(16), 300.0) for _ in range(BATCH)]
+
+
+@pytest.fixture(scope="module")
+def spectrum():
+    return Sample(np.linspace(400.0, 700.0, 1_000_000), np.ones(1_000_000), 300.0)
+
+
+def _identity(x):
+    return x
+
+
+def _round_trip(pool, obj):
+    return pool.submit(_identity, obj).result()
+
+
+def test_dumps_pickle(benchmark, batch):
+    benchmark(pickle.dumps, batch, pickle.HIGHEST_PROTOCOL)
+
+
+def test_dumps_pinttr(benchmark, batch):
+    benchmark(pickling.dumps, batch)
+
+
+def test_loads_pickle(benchmark, batch):
+    benchmark(pickle.loads, pickle.dumps(batch, pickle.HIGHEST_PROTOCOL))
+
+
+def test_loads_pinttr(benchmark, batch):
+    benchmark(pickle.loads, pickling.dumps(batch))
+
+
+def test_pool_round_trip_pickle(benchmark, batch):
+    with ProcessPoolExecutor(1) as pool:
+        _round_trip(pool, None)  # Start the worker
+        benchmark(_round_trip, pool, batch)
+
+
+def test_pool_round_trip_pinttr(benchmark, batch):
+    pickling.register()
+    try:
+        with ProcessPoolExecutor(1, initializer=pickling.register) as pool:
+            _round_trip(pool, None)
+            benchmark(_round_trip, pool, batch)
+    finally:
+        pickling.unregister()
+
+
+def _length(obj):
+    # Close blocks attached by previous tasks
+    pickling.release_shared_memory()
+    return len(obj.radiance)
+
+
+def _send(pool, obj):
+    # Only a length is sent back
+    result = pool.submit(_length, obj).result()
+    pickling.release_shared_memory()
+    return result
+
+
+def test_pool_send_array_pickle(benchmark, spectrum):
+    with ProcessPoolExecutor(1) as pool:
+        _round_trip(pool, None)
+        benchmark(_send, pool, spectrum)
+
+
+def test_pool_send_array_shared_memory(benchmark, spectrum):
+    pickling.register(shared_memory_threshold=1 << 20)
+    try:
+        with ProcessPoolExecutor(1, initializer=pickling.register) as pool:
+            _round_trip(pool, None)
+            benchmark(_send, pool, spectrum)
+    finally:
+        pickling.unregister()
@@ -0,0 +1,45 @@
+"""Benchmarks for attribute assignment through the ``on_setattr`` pipe."""
+
+import attrs
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+
+@attrs.define
+class State:
+    x = pinttr.field(units=ureg.m)
+    t = pinttr.field(units=ureg.s)
+
+
+@pytest.fixture
+def state():
+    return State(x=1.0, t=1.0)
+
+
+def test_setattr_validated(benchmark, state):
+    value = 2.0 * ureg.km
+
+    def assign():
+        state.x = value
+
+    benchmark(assign)
+
+
+def test_setattr_trusted(benchmark, state):
+    value = 2.0 * ureg.km
+
+    def assign():
+        state.x = value
+
+    with pinttr.trusted():
+        benchmark(assign)
+
+
+def test_setattr_magnitude(benchmark, state):
+    def assign():
+        state.x = 2.0
+
+    benchmark(assign)
@@ -0,0 +1,75 @@
+"""Benchmarks for (un)structuring of unit-aware instances."""
+
+import attrs
+import pint
+
+import pinttr
+from pinttr.converters import to_quantity
+
+ureg = pinttr.get_unit_registry()
+
+
+@attrs.define
+class Scene:
+    altitude = pinttr.field(units=ureg.km)
+    wavelength = pinttr.field(units=ureg.nm)
+    temperature = pinttr.field(units=ureg.K)
+    pressure = pinttr.field(units=ureg.Pa)
+    label = attrs.field(default="")
+
+
+SCENE = Scene(1.0, 550.0, 288.15, 101325.0, "a")
+
+
+def _asdict_quantities(obj):
+    return attrs.asdict(
+        obj,
+        value_serializer=lambda inst, field, value: (
+            {"value": value.magnitude, "units": str(value.units)}
+            if isinstance(value, pint.Quantity)
+            else value
+        ),
+    )
+
+
+def _from_dict_to_quantity(cls, data):
+    return cls(**{k: to_quantity(v) for k, v in data.items()})
+
+
+def test_unstructure_asdict(benchmark):
+    benchmark(_asdict_quantities, SCENE)
+
+
+def test_unstructure_pinttr(benchmark):
+    benchmark(pinttr.unstructure, SCENE)
+
+
+def test_structure_to_quantity(benchmark):
+    data = _asdict_quantities(SCENE)
+    benchmark(_from_dict_to_quantity, Scene, data)
+
+
+def test_structure_pinttr(benchmark):
+    data = pinttr.unstructure(SCENE)
+    benchmark(pinttr.structure, Scene, data)
+
+
+RECORD = {
+    "altitude": 1000.0,
+    "altitude_units": "m",
+    "wavelength": 0.55,
+    "wavelength_units": "um",
+    "temperature": 288.15,
+    "temperature_units": "K",
+    "pressure": 1013.25,
+    "pressure_units": "hPa",
+    "label": "a",
+}
+
+
+def test_from_dict_interpret_units(benchmark):
+    benchmark(lambda: Scene(**pinttr.interpret_units(RECORD)))
+
+
+def test_from_dict_pinttr(benchmark):
+    benchmark(pinttr.from_dict, Scene, RECORD)
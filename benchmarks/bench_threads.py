@@ -0,0 +1,102 @@
+"""
+Multi-threaded scaling of instantiation, unit overrides and unit context
+lookups.
+
+Each thread performs the same number of operations (weak scaling): with
+perfect scaling, the time per round stays constant as the number of threads
+grows, which requires a free-threaded Python build. The aggregate throughput
+is stored in the ``throughput`` extra info field (operations per second).
+Workers check that units overridden by other threads never leak into theirs.
+"""
+
+import threading
+
+import attrs
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+#: Operations per thread and round.
+OPS = 1000
+
+THREADS = [1, 2, 4, 8]
+
+UNITS = [ureg.m, ureg.km, ureg.cm, ureg.mm, ureg.mile, ureg.ft, ureg.nm, ureg.um]
+
+length = pinttr.UnitGenerator(ureg.m)
+ctx = pinttr.UnitContext({"length": length, "time": ureg.s})
+
+
+@attrs.define
+class Point:
+    x = pinttr.field(units=length)
+    t = pinttr.field(units=ureg.s)
+
+
+def _run(benchmark, n, work):
+    """
+    Benchmark ``work(i)`` run concurrently by ``n`` threads, ``i`` being the
+    thread index. ``work`` returns a list of errors, which must be empty.
+    """
+    errors = []
+
+    def round_():
+        barrier = threading.Barrier(n)
+
+        def target(i):
+            barrier.wait()
+            errors.extend(work(i))
+
+        threads = [threading.Thread(target=target, args=(i,)) for i in range(n)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    benchmark.pedantic(round_, rounds=5, warmup_rounds=1)
+    if benchmark.stats:  # Unset with --benchmark-disable
+        benchmark.extra_info["throughput"] = n * OPS / benchmark.stats.stats.mean
+    assert not errors
+
+
+@pytest.mark.parametrize("n", THREADS)
+def test_threads_init(benchmark, n):
+    def work(i):
+        units = UNITS[i % len(UNITS)]
+        errors = []
+        with length.override(units):
+            for _ in range(OPS):
+                p = Point(1.0, 1.0)
+                if p.x.units != units:
+                    errors.append(p.x.units)
+        return errors
+
+    _run(benchmark, n, work)
+
+
+@pytest.mark.parametrize("n", THREADS)
+def test_threads_override(benchmark, n):
+    def work(i):
+        units = UNITS[i % len(UNITS)]
+        errors = []
+        for _ in range(OPS):
+            with ctx.override({"length": units}):
+                if ctx.get("length") != units:
+                    errors.append(ctx.get("length"))
+        return errors
+
+    _run(benchmark, n, work)
+
+
+@pytest.mark.parametrize("n", THREADS)
+def test_threads_get(benchmark, n):
+    def work(i):
+        errors = []
+        for _ in range(OPS):
+            if ctx.get("length") != ureg.m:
+                errors.append(ctx.get("length"))
+        return errors
+
+    _run(benchmark, n, work)
@@ -0,0 +1,47 @@
+"""Benchmarks for range validators on array fields."""
+
+import attrs
+import numpy as np
+import pytest
+
+import pinttr
+from pinttr.validators import has_compatible_units, in_range
+
+ureg = pinttr.get_unit_registry()
+
+SIZE = 100_000
+
+
+def _python_range(instance, attribute, value):
+    # Typical hand-written validator: bounds converted on every call, elements
+    # checked in a Python loop
+    lower = (0.0 * ureg.km).m_as(value.units)
+    upper = (100.0 * ureg.km).m_as(value.units)
+    for x in value.magnitude:
+        if not lower <= x <= upper:
+            raise ValueError(f"{x} out of range")
+
+
+@attrs.define
+class Python:
+    altitude = pinttr.field(
+        units=ureg.m, validator=[has_compatible_units, _python_range]
+    )
+
+
+@attrs.define
+class Vectorized:
+    altitude = pinttr.field(units=ureg.m, validator=in_range(0.0, 100.0 * ureg.km))
+
+
+@pytest.fixture(scope="module")
+def altitude():
+    return ureg.Quantity(np.random.random(SIZE) * 100.0, "km")
+
+
+def test_python_range(benchmark, altitude):
+    benchmark(Python, altitude)
+
+
+def test_in_range(benchmark, altitude):
+    benchmark(Vectorized, altitude)
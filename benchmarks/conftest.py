@@ -0,0 +1,83 @@
+import json
+import os
+
+import pytest
+
+#: Path to the stored memory budget.
+MEMORY_BUDGET_PATH = os.path.join(os.path.dirname(__file__), "memory_budget.json")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--memory-budget-update",
+        action="store_true",
+        help="Store measured memory footprints as the new memory budget.",
+    )
+
+
+class MemoryBudget:
+    """
+    Check memory footprints against the stored budget and collect them for the
+    terminal summary.
+    """
+
+    def __init__(self, update):
+        self.update = update
+        with open(MEMORY_BUDGET_PATH) as f:
+            data = json.load(f)
+        self.tolerance = data["tolerance"]
+        self.budget = data["budget"]
+        self.results = {}
+
+    def check(self, name, per_instance, per_field):
+        measured = {"instance": round(per_instance), "field": round(per_field)}
+        self.results[name] = measured
+        if self.update:
+            return
+
+        try:
+            budget = self.budget[name]
+        except KeyError:
+            pytest.fail(
+                f"no memory budget for '{name}': run with --memory-budget-update"
+            )
+
+        limit = budget["instance"] * (1.0 + self.tolerance)
+        if measured["instance"] > limit:
+            pytest.fail(
+                f"'{name}' uses {measured['instance']} bytes per instance, "
+                f"exceeding its budget of {budget['instance']} bytes "
+                f"(+{self.tolerance:.0%})"
+            )
+
+    def save(self):
+        with open(MEMORY_BUDGET_PATH, "w") as f:
+            json.dump(
+                {"tolerance": self.tolerance, "budget": self.results},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+            f.write("\n")
+
+
+@pytest.fixture(scope="session")
+def memory_budget(request):
+    budget = MemoryBudget(request.config.getoption("--memory-budget-update"))
+    request.config._memory_budget = budget
+    yield budget
+    if budget.update:
+        budget.save()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    budget = getattr(config, "_memory_budget", None)
+    if budget is None or not budget.results:
+        return
+
+    terminalreporter.section("memory footprint (bytes)")
+    terminalreporter.write_line(f"{'Name':<40} {'per instance':>14} {'per field':>12}")
+    for name, measured in sorted(budget.results.items()):
+        terminalreporter.write_line(
+            f"{name:<40} {measured['instance']:>14} {measured['field']:>12}"
+        )
@@ -4,13 +4,32 @@ Pinttrs package.
 Pint meets attrs.
 """
 
-from . import converters, exceptions, util, validators
+from . import converters, exceptions, pickling, util, validators
+from ._binary import load_binary, save_binary
+from ._chunked import convert_array, get_conversion_threshold, set_conversion_threshold
+from ._cmp import quantity_eq
+from ._columnar import interpret_records, iter_columns, read_columns
 from ._context import UnitContext
+from ._cow import copy_on_write
 from ._defaults import get_unit_registry, set_unit_registry
+from ._funcs import convert_units, evolve, from_dict, structure, unstructure
 from ._generator import UnitGenerator
+from ._instrument import (
+    ConversionRecord,
+    ConversionTrace,
+    Instrumentation,
+    instrument,
+    trace,
+)
 from ._interpret import interpret_units
+from ._lazy import LazyQuantity, load_npy, save_npy
+from ._loader import aiter_records, aload_records
 from ._make import attrib
+from ._memoize import CacheInfo, memoize
 from ._next_gen import field
+from ._repr import get_repr_threshold, set_repr_threshold
+from ._schema import UnitField, UnitSchema, fields_with_units
+from ._trusted import is_trusted, trusted
 
 # Package metadata
 from ._version import version as __version__
@@ -18,17 +37,52 @@ from ._version import version as __version__
 # Other definitions
 ib = attrib
 __all__ = [
+    "CacheInfo",
+    "ConversionRecord",
+    "ConversionTrace",
+    "Instrumentation",
+    "LazyQuantity",
     "UnitContext",
+    "UnitField",
     "UnitGenerator",
+    "UnitSchema",
     "__version__",
+    "aiter_records",
+    "aload_records",
     "attrib",
+    "convert_array",
+    "convert_units",
     "converters",
+    "copy_on_write",
+    "evolve",
     "exceptions",
     "field",
+    "fields_with_units",
+    "from_dict",
+    "get_conversion_threshold",
+    "get_repr_threshold",
     "get_unit_registry",
     "ib",
+    "instrument",
+    "interpret_records",
     "interpret_units",
+    "is_trusted",
+    "iter_columns",
+    "load_binary",
+    "load_npy",
+    "memoize",
+    "pickling",
+    "quantity_eq",
+    "read_columns",
+    "save_binary",
+    "save_npy",
+    "set_conversion_threshold",
+    "set_repr_threshold",
     "set_unit_registry",
+    "structure",
+    "trace",
+    "trusted",
+    "unstructure",
     "util",
     "validators",
 ]
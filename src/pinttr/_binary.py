@@ -0,0 +1,338 @@
+import importlib
+import json
+import os
+import struct
+from typing import IO, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import attrs
+import pint
+
+from ._cache import format_units, parse_units
+from ._schema import _init_name
+
+#: File signature (format version 1).
+_MAGIC = b"PINTTR\x00\x01"
+#: Alignment of the header end and of array buffers, in bytes.
+_ALIGN = 64
+
+
+def _qualified_name(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _resolve_class(name: str) -> type:
+    """
+    Import the *attrs* class recorded in a file header as ``module:qualname``.
+    """
+    module_name, _, qualname = name.partition(":")
+    obj = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    if not (isinstance(obj, type) and attrs.has(obj)):
+        raise TypeError(f"'{name}' is not an attrs class")
+    return obj
+
+
+def _pad(offset: int) -> int:
+    return -offset % _ALIGN
+
+
+def _encode(obj: Any, buffers: List[Any], offset: List[int]) -> Dict[str, Any]:
+    """
+    Encode the fields of an *attrs* instance as a JSON-compatible header entry.
+    Arrays are appended to ``buffers``; ``offset`` holds the current data
+    offset (relative to the start of the data section) and is updated.
+    """
+    import numpy as np
+
+    fields = {}
+
+    for attribute in attrs.fields(obj.__class__):
+        if not attribute.init:
+            continue
+
+        value = getattr(obj, attribute.name)
+        key = _init_name(attribute)
+
+        if isinstance(value, pint.Quantity):
+            units = format_units(value.units)
+            value = value.magnitude
+        else:
+            units = None
+
+        if isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                raise TypeError(
+                    f"cannot serialize object array stored in field '{key}'"
+                )
+            if value.flags.c_contiguous:
+                order, data = "C", value
+            elif value.flags.f_contiguous:
+                order, data = "F", value.T
+            else:  # Only non-contiguous arrays are copied
+                order, data = "C", np.ascontiguousarray(value)
+
+            offset[0] += _pad(offset[0])
+            fields[key] = {
+                "kind": "array",
+                "units": units,
+                "dtype": value.dtype.str,
+                "shape": list(value.shape),
+                "order": order,
+                "offset": offset[0],
+            }
+            buffers.append((offset[0], data))
+            offset[0] += data.nbytes
+
+        elif attrs.has(value.__class__):
+            fields[key] = {
+                "kind": "instance",
+                "class": _qualified_name(value.__class__),
+                "fields": _encode(value, buffers, offset),
+            }
+
+        else:
+            if isinstance(value, np.generic):
+                value = value.item()
+            fields[key] = {"kind": "value", "units": units, "value": value}
+
+    return fields
+
+
+def save_binary(obj: Any, file: Union[str, os.PathLike, IO[bytes]]) -> None:
+    """
+    Write an *attrs* instance to a binary file.
+
+    The file starts with a small JSON header holding the class name, field
+    names and unit strings, followed by the raw buffers of array magnitudes.
+    Contiguous arrays are written directly from their memory (without
+    copying); non-contiguous ones are made contiguous first. Non-array values
+    must be JSON-serializable; nested *attrs* instances are supported.
+
+    :param obj:
+        An *attrs* instance.
+
+    :param file:
+        A path or a binary file object open for writing.
+
+    :raises TypeError:
+        If a value cannot be serialized.
+
+    .. seealso:: :func:`load_binary`
+
+    .. versionadded:: 26.2.0
+    """
+    buffers = []
+    offset = [0]
+    header = {
+        "class": _qualified_name(obj.__class__),
+        "fields": _encode(obj, buffers, offset),
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    prefix_size = len(_MAGIC) + 8 + len(header_bytes)
+    header_bytes += b" " * _pad(prefix_size)
+
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "wb") as f:
+            _write(f, header_bytes, buffers)
+    else:
+        _write(file, header_bytes, buffers)
+
+
+def _write(f: IO[bytes], header_bytes: bytes, buffers: List[Tuple[int, Any]]):
+    f.write(_MAGIC)
+    f.write(struct.pack("<Q", len(header_bytes)))
+    f.write(header_bytes)
+
+    position = 0
+    for offset, data in buffers:
+        if offset > position:
+            f.write(b"\0" * (offset - position))
+        f.write(memoryview(data).cast("B"))
+        position = offset + data.nbytes
+
+
+def _nested_class(cls: type, key: str, name: str, allowed: Dict[str, type]) -> type:
+    """
+    Return the class of a nested instance stored in field ``key`` of ``cls``:
+    the declared type of the field if it is the recorded class ``name``,
+    otherwise an ``allowed`` class. No module is imported.
+    """
+    for attribute in attrs.fields(cls):
+        if _init_name(attribute) == key:
+            declared = attribute.type
+            if (
+                isinstance(declared, type)
+                and attrs.has(declared)
+                and _qualified_name(declared) == name
+            ):
+                return declared
+            break
+
+    try:
+        return allowed[name]
+    except KeyError:
+        raise TypeError(
+            f"class '{name}' stored in field '{key}' is neither the declared "
+            "type of the field nor an allowed class"
+        ) from None
+
+
+def _decode(
+    fields: Dict[str, Any],
+    cls: Optional[type],
+    allowed: Dict[str, type],
+    path: Union[str, os.PathLike],
+    data_offset: int,
+    mmap_mode: Optional[str],
+    ureg,
+) -> Dict[str, Any]:
+    """
+    Decode header field entries as ``__init__()`` arguments of ``cls``. If
+    ``cls`` is ``None``, nested classes are imported from the header.
+    """
+    import numpy as np
+
+    kwargs = {}
+
+    for key, entry in fields.items():
+        kind = entry["kind"]
+
+        if kind == "instance":
+            if cls is None:
+                nested = _resolve_class(entry["class"])
+                nested_cls = None
+            else:
+                nested = nested_cls = _nested_class(cls, key, entry["class"], allowed)
+            kwargs[key] = nested(
+                **_decode(
+                    entry["fields"],
+                    nested_cls,
+                    allowed,
+                    path,
+                    data_offset,
+                    mmap_mode,
+                    ureg,
+                )
+            )
+            continue
+
+        if kind == "array":
+            dtype = np.dtype(entry["dtype"])
+            shape = tuple(entry["shape"])
+            if entry["order"] == "F":
+                shape = shape[::-1]
+            offset = data_offset + entry["offset"]
+
+            if mmap_mode is None:
+                count = int(np.prod(shape, dtype=np.int64))
+                value = np.fromfile(path, dtype=dtype, count=count, offset=offset)
+                value = value.reshape(shape)
+            elif 0 in shape:  # Empty arrays cannot be memory-mapped
+                value = np.empty(shape, dtype=dtype)
+            else:
+                value = np.memmap(
+                    path, dtype=dtype, mode=mmap_mode, offset=offset, shape=shape
+                )
+
+            if entry["order"] == "F":
+                value = value.T
+        else:
+            value = entry["value"]
+
+        if entry["units"] is not None:
+            units = parse_units(entry["units"], ureg)
+            value = units._REGISTRY.Quantity(value, units)
+
+        kwargs[key] = value
+
+    return kwargs
+
+
+def load_binary(
+    path: Union[str, os.PathLike],
+    cls: Optional[type] = None,
+    mmap_mode: Optional[str] = "r",
+    ureg: Any = None,
+    classes: Sequence[type] = (),
+) -> Any:
+    """
+    Read an *attrs* instance from a file written by :func:`save_binary`.
+
+    By default, array magnitudes are memory-mapped: they are views onto the
+    file and their data is only read upon access. The instance is created by
+    calling the class normally, *i.e.* field converters and validators run.
+
+    .. warning::
+       If ``cls`` is unset, the modules named in the file header, for the
+       top-level instance and all nested instances, are imported and the
+       *attrs* classes it records are instantiated. Only load such files from
+       trusted sources. If ``cls`` is set, no module is imported.
+
+    :param path:
+        Path to the file.
+
+    :param cls:
+        Class to instantiate. If unset, the class recorded in the file header
+        is imported, as well as those of nested instances. If set, nested
+        instances are created with the declared type of their field (if it is
+        the recorded class) or with a class from ``classes``.
+
+    :param mmap_mode:
+        Memory-mapping mode (see :class:`numpy.memmap`). ``"r"`` yields
+        read-only arrays, ``"c"`` copy-on-write arrays. If ``None``, arrays are
+        read into memory.
+
+    :param ureg:
+        Unit registry used to interpret unit strings. If set to ``None``,
+        Pinttrs's registered unit registry is used.
+
+    :param classes:
+        Additional *attrs* classes which nested instances may have, if ``cls``
+        is set.
+
+    :returns:
+        The loaded instance.
+
+    :raises ValueError:
+        If the file is not a Pinttrs binary file.
+
+    :raises TypeError:
+        If a class recorded in the file header is not an *attrs* class or, if
+        ``cls`` is set, is neither the declared type of its field nor one of
+        ``classes``.
+
+    .. rubric:: Example
+
+    >>> import os, tempfile
+    >>> @attrs.define
+    ... class Spectrum:
+    ...     w = pinttrs.field(units=ureg.nm)
+    >>> path = os.path.join(tempfile.mkdtemp(), "spectrum.bin")
+    >>> pinttrs.save_binary(Spectrum(np.linspace(400.0, 700.0, 4)), path)
+    >>> pinttrs.load_binary(path, cls=Spectrum)
+    Spectrum(w=[400.0 500.0 600.0 700.0] nm)
+
+    .. versionadded:: 26.2.0
+    """
+    with open(path, "rb") as f:
+        magic = f.read(len(_MAGIC))
+        if magic != _MAGIC:
+            raise ValueError(f"'{path}' is not a Pinttrs binary file")
+        (header_size,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_size).decode("utf-8"))
+
+    data_offset = len(_MAGIC) + 8 + header_size
+
+    if cls is None:
+        cls = _resolve_class(header["class"])
+        nested_cls = None
+    else:
+        nested_cls = cls
+
+    allowed = {_qualified_name(c): c for c in classes}
+    return cls(
+        **_decode(
+            header["fields"], nested_cls, allowed, path, data_offset, mmap_mode, ureg
+        )
+    )
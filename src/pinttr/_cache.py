@@ -0,0 +1,151 @@
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+import pint
+
+from . import _chunked, _instrument
+from ._defaults import get_unit_registry
+
+
+def conversion_factor(src: pint.Unit, dst: pint.Unit) -> Optional[Tuple[float, float]]:
+    """
+    Compute the affine transform converting magnitudes from ``src`` to ``dst``
+    units. Results are cached.
+
+    :param src:
+        Source units.
+
+    :param dst:
+        Target units.
+
+    :returns:
+        A ``(scale, offset)`` pair such that ``x_dst = scale * x_src + offset``,
+        or ``None`` if the conversion is not affine (*e.g.* logarithmic units).
+
+    :raises DimensionalityError:
+        If ``src`` and ``dst`` are incompatible.
+    """
+    # Units from different registries may compare equal but raise upon
+    # comparison: the cache is indexed by registry and unit containers
+    if src._REGISTRY is not dst._REGISTRY:
+        raise ValueError("Cannot operate with Unit and Unit of different registries.")
+    return _conversion_factor(src._REGISTRY, src._units, dst._units)
+
+
+@lru_cache(maxsize=1024)
+def _conversion_factor(registry, src, dst) -> Optional[Tuple[float, float]]:
+    if src == dst:
+        return 1.0, 0.0
+
+    Quantity = registry.Quantity
+    x0 = Quantity(0.0, src).m_as(dst)
+    x1 = Quantity(1.0, src).m_as(dst)
+    x2 = Quantity(2.0, src).m_as(dst)
+    scale, offset = x1 - x0, x0
+
+    if abs(2.0 * scale + offset - x2) > 1e-12 * max(abs(x2), 1.0):
+        return None
+
+    return scale, offset
+
+
+def base_units(units: pint.Unit, system: Optional[str] = None) -> pint.Unit:
+    """
+    Return the base units corresponding to ``units``, optionally in a given
+    unit system (*e.g.* ``"SI"``, ``"cgs"``). Results are cached.
+    """
+    return _base_units(units._REGISTRY, units._units, system)
+
+
+@lru_cache(maxsize=1024)
+def _base_units(registry, units, system) -> pint.Unit:
+    return registry.get_base_units(units, system=system)[1]
+
+
+def parse_units(units: str, ureg: Any = None) -> pint.Unit:
+    """
+    Interpret a unit string using ``ureg`` (by default, the registry returned
+    by :func:`.get_unit_registry`). Results are cached.
+    """
+    if ureg is None:
+        ureg = get_unit_registry()
+    if isinstance(ureg, pint.ApplicationRegistry):
+        ureg = ureg.get()
+    if _instrument._active:
+        return _instrument._timed("parse", None, _parse_units, ureg, units)
+    return _parse_units(ureg, units)
+
+
+@lru_cache(maxsize=1024)
+def _parse_units(registry, units: str) -> pint.Unit:
+    return registry.Unit(units)
+
+
+def units_compatible(units1: pint.Unit, units2: pint.Unit) -> bool:
+    """
+    Cached version of :func:`pinttr.util.units_compatible`.
+    """
+    if units1._REGISTRY is not units2._REGISTRY:
+        raise ValueError("Cannot operate with Unit and Unit of different registries.")
+    return _units_compatible(units1._REGISTRY, units1._units, units2._units)
+
+
+@lru_cache(maxsize=1024)
+def _units_compatible(registry, units1, units2) -> bool:
+    return (registry.Quantity(1.0, units1) / registry.Quantity(1.0, units2)).unitless
+
+
+def same_units(units1: pint.Unit, units2: pint.Unit) -> bool:
+    """
+    Check if two units are identical, without raising if they belong to
+    different registries.
+    """
+    return units1 is units2 or (
+        units1._REGISTRY is units2._REGISTRY and units1._units == units2._units
+    )
+
+
+def format_units(units: pint.Unit, spec: str = "") -> str:
+    """
+    Format ``units`` with the format specification ``spec``. Results are
+    cached.
+    """
+    return _format_units(units._REGISTRY, units._units, spec)
+
+
+@lru_cache(maxsize=1024)
+def _format_units(registry, units, spec) -> str:
+    return format(registry.Unit(units), spec)
+
+
+def convert_magnitude(
+    magnitude: Any, src: pint.Unit, dst: pint.Unit, out: Any = None
+) -> Any:
+    """
+    Convert a magnitude from ``src`` to ``dst`` units using a cached
+    conversion factor. The magnitude is returned unchanged (and not copied) if
+    no conversion is required and ``out`` is unset. Arrays above the
+    conversion threshold, and all conversions writing to ``out``, go through
+    the chunked conversion engine.
+    """
+    factor = conversion_factor(src, dst)
+
+    if _instrument._active:
+        _instrument._converted(src, dst, magnitude, factor)
+
+    if factor is None:
+        converted = src._REGISTRY.Quantity(magnitude, src).m_as(dst)
+        if out is None:
+            return converted
+        out[...] = converted
+        return out
+
+    scale, offset = factor
+    if out is not None or _chunked._is_large(magnitude):
+        if out is None and scale == 1.0 and offset == 0.0:
+            return magnitude
+        return _chunked._convert_blocks(magnitude, scale, offset, out)
+
+    if offset == 0.0:
+        return magnitude if scale == 1.0 else magnitude * scale
+    return magnitude * scale + offset
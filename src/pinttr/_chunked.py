@@ -0,0 +1,180 @@
+import os
+import threading
+from typing import Any, Optional, Union
+
+import pint
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+#: Size (number of elements) above which array conversions are chunked and
+#: spread across threads (``None`` disables chunking).
+_conversion_threshold: Optional[int] = 1 << 20
+
+#: Number of elements converted at once: blocks of 64-bit floats fit in a
+#: typical L2 cache.
+_BLOCK_SIZE = 1 << 15
+
+
+def set_conversion_threshold(threshold: Optional[int]) -> None:
+    """
+    Set the size above which array magnitudes are converted in blocks by
+    multiple threads.
+
+    :param threshold:
+        Total number of array elements which triggers chunked conversion. If
+        set to ``None``, arrays are always converted in a single operation.
+
+    .. versionadded:: 26.2.0
+    """
+    global _conversion_threshold
+    if threshold is not None and threshold < 0:
+        raise ValueError("threshold must be a positive integer or None")
+    _conversion_threshold = threshold
+
+
+def get_conversion_threshold() -> Optional[int]:
+    """
+    Get the size above which array magnitudes are converted in blocks by
+    multiple threads.
+
+    .. versionadded:: 26.2.0
+    """
+    return _conversion_threshold
+
+
+def _is_large(magnitude: Any) -> bool:
+    """
+    Return ``True`` if ``magnitude`` is an array exceeding the conversion
+    threshold.
+    """
+    threshold = _conversion_threshold
+    return (
+        threshold is not None
+        and np is not None
+        and isinstance(magnitude, np.ndarray)
+        and magnitude.size >= threshold
+    )
+
+
+def _convert_blocks(magnitude: Any, scale: float, offset: float, out: Any = None):
+    """
+    Compute ``magnitude * scale + offset`` block by block, spreading blocks
+    across threads (NumPy releases the GIL during arithmetic). The result is
+    written to ``out`` (which may be ``magnitude``) if it is set.
+
+    Threads only live for the duration of the call, so that no idle thread is
+    left behind when forking worker processes.
+    """
+    magnitude = np.asarray(magnitude)
+    if out is None:
+        out = np.empty(magnitude.shape, dtype=np.result_type(magnitude, scale))
+    elif out.shape != magnitude.shape:
+        raise ValueError(
+            f"output shape {out.shape} does not match magnitude shape {magnitude.shape}"
+        )
+
+    if magnitude.flags.c_contiguous and out.flags.c_contiguous:
+        src, dst = magnitude.reshape(-1), out.reshape(-1)
+    else:
+        src, dst = magnitude, out
+
+    # Multidimensional arrays without flat views are converted in one go
+    size = src.size if src.ndim == 1 else 0
+
+    def convert(start: int, stop: int) -> None:
+        for i in range(start, stop, _BLOCK_SIZE):
+            j = min(i + _BLOCK_SIZE, stop)
+            np.multiply(src[i:j], scale, out=dst[i:j])
+            if offset != 0.0:
+                np.add(dst[i:j], offset, out=dst[i:j])
+
+    workers = min(os.cpu_count() or 1, -(-size // _BLOCK_SIZE))
+
+    if workers <= 1:
+        if size:
+            convert(0, size)
+        else:
+            np.multiply(src, scale, out=dst)
+            if offset != 0.0:
+                np.add(dst, offset, out=dst)
+        return out
+
+    # Contiguous ranges of whole blocks, one per worker; the first range is
+    # converted by the calling thread
+    step = -(-size // (workers * _BLOCK_SIZE)) * _BLOCK_SIZE
+    errors = []
+
+    def target(start: int) -> None:
+        try:
+            convert(start, min(start + step, size))
+        except BaseException as e:  # Re-raised by the calling thread
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=target, args=(start,), name="pinttr-convert")
+        for start in range(step, size, step)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        convert(0, min(step, size))
+    finally:
+        for thread in threads:
+            thread.join()
+    if errors:
+        raise errors[0]
+
+    return out
+
+
+def convert_array(
+    quantity: pint.Quantity, units: Union[pint.Unit, str], out: Any = None
+) -> pint.Quantity:
+    """
+    Convert an array quantity to ``units``, optionally writing the converted
+    magnitude to a preallocated array.
+
+    The conversion factor is cached. Arrays larger than the conversion
+    threshold (see :func:`set_conversion_threshold`) are converted in
+    cache-sized blocks by multiple threads. :func:`.ensure_units` and the
+    other conversion routines of Pinttrs use this engine automatically for
+    large arrays.
+
+    :param quantity:
+        Quantity to convert.
+
+    :param units:
+        Target units.
+
+    :param out:
+        If set, an array with the shape of the magnitude, to which the
+        converted magnitude is written. It may be the magnitude itself, which
+        is then converted in place.
+
+    :returns:
+        The converted quantity. If ``out`` is set, its magnitude is ``out``.
+
+    :raises pint.DimensionalityError:
+        If ``units`` are incompatible with those of ``quantity``.
+
+    .. rubric:: Example
+
+    >>> x = np.arange(3.0) * ureg.km
+    >>> out = np.empty(3)
+    >>> pinttrs.convert_array(x, "m", out=out)
+    <Quantity([   0. 1000. 2000.], 'meter')>
+    >>> out
+    array([   0., 1000., 2000.])
+
+    .. versionadded:: 26.2.0
+    """
+    from ._cache import convert_magnitude, parse_units
+
+    if isinstance(units, str):
+        units = parse_units(units, quantity._REGISTRY)
+
+    magnitude = convert_magnitude(quantity.magnitude, quantity.units, units, out=out)
+    return units._REGISTRY.Quantity(magnitude, units)
@@ -0,0 +1,205 @@
+import math
+import weakref
+from typing import Any, Callable, Dict, Tuple, Union
+
+import pint
+
+from ._cache import base_units, convert_magnitude
+from ._generator import UnitGenerator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+#: Hashes of read-only arrays owning their data, indexed by array ID and target
+#: units (registry and unit container).
+_HASH_CACHE: Dict[Tuple[int, Any, Any], Tuple[weakref.ref, int]] = {}
+
+
+def _is_array(x: Any) -> bool:
+    return np is not None and isinstance(x, np.ndarray)
+
+
+def _same_buffer(a, b) -> bool:
+    return (
+        a.__array_interface__["data"][0] == b.__array_interface__["data"][0]
+        and a.shape == b.shape
+        and a.strides == b.strides
+        and a.dtype == b.dtype
+    )
+
+
+def _array_hash(m) -> int:
+    if m.dtype.kind in "biuf":
+        # Normalize dtype and signed zeros, which compare equal
+        data = (np.asarray(m, dtype=np.float64) + 0.0).tobytes()
+        return hash((m.shape, data))
+    return hash(m.shape)
+
+
+class _QuantityKey:
+    """
+    Comparison key produced by :func:`quantity_eq`. Holds a magnitude expressed
+    in the declared units of the compared field.
+    """
+
+    __slots__ = ("magnitude", "units", "rtol", "atol", "_hash")
+
+    def __init__(self, magnitude, units, rtol, atol, hash_value=None):
+        self.magnitude = magnitude
+        self.units = units
+        self.rtol = rtol
+        self.atol = atol
+        self._hash = hash_value
+
+    def __eq__(self, other):
+        if not isinstance(other, _QuantityKey):
+            return NotImplemented
+
+        if self.units != other.units:
+            return False
+
+        a, b = self.magnitude, other.magnitude
+        if a is b:
+            return True
+
+        tolerance = self.rtol or self.atol
+        if _is_array(a) or _is_array(b):
+            a, b = np.asarray(a), np.asarray(b)
+            if a.shape != b.shape:
+                return False
+            if _same_buffer(a, b):
+                return True
+            if tolerance:
+                return bool(np.allclose(a, b, rtol=self.rtol, atol=self.atol))
+            return bool(np.array_equal(a, b))
+
+        if tolerance and a is not None and b is not None:
+            return math.isclose(a, b, rel_tol=self.rtol, abs_tol=self.atol)
+        return bool(a == b)
+
+    def __hash__(self):
+        if self._hash is not None:
+            return self._hash
+
+        m = self.magnitude
+        if self.rtol or self.atol:
+            # Hashes must agree for values equal within tolerance
+            return hash((self.units, np.shape(m) if _is_array(m) else None))
+        if _is_array(m):
+            return hash((self.units, _array_hash(m)))
+        return hash((self.units, m))
+
+
+class _QuantityEq:
+    """
+    Key function comparing quantities in a field's declared units. Built by
+    :func:`quantity_eq`.
+    """
+
+    __slots__ = ("units", "rtol", "atol")
+
+    def __init__(self, units, rtol, atol):
+        self.units = units
+        self.rtol = rtol
+        self.atol = atol
+
+    def __call__(self, value: Any) -> _QuantityKey:
+        if not isinstance(value, pint.Quantity):
+            return _QuantityKey(value, None, self.rtol, self.atol)
+
+        source = value.magnitude
+        if self.units is None:
+            units = base_units(value.units)
+        else:
+            units = self.units()
+        magnitude = convert_magnitude(source, value.units, units)
+        hash_value = None
+
+        # Cache hashes of read-only arrays owning their data (views of
+        # writable arrays may change)
+        if (
+            _is_array(source)
+            and source.base is None
+            and not source.flags.writeable
+            and not (self.rtol or self.atol)
+        ):
+            cache_key = (id(source), units._REGISTRY, units._units)
+            try:
+                ref, hash_value = _HASH_CACHE[cache_key]
+                if ref() is not source:
+                    hash_value = None
+            except KeyError:
+                pass
+
+            if hash_value is None:
+                hash_value = hash((units, _array_hash(magnitude)))
+                _HASH_CACHE[cache_key] = (
+                    weakref.ref(
+                        source, lambda _, key=cache_key: _HASH_CACHE.pop(key, None)
+                    ),
+                    hash_value,
+                )
+
+        return _QuantityKey(magnitude, units, self.rtol, self.atol, hash_value)
+
+    def bind(self, units: UnitGenerator) -> "_QuantityEq":
+        """
+        Return a copy of this key function comparing in ``units``.
+        """
+        return _QuantityEq(units, self.rtol, self.atol)
+
+
+def quantity_eq(
+    units: Union[None, pint.Unit, UnitGenerator] = None,
+    *,
+    rtol: float = 0.0,
+    atol: float = 0.0,
+) -> Callable[[Any], Any]:
+    """
+    Create an equality and hashing strategy for quantity fields, to be passed
+    as the ``eq`` argument of :func:`pinttrs.field` (or :func:`attrs.field`).
+
+    Compared quantities are converted to ``units`` with a cached conversion
+    factor; therefore, ``1 km`` and ``1000 m`` compare equal. Array magnitudes
+    are compared with a single NumPy reduction, which avoids the truth value
+    ambiguity of elementwise comparison, and comparison is short-circuited if
+    both values share the same buffer. The hash of read-only arrays which own
+    their data is cached.
+
+    :param units:
+        Units in which values are compared. If unset and the strategy is passed
+        to :func:`pinttrs.field`, the field's units are used; otherwise, values
+        are compared in base units.
+
+    :param rtol:
+        Relative tolerance. If this or ``atol`` is nonzero, values are compared
+        with :func:`numpy.allclose` (or :func:`math.isclose` for scalars).
+
+    :param atol:
+        Absolute tolerance, expressed in ``units``.
+
+    :returns:
+        A key function (see the ``eq`` argument of :func:`attrs.field`).
+
+    .. note::
+       With a tolerance, hashing only accounts for units and array shapes so
+       that values equal within tolerance share the same hash.
+
+    .. rubric:: Example
+
+    >>> @attrs.define
+    ... class Spectrum:
+    ...     w = pinttrs.field(units=ureg.m, eq=pinttrs.quantity_eq())
+    >>> Spectrum(np.array([500.0, 600.0])) == Spectrum([0.5, 0.6] * ureg.km)
+    True
+
+    .. versionadded:: 26.2.0
+    """
+    if isinstance(units, pint.Unit):
+        units = UnitGenerator(units)
+    elif units is not None and not isinstance(units, UnitGenerator):
+        raise TypeError("Argument 'units' must be a pint.Units or a UnitGenerator")
+
+    return _QuantityEq(units, rtol, atol)
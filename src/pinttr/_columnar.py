@@ -0,0 +1,457 @@
+import csv
+import os
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pint
+
+from ._cache import convert_magnitude, format_units, parse_units
+from ._funcs import from_dict
+
+#: File suffixes read with the Arrow backend.
+_PARQUET_SUFFIXES = (".parquet", ".pq")
+_ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+
+def _to_array(values: List[str], numeric: bool) -> Any:
+    """
+    Convert a CSV column to an array. Columns with units are converted to
+    floating point numbers (empty cells become NaN); other columns are
+    converted to numbers if possible, and kept as strings otherwise.
+    """
+    import numpy as np
+
+    try:
+        return np.array([v if v else "nan" for v in values], dtype=float)
+    except ValueError:
+        if numeric:
+            raise
+        return np.array(values)
+
+
+def _iter_csv(
+    path: Union[str, os.PathLike],
+    chunk_size: int,
+    units_row: bool,
+    delimiter: str,
+) -> Iterator[tuple]:
+    """
+    Yield the column names, column units, then chunks of columns (as lists of
+    strings) of a CSV file. Blank lines are skipped.
+    """
+    with open(path, newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        try:
+            names = [name.strip() for name in next(reader)]
+        except StopIteration:
+            raise ValueError("empty CSV: no header row") from None
+        if units_row:
+            try:
+                units = [u.strip() or None for u in next(reader)]
+            except StopIteration:
+                raise ValueError("CSV file has no units row") from None
+        else:
+            units = None
+        yield names, units
+
+        while True:
+            rows = []
+            for row in reader:
+                if not row:  # Blank line
+                    continue
+                if len(row) != len(names):
+                    raise ValueError(
+                        f"line {reader.line_num}: expected {len(names)} fields, "
+                        f"got {len(row)}"
+                    )
+                rows.append(row)
+                if len(rows) == chunk_size:
+                    break
+            if not rows:
+                return
+            yield [list(column) for column in zip(*rows)]
+
+
+def _iter_arrow(path: Union[str, os.PathLike], chunk_size: int) -> Iterator[tuple]:
+    """
+    Yield the column names, column units (read from the ``units`` field
+    metadata), then chunks of columns (as NumPy arrays) of a Parquet or Arrow
+    IPC file.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("reading Parquet and Arrow files requires pyarrow") from e
+
+    if os.fspath(path).endswith(_PARQUET_SUFFIXES):
+        import pyarrow.parquet as pq
+
+        f = pq.ParquetFile(path)
+        schema = f.schema_arrow
+        batches = f.iter_batches(batch_size=chunk_size)
+    else:
+        reader = pa.ipc.open_file(path)
+        schema = reader.schema
+        batches = (
+            batch
+            for i in range(reader.num_record_batches)
+            for batch in reader.get_batch(i).to_batches(max_chunksize=chunk_size)
+        )
+
+    units = []
+    for field in schema:
+        metadata = field.metadata or {}
+        u = metadata.get(b"units")
+        units.append(u.decode("utf-8") if u else None)
+    yield list(schema.names), units
+
+    for batch in batches:
+        yield [column.to_numpy(zero_copy_only=False) for column in batch.columns]
+
+
+def iter_columns(
+    path: Union[str, os.PathLike],
+    cls: Optional[type] = None,
+    chunk_size: int = 65536,
+    units: Optional[Mapping] = None,
+    units_row: bool = True,
+    delimiter: str = ",",
+    ureg: Any = None,
+) -> Iterator[Any]:
+    """
+    Read a table in chunks of rows, as dictionaries of columns. Columns with
+    units are converted to array quantities; unit strings are interpreted once
+    per column, before reading data.
+
+    Supported formats are CSV, read with the :mod:`csv` module, and Parquet
+    (``.parquet``, ``.pq``) and Arrow IPC (``.arrow``, ``.feather``,
+    ``.ipc``) files, which require the optional pyarrow dependency. In a CSV
+    file, the row following the header holds column units (empty cells denote
+    columns without units). In Parquet and Arrow files, units are read from the
+    ``units`` metadata entry of columns.
+
+    In CSV files, columns without units are converted to floating point
+    numbers if all their values in a chunk are numeric, and kept as strings
+    otherwise. This conversion is lossy for identifiers: *e.g.* ``"007"`` is
+    read as ``7.0``.
+
+    :param path:
+        Path to the file.
+
+    :param cls:
+        If set, chunks are converted to instances of this *attrs* class with
+        :func:`.from_dict`.
+
+    :param chunk_size:
+        Maximum number of rows per chunk.
+
+    :param units:
+        Mapping of column names to units, overriding units read from the file.
+
+    :param units_row:
+        If ``False``, the CSV file has no units row: units must then be passed
+        with ``units``.
+
+    :param delimiter:
+        CSV field delimiter.
+
+    :param ureg:
+        Unit registry used to interpret unit strings. If set to ``None``,
+        Pinttrs's registered unit registry is used.
+
+    :returns:
+        An iterator over dictionaries of columns indexed by column names (or
+        over instances of ``cls``).
+
+    .. seealso:: :func:`read_columns`
+
+    .. versionadded:: 26.2.0
+    """
+    if os.fspath(path).endswith(_PARQUET_SUFFIXES + _ARROW_SUFFIXES):
+        chunks = _iter_arrow(path, chunk_size)
+    else:
+        chunks = _iter_csv(path, chunk_size, units_row, delimiter)
+
+    names, file_units = next(chunks)
+    column_units = dict(zip(names, file_units or [None] * len(names)))
+    if units is not None:
+        column_units.update(units)
+    for name, u in column_units.items():
+        if isinstance(u, str):
+            column_units[name] = parse_units(u, ureg)
+
+    for chunk in chunks:
+        columns = {}
+
+        for name, values in zip(names, chunk):
+            u = column_units[name]
+            if isinstance(values, list):
+                values = _to_array(values, numeric=u is not None)
+            columns[name] = values if u is None else u._REGISTRY.Quantity(values, u)
+
+        yield columns if cls is None else from_dict(cls, columns, ureg=ureg)
+
+
+def read_columns(
+    path: Union[str, os.PathLike],
+    cls: Optional[type] = None,
+    chunk_size: int = 65536,
+    units: Optional[Mapping] = None,
+    units_row: bool = True,
+    delimiter: str = ",",
+    ureg: Any = None,
+) -> Any:
+    """
+    Read a table as a dictionary of columns, with one array quantity per
+    column with units. The file is read in chunks with :func:`iter_columns`,
+    which are concatenated once.
+
+    Parameters are those of :func:`iter_columns`. If ``cls`` is set, a single
+    instance holding whole columns is returned.
+
+    .. rubric:: Example
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "telemetry.csv")
+    >>> with open(path, "w") as f:
+    ...     _ = f.write("t,altitude,status\\ns,km,\\n0,1.5,ok\\n1,1.6,ok\\n")
+    >>> columns = pinttrs.read_columns(path)
+    >>> columns["t"], columns["altitude"]
+    (<Quantity([0. 1.], 'second')>, <Quantity([1.5 1.6], 'kilometer')>)
+    >>> columns["status"]
+    array(['ok', 'ok'], dtype='<U2')
+    >>> @attrs.define
+    ... class Track:
+    ...     t = pinttrs.field(units=ureg.s)
+    ...     altitude = pinttrs.field(units=ureg.m)
+    ...     status = attrs.field()
+    >>> pinttrs.read_columns(path, cls=Track).altitude
+    <Quantity([1500. 1600.], 'meter')>
+
+    .. versionadded:: 26.2.0
+    """
+    import numpy as np
+
+    chunks: Dict[str, List[Any]] = {}
+
+    for columns in iter_columns(
+        path,
+        chunk_size=chunk_size,
+        units=units,
+        units_row=units_row,
+        delimiter=delimiter,
+        ureg=ureg,
+    ):
+        for name, values in columns.items():
+            chunks.setdefault(name, []).append(values)
+
+    result = {}
+    for name, values in chunks.items():
+        if len(values) == 1:
+            result[name] = values[0]
+        elif hasattr(values[0], "units"):
+            q = values[0]
+            magnitude = np.concatenate([v.magnitude for v in values])
+            result[name] = q._REGISTRY.Quantity(magnitude, q.units)
+        else:
+            result[name] = np.concatenate(values)
+
+    return result if cls is None else from_dict(cls, result, ureg=ureg)
+
+
+def _interpret_column(
+    name: str, values: List[Any], units: List[Optional[str]]
+) -> Tuple[Any, Optional[Tuple[Any, Tuple[Optional[str], ...]]]]:
+    """
+    Convert the values of a record field to an array. Units are not parsed:
+    if the field has units, magnitudes are returned with an array of codes
+    indexing the distinct unit strings, in order of first appearance.
+    Quantities are split into their magnitude and unit string.
+    """
+    import numpy as np
+
+    if any(isinstance(v, pint.Quantity) for v in values):
+        values = list(values)
+        units = list(units)
+        for i, v in enumerate(values):
+            if isinstance(v, pint.Quantity):
+                values[i] = v.magnitude
+                units[i] = format_units(v.units)
+
+    if all(u is None for u in units):
+        return np.array(values), None
+
+    codes = {}
+    indices = np.fromiter(
+        (codes.setdefault(u, len(codes)) for u in units),
+        dtype=np.intp,
+        count=len(units),
+    )
+    magnitudes = np.array([np.nan if v is None else v for v in values], dtype=float)
+
+    if None in codes and not np.isnan(magnitudes[indices == codes[None]]).all():
+        raise ValueError(f"missing units for field '{name}'")
+
+    return magnitudes, (indices, tuple(codes))
+
+
+def _interpret_chunk(records: List[Mapping]) -> Dict[str, Tuple[Any, Optional[str]]]:
+    """
+    Split a chunk of records into columns (see :func:`_interpret_column`).
+    Return a dictionary of ``(array, units)`` pairs, which pickle compactly.
+    """
+    names = {}
+    for record in records:
+        names.update(dict.fromkeys(record))
+    for name in list(names):
+        if name.endswith("_units") and name[:-6] in names:
+            del names[name]
+
+    return {
+        name: _interpret_column(
+            name,
+            [record.get(name) for record in records],
+            [record.get(f"{name}_units") for record in records],
+        )
+        for name in names
+    }
+
+
+def _merge_column(
+    name: str,
+    parts: List[Optional[Tuple[Any, Any]]],
+    sizes: List[int],
+    ureg: Any,
+) -> Any:
+    """
+    Concatenate the parts of a column split by :func:`_interpret_chunk`
+    (``None`` if the field is absent from a chunk), converting magnitudes to
+    the first units which appear in the column, interpreted with ``ureg``.
+    Magnitudes sharing units are converted with one vectorized operation.
+    """
+    import numpy as np
+
+    units = next(
+        (
+            u
+            for part in parts
+            if part is not None and part[1] is not None
+            for u in part[1][1]
+            if u is not None
+        ),
+        None,
+    )
+
+    if units is None:
+        arrays = [
+            np.full(size, None, dtype=object) if part is None else part[0]
+            for size, part in zip(sizes, parts)
+        ]
+        return arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+
+    target = parse_units(units, ureg)
+    arrays = []
+    for size, part in zip(sizes, parts):
+        if part is None or part[1] is None:
+            # Fields without units in a whole chunk must be missing
+            magnitudes = np.full(size, np.nan)
+            if part is not None and any(v is not None for v in part[0]):
+                raise ValueError(f"missing units for field '{name}'")
+        else:
+            magnitudes, (indices, strings) = part
+            for code, u in enumerate(strings):
+                if u is None or u == units:
+                    continue
+                mask = indices == code
+                magnitudes[mask] = convert_magnitude(
+                    magnitudes[mask], parse_units(u, ureg), target
+                )
+        arrays.append(magnitudes)
+
+    column = arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+    return target._REGISTRY.Quantity(column, target)
+
+
+def interpret_records(
+    records: Iterable[Mapping],
+    cls: Optional[type] = None,
+    chunk_size: int = 65536,
+    max_workers: Optional[int] = None,
+    ureg: Any = None,
+) -> Any:
+    """
+    Interpret units in a batch of records and return them as columns, with
+    one array quantity per field with units.
+
+    Records follow the conventions of :func:`.interpret_units`: a field ``x``
+    holds a number and its units are given by the ``x_units`` entry; a field
+    may also hold a scalar quantity, interpreted in its own units. Records are
+    split in chunks turned into arrays in parallel by a process pool; each
+    worker returns its columns as arrays with unit strings, which are
+    concatenated in record order. Magnitudes are converted to the units of the
+    first record which specifies some. Missing magnitudes are stored as NaN.
+
+    Workers do not parse units: unit strings are interpreted in the current
+    process, with ``ureg``, whatever the start method of the pool. Batches
+    fitting in a single chunk, or interpreted with ``max_workers=1``, are
+    processed in the current process.
+
+    :param records:
+        Records to interpret.
+
+    :param cls:
+        If set, columns are converted to an instance of this *attrs* class
+        with :func:`.from_dict`.
+
+    :param chunk_size:
+        Number of records interpreted per task.
+
+    :param max_workers:
+        Maximum number of worker processes. If ``None``, the number of CPUs is
+        used.
+
+    :param ureg:
+        Unit registry used to interpret unit strings. If set to ``None``,
+        Pinttrs's registered unit registry is used.
+
+    :returns:
+        A dictionary of columns (array quantities for fields with units, NumPy
+        arrays for other fields) indexed by field names, or an instance of
+        ``cls``.
+
+    :raises ValueError:
+        If a record holds a magnitude without units for a field with units.
+
+    .. rubric:: Example
+
+    >>> records = [{"x": 1.0, "x_units": "km"}, {"x": 500.0, "x_units": "m"}]
+    >>> pinttrs.interpret_records(records)
+    {'x': <Quantity([1.  0.5], 'kilometer')>}
+
+    .. versionadded:: 26.2.0
+    """
+    if not isinstance(records, Sequence):
+        records = list(records)
+    if not records:
+        return {} if cls is None else from_dict(cls, {}, ureg=ureg)
+
+    chunks = [records[i : i + chunk_size] for i in range(0, len(records), chunk_size)]
+
+    if len(chunks) == 1 or max_workers == 1:
+        results = [_interpret_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers) as executor:
+            results = list(executor.map(_interpret_chunk, chunks))
+
+    names = {}
+    for result in results:
+        names.update(dict.fromkeys(result))
+
+    sizes = [len(chunk) for chunk in chunks]
+    columns = {
+        name: _merge_column(name, [result.get(name) for result in results], sizes, ureg)
+        for name in names
+    }
+
+    return columns if cls is None else from_dict(cls, columns, ureg=ureg)
@@ -1,12 +1,12 @@
-from contextlib import ExitStack, contextmanager
-from typing import Callable, Dict, Hashable, Optional, Union
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, Optional, Tuple, Union
 
 import attrs
 import pint
 
 from ._defaults import get_unit_registry
 from ._func import identity
-from ._generator import UnitGenerator
+from ._generator import _GENERATIONS, _OVERRIDE_GENERATION, UnitGenerator, _override
 
 
 @attrs.define
@@ -40,6 +40,11 @@ class UnitContext:
         * **key_converter** (Callable) –
           Converter used for keys. Defaults to :func:`.identity`.
 
+    Contexts can be shared by threads, including on free-threaded Python
+    builds: overrides only apply to the thread (or asyncio task) which sets
+    them (see :meth:`UnitGenerator.override`), and lookups never observe
+    partially registered entries.
+
     .. versionchanged:: 1.1.0
        Added ``ureg``.
     """
@@ -48,6 +53,9 @@ class UnitContext:
     interpret_str: bool = attrs.field(default=False)
     ureg: Optional[pint.UnitRegistry] = attrs.field(default=None)
     key_converter: Callable = attrs.field(default=identity)
+    _generation: int = attrs.field(
+        factory=lambda: next(_GENERATIONS), init=False, repr=False, eq=False
+    )
 
     def __attrs_post_init__(self):
         # Convert keys when relevant
@@ -79,8 +87,13 @@ class UnitContext:
             Key to the value to which conversion is to be applied.
         """
         key = self.key_converter(key)
-        value = self.registry[key]
+        self.registry[key] = self._to_generator(key, self.registry[key])
 
+    def _to_generator(self, key, value) -> UnitGenerator:
+        """
+        Convert a value to a :class:`UnitGenerator` (see
+        :meth:`_convert_value`).
+        """
         # Interpret units specified as string if necessary
         if isinstance(value, str):
             if self.interpret_str:
@@ -92,11 +105,10 @@ class UnitContext:
             else:
                 raise TypeError("String-to-units interpretation is disabled")
 
-        # Proceed with actual registration
         if isinstance(value, pint.Unit):
-            self.registry[key] = UnitGenerator(value)
+            return UnitGenerator(value)
         elif isinstance(value, UnitGenerator):
-            self.registry[key] = value
+            return value
         else:
             raise TypeError(
                 f"Items must be either str, pint.Unit or UnitGenerator; "
@@ -124,9 +136,27 @@ class UnitContext:
         :param value:
             Object to register.
         """
-        self.registry[key] = value
-        self._convert_key(key)
-        self._convert_value(key)
+        # Convert first, then assign once: concurrent lookups never observe
+        # unconverted entries
+        key = self.key_converter(key)
+        self.registry[key] = self._to_generator(key, value)
+        self._generation = next(_GENERATIONS)
+
+    @property
+    def generation(self) -> Tuple[int, int]:
+        """
+        An opaque, hashable token identifying the state of this context. It
+        changes whenever an entry is registered, and whenever a unit override
+        scope (of any :class:`UnitGenerator`) is entered or left in the current
+        thread or task. Results derived from the units of this context can be
+        cached using this token as a key (see :func:`.memoize`).
+
+        .. note:: Direct modifications of ``registry`` and of the ``units``
+           attribute of unit generators are not tracked.
+
+        .. versionadded:: 26.2.0
+        """
+        return self._generation, _OVERRIDE_GENERATION.get()
 
     def update(self, d: Dict) -> None:
         """
@@ -164,7 +194,8 @@ class UnitContext:
         :returns:
             Evaluated units as a dictionary.
         """
-        return {key: self.get(key) for key in self.registry.keys()}
+        # Iterate over a copy: entries may be registered by other threads
+        return {key: generator() for key, generator in list(self.registry.items())}
 
     def deferred(self, key: Hashable) -> UnitGenerator:
         """
@@ -201,24 +232,19 @@ class UnitContext:
            * or the ``key_converter`` must provide the conversion protocol for
              string-valued keys.
         """
-        with ExitStack() as stack:
-            for arg in args:
-                if not isinstance(arg, dict):
-                    raise TypeError
-                for key, value in arg.items():
-                    stack.enter_context(
-                        self.registry[self.key_converter(key)].override(value)
-                    )
-
-            for key, value in kwargs.items():
-                stack.enter_context(
-                    self.registry[self.key_converter(key)].override(value)
-                )
-
-            try:
-                yield
-            finally:
-                pass
+        pairs = []
+        for arg in args:
+            if not isinstance(arg, dict):
+                raise TypeError
+            for key, value in arg.items():
+                pairs.append((self.registry[self.key_converter(key)], value))
+
+        for key, value in kwargs.items():
+            pairs.append((self.registry[self.key_converter(key)], value))
+
+        # All generators are overridden at once
+        with _override(pairs):
+            yield
 
     def __getitem__(self, key: Hashable) -> pint.Unit:
         """
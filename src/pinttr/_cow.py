@@ -0,0 +1,147 @@
+import copy
+import functools
+from typing import Any, Dict, Optional
+
+import attrs
+import pint
+
+from ._schema import fields_with_units
+
+try:
+    import numpy as np
+
+    from ._shared import _owns, own, share
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def _shareable(value: Any) -> bool:
+    return (
+        np is not None
+        and isinstance(value, pint.Quantity)
+        and isinstance(value._magnitude, np.ndarray)
+    )
+
+
+def _copy(inst: Any, memo: Optional[Dict]) -> Any:
+    """
+    Copy ``inst``, sharing the array magnitudes of its unit fields. Other
+    values are deep-copied if ``memo`` is set.
+    """
+    cls = inst.__class__
+    names = fields_with_units(cls).names
+    new = cls.__new__(cls)
+    if memo is not None:
+        memo[id(inst)] = new
+
+    for attribute in attrs.fields(cls):
+        try:
+            value = getattr(inst, attribute.name)
+        except AttributeError:  # Unset attribute
+            continue
+        if attribute.name in names and _shareable(value):
+            if not _owns(value):
+                # Assigned after initialization, or not wrapped by __init__()
+                value = own(value)
+                object.__setattr__(inst, attribute.name, value)
+            value = share(value)
+        elif memo is not None:
+            value = copy.deepcopy(value, memo)
+        object.__setattr__(new, attribute.name, value)
+
+    # Instance attributes of dict classes which are not fields
+    extra = getattr(inst, "__dict__", None)
+    if extra:
+        for key, value in extra.items():
+            if key not in new.__dict__:
+                new.__dict__[key] = (
+                    copy.deepcopy(value, memo) if memo is not None else value
+                )
+
+    return new
+
+
+def copy_on_write(cls: type) -> type:
+    """
+    Make the array magnitudes of the unit fields of an *attrs* class
+    copy-on-write.
+
+    Copies of instances, made by :func:`copy.copy`, :func:`copy.deepcopy`,
+    :func:`attrs.evolve` or :func:`.evolve`, share the magnitude buffers of
+    array quantities instead of duplicating them. Array magnitudes of unit
+    fields are always read-only views, including before any copy is made:
+    the first write to a field's array (item assignment or in-place operator
+    on the quantity or its magnitude) replaces the magnitude of this field
+    only with a private copy, if the buffer is still shared, or makes it
+    writable otherwise; other copies are unaffected. Other fields are copied as usual
+    (:func:`copy.copy` shares them, :func:`copy.deepcopy` copies them).
+
+    Array quantities passed to the constructor are wrapped in new quantities
+    sharing their buffer; the passed quantities are left unchanged. Quantities
+    assigned after initialization are stored as is and replaced by such
+    wrappers upon the first copy.
+
+    This decorator must be applied to a class already processed by *attrs*
+    (*i.e.* placed above :func:`attrs.define`). Subclasses inherit the
+    behaviour for all their unit fields; since *attrs* generates their
+    initializer, their fields are wrapped upon the first copy.
+
+    .. warning::
+       Only writes through instances are tracked. Writing directly to an array
+       passed to the constructor affects all instances sharing it. Writes with
+       functions other than ufuncs (*e.g.* :func:`numpy.copyto`), and through
+       views derived from a magnitude (*e.g.* slices), raise
+       :class:`ValueError` until a tracked write has made the magnitude
+       writable, whether or not the buffer was ever shared; assign a new
+       quantity to the field instead. References to a magnitude obtained
+       before a write keep showing the shared data.
+
+    :param cls:
+        Decorated class.
+
+    :returns:
+        The decorated class.
+
+    :raises TypeError:
+        If ``cls`` is not an *attrs* class.
+
+    .. rubric:: Example
+
+    >>> import copy
+    >>> @pinttrs.copy_on_write
+    ... @attrs.define
+    ... class Snapshot:
+    ...     radiance = pinttrs.field(units=ureg.W / ureg.m**2)
+    >>> a = Snapshot(np.zeros(3))
+    >>> b = copy.deepcopy(a)
+    >>> np.shares_memory(a.radiance.magnitude, b.radiance.magnitude)
+    True
+    >>> b.radiance[0] = 1.0 * ureg.W / ureg.m**2
+    >>> a.radiance.magnitude, b.radiance.magnitude
+    (array([0., 0., 0.]), array([1., 0., 0.]))
+
+    .. versionadded:: 26.2.0
+    """
+    if not attrs.has(cls):
+        raise TypeError(f"copy_on_write() must decorate an attrs class, got {cls!r}")
+
+    init = cls.__init__
+
+    @functools.wraps(init)
+    def __init__(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        for name in fields_with_units(type(self)).names:
+            value = getattr(self, name, None)
+            if _shareable(value):
+                object.__setattr__(self, name, own(value))
+
+    def __copy__(self):
+        return _copy(self, None)
+
+    def __deepcopy__(self, memo):
+        return _copy(self, memo)
+
+    cls.__init__ = __init__
+    cls.__copy__ = __copy__
+    cls.__deepcopy__ = __deepcopy__
+    return cls
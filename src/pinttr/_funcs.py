@@ -0,0 +1,600 @@
+import copy
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import attrs
+import pint
+
+from . import _instrument
+from ._cache import (
+    base_units,
+    conversion_factor,
+    convert_magnitude,
+    format_units,
+    parse_units,
+    same_units,
+    units_compatible,
+)
+from ._context import UnitContext
+from ._lazy import LazyQuantity
+from ._schema import UnitField, _has_array_spec, _init_name, fields_with_units
+from ._trusted import UnitConverter, UnitValidator, _prepared
+from .converters import _coerce_magnitude, _split_mapping
+from .exceptions import UnitsError
+
+#: Name of the class attribute in which structuring plans are cached.
+_PLAN_ATTR = "__pinttr_plan__"
+
+
+def _construct(
+    cls: type, kwargs: Dict[str, Any], fresh: Iterable[attrs.Attribute]
+) -> Any:
+    """
+    Instantiate ``cls`` with the unit converters and validators installed by
+    :func:`pinttr.attrib` skipped for the values passed to unit fields, except
+    for the ``fresh`` attributes, which are converted and validated. Objects
+    created during initialization (*e.g.* by default factories) are converted
+    and validated as usual.
+    """
+    fresh = list(fresh)
+
+    for attribute in fresh:
+        if isinstance(attribute.converter, UnitConverter):
+            init_name = _init_name(attribute)
+            kwargs[init_name] = attribute.converter(kwargs[init_name])
+
+    # Values of unit fields are passed through, except for objects created
+    # during initialization
+    prepared = []
+    for attribute in attrs.fields(cls):
+        init_name = _init_name(attribute)
+        if init_name not in kwargs:
+            continue
+        for hook in (attribute.converter, attribute.validator):
+            if isinstance(hook, (UnitConverter, UnitValidator)):
+                prepared.append((hook, kwargs[init_name]))
+
+    with _prepared(prepared):
+        inst = cls(**kwargs)
+
+    if not attrs.validators.get_disabled():
+        for attribute in fresh:
+            if isinstance(attribute.validator, UnitValidator):
+                attribute.validator(inst, attribute, getattr(inst, attribute.name))
+
+    return inst
+
+
+def evolve(inst: Any, **changes: Any) -> Any:
+    """
+    Create a new instance, based on ``inst`` with ``changes`` applied.
+
+    This function behaves like :func:`attrs.evolve`, except that the unit
+    converters and validators installed by :func:`pinttrs.field` only run for
+    changed fields. Unchanged fields are copied directly, without
+    re-conversion or re-validation. Other converters and validators, as well
+    as ``__attrs_post_init__()``, run as usual.
+
+    :param inst:
+        Instance of a class with attributes.
+
+    :param changes:
+        Keyword changes in the new copy.
+
+    :returns:
+        A copy of ``inst`` with ``changes`` incorporated.
+
+    :raises TypeError:
+        If an attribute name in ``changes`` cannot be passed to ``__init__()``.
+
+    .. rubric:: Example
+
+    >>> @attrs.define
+    ... class State:
+    ...     x = pinttrs.field(units=ureg.m)
+    ...     t = pinttrs.field(units=ureg.s)
+    >>> pinttrs.evolve(State(1.0, 0.0), t=10.0)
+    State(x=1.0 m, t=10.0 s)
+
+    .. versionadded:: 26.2.0
+    """
+    cls = inst.__class__
+    kwargs = {}
+    fresh = []
+
+    for attribute in attrs.fields(cls):
+        if not attribute.init:
+            continue
+
+        init_name = _init_name(attribute)
+
+        if init_name in changes:
+            kwargs[init_name] = changes.pop(init_name)
+            fresh.append(attribute)
+        else:
+            kwargs[init_name] = getattr(inst, attribute.name)
+
+    # Leftover changes are forwarded to __init__(), which will raise
+    kwargs.update(changes)
+
+    return _construct(cls, kwargs, fresh)
+
+
+@attrs.frozen
+class _PlanEntry:
+    """
+    Structuring instructions for a single attribute.
+    """
+
+    attribute: attrs.Attribute
+    name: str
+    init_name: str
+    unit_field: Optional[UnitField]
+    nested: Optional[type]
+
+
+def _plan(cls: type) -> Tuple[_PlanEntry, ...]:
+    """
+    Return the (un)structuring plan of ``cls``, compiled upon first request and
+    cached on the class.
+    """
+    try:
+        return cls.__dict__[_PLAN_ATTR]
+    except KeyError:
+        pass
+
+    schema = fields_with_units(cls)
+    plan = tuple(
+        _PlanEntry(
+            attribute=attribute,
+            name=attribute.name,
+            init_name=_init_name(attribute),
+            unit_field=schema.get(attribute.name),
+            nested=(
+                attribute.type
+                if isinstance(attribute.type, type) and attrs.has(attribute.type)
+                else None
+            ),
+        )
+        for attribute in attrs.fields(cls)
+    )
+    setattr(cls, _PLAN_ATTR, plan)
+    return plan
+
+
+def _unstructure_value(value: Any) -> Any:
+    if isinstance(value, (pint.Quantity, LazyQuantity)):
+        # Lazy quantities are loaded
+        return {"value": value.magnitude, "units": format_units(value.units)}
+    if attrs.has(value.__class__):
+        return unstructure(value)
+    if type(value) in (list, tuple):
+        return value.__class__(_unstructure_value(x) for x in value)
+    if type(value) in (set, frozenset):
+        # Unstructured elements may not be hashable
+        return [_unstructure_value(x) for x in value]
+    if type(value) is dict:
+        return {k: _unstructure_value(v) for k, v in value.items()}
+    return value
+
+
+def _structure_value(value: Any) -> Any:
+    if type(value) is dict:
+        if value.keys() == {"value", "units"}:
+            units = value["units"]
+            if not isinstance(units, pint.Unit):
+                units = parse_units(units)
+            return units._REGISTRY.Quantity(value["value"], units)
+        return {k: _structure_value(v) for k, v in value.items()}
+    if type(value) in (list, tuple):
+        return value.__class__(_structure_value(x) for x in value)
+    return value
+
+
+def unstructure(obj: Any) -> Dict[str, Any]:
+    """
+    Convert an *attrs* instance to a dictionary of primitive values.
+
+    Quantities are turned into ``{"value": magnitude, "units": units}``
+    dictionaries, which can be loaded back with :func:`structure` or
+    :func:`~pinttrs.converters.to_quantity`. Unit strings are formatted once
+    per unit. Nested *attrs* instances and quantities stored in lists, tuples,
+    sets and dictionaries are processed recursively; sets are turned into
+    lists. Magnitudes are not copied.
+
+    :param obj:
+        An *attrs* instance.
+
+    :returns:
+        A dictionary indexed by attribute names.
+
+    .. rubric:: Example
+
+    >>> @attrs.define
+    ... class Point:
+    ...     x = pinttrs.field(units=ureg.m)
+    ...     label = attrs.field(default="")
+    >>> pinttrs.unstructure(Point(1.0 * ureg.km, "a"))
+    {'x': {'value': 1.0, 'units': 'kilometer'}, 'label': 'a'}
+
+    .. versionadded:: 26.2.0
+    """
+    return {
+        entry.name: _unstructure_value(getattr(obj, entry.name))
+        for entry in _plan(obj.__class__)
+    }
+
+
+def structure(cls: type, data: Mapping) -> Any:
+    """
+    Create an instance of ``cls`` from a dictionary, such as produced by
+    :func:`unstructure`.
+
+    Unit fields accept ``{"value", "units"}`` mappings (with the key variants
+    supported by :func:`~pinttrs.converters.to_quantity`), quantities or
+    unitless values. If the incoming units are the field's declared units, the
+    value is assigned without running the field's unit converter and
+    validator again (unless the field declares an array data type, shape or
+    layout); otherwise, they run as usual. Nested *attrs* classes
+    declared as attribute types are structured recursively. In other fields,
+    ``{"value", "units"}`` dictionaries stored in lists, tuples and
+    dictionaries are turned into quantities.
+
+    :param cls:
+        An *attrs* class.
+
+    :param data:
+        A mapping indexed by attribute names or ``__init__()`` argument names.
+
+    :returns:
+        An instance of ``cls``.
+
+    .. rubric:: Example
+
+    >>> @attrs.define
+    ... class Point:
+    ...     x = pinttrs.field(units=ureg.m)
+    >>> pinttrs.structure(Point, {"x": {"value": 1.0, "units": "km"}})
+    Point(x=1.0 km)
+
+    .. versionadded:: 26.2.0
+    """
+    kwargs = {}
+    fresh = []
+
+    for entry in _plan(cls):
+        if not entry.attribute.init:
+            continue
+
+        try:
+            value = data[entry.name]
+        except KeyError:
+            try:
+                value = data[entry.init_name]
+            except KeyError:
+                continue
+
+        unit_field = entry.unit_field
+
+        if unit_field is not None:
+            if isinstance(value, Mapping):
+                magnitude, units = _split_mapping(value)
+                if not isinstance(units, pint.Unit):
+                    units = parse_units(units)
+                value = units._REGISTRY.Quantity(magnitude, units)
+
+            if _has_array_spec(unit_field) or not (
+                isinstance(value, pint.Quantity)
+                and same_units(value.units, unit_field.units())
+            ):
+                fresh.append(entry.attribute)
+
+        elif entry.nested is not None and isinstance(value, Mapping):
+            value = structure(entry.nested, value)
+
+        else:
+            value = _structure_value(value)
+
+        kwargs[entry.init_name] = value
+
+    return _construct(cls, kwargs, fresh)
+
+
+def _field_quantity(
+    unit_field: UnitField, magnitude: Any, units: Any, ureg: Any
+) -> Union[pint.Quantity, LazyQuantity]:
+    """
+    Build a quantity in the declared units of ``unit_field`` from a magnitude
+    and (possibly unset) source units, checking unit compatibility. Lazy
+    quantities are converted lazily.
+    """
+    declared = unit_field.units()
+
+    if isinstance(magnitude, LazyQuantity):
+        # Converted lazily, without reading the file
+        sources = [magnitude.units]
+        if units is not None:
+            sources.append(
+                units if isinstance(units, pint.Unit) else parse_units(units, ureg)
+            )
+        for source in sources:
+            if not units_compatible(source, declared):
+                raise UnitsError(
+                    units1=source,
+                    units2=declared,
+                    extra_msg=f": incompatible units '{source}' "
+                    f"used to set field '{unit_field.name}' "
+                    f"(allowed: '{declared}').",
+                )
+        return magnitude.to(declared)
+
+    if isinstance(magnitude, pint.Quantity):
+        if units is None:
+            units = magnitude.units
+        elif _instrument._active:
+            _instrument._converted(magnitude.units, units, magnitude.magnitude)
+        magnitude = magnitude.m_as(units)
+
+    if _has_array_spec(unit_field):
+        magnitude = _coerce_magnitude(magnitude, unit_field.dtype, unit_field.layout)
+
+    if units is None:
+        return declared._REGISTRY.Quantity(magnitude, declared)
+
+    if not isinstance(units, pint.Unit):
+        units = parse_units(units, ureg)
+
+    if not units_compatible(units, declared):
+        raise UnitsError(
+            units1=units,
+            units2=declared,
+            extra_msg=f": incompatible units '{units}' "
+            f"used to set field '{unit_field.name}' "
+            f"(allowed: '{declared}').",
+        )
+
+    return declared._REGISTRY.Quantity(
+        convert_magnitude(magnitude, units, declared), declared
+    )
+
+
+def from_dict(cls: type, record: Mapping, ureg: Any = None) -> Any:
+    """
+    Create an instance of ``cls`` from a record, interpreting units and
+    converting values to the declared field units in a single pass.
+
+    For a unit field ``x``, the following record entries are supported:
+
+    * a magnitude ``x`` with units ``x_units`` (see :func:`.interpret_units`);
+    * a mapping ``x`` with a magnitude and units (see
+      :func:`~pinttrs.converters.to_quantity`);
+    * a quantity ``x``;
+    * a unitless magnitude ``x``, interpreted in the declared units.
+
+    Values are converted to the declared units of their field with cached
+    conversion factors, and unit compatibility is checked once per field: the
+    unit converter and validator installed by :func:`pinttrs.field` are not run
+    again, unless the field declares an array data type, shape or layout.
+    Other fields are passed to ``__init__()`` unchanged.
+
+    :param cls:
+        An *attrs* class.
+
+    :param record:
+        A mapping indexed by attribute names or ``__init__()`` argument names.
+
+    :param ureg:
+        Unit registry used to interpret unit strings. If set to ``None``,
+        Pinttrs's registered unit registry is used.
+
+    :returns:
+        An instance of ``cls``.
+
+    :raises UnitsError:
+        If the units of a value are incompatible with those of its field.
+
+    .. rubric:: Example
+
+    >>> @attrs.define
+    ... class Point:
+    ...     x = pinttrs.field(units=ureg.m)
+    ...     y = pinttrs.field(units=ureg.m)
+    >>> record = {"x": 1.0, "x_units": "km", "y": {"value": 2.0, "units": "cm"}}
+    >>> pinttrs.from_dict(Point, record)
+    Point(x=1000.0 m, y=0.02 m)
+
+    .. versionadded:: 26.2.0
+    """
+    schema = fields_with_units(cls)
+    record = dict(record)
+    kwargs = {}
+    fresh = []
+
+    for key, value in record.items():
+        unit_field = schema.get(key)
+
+        if unit_field is None:
+            unit_field = schema.get(f"_{key}")  # Private attribute init name
+
+        if unit_field is None:
+            if key.endswith("_units") and key[:-6] in record:
+                continue  # Consumed by the magnitude entry
+            kwargs[key] = value
+            continue
+
+        units = record.get(f"{key}_units")
+
+        if value is not None and units is None and isinstance(value, Mapping):
+            value, units = _split_mapping(value)
+
+        if value is None:
+            kwargs[unit_field.init_name] = value
+        elif unit_field.default_converter:
+            with _instrument._labelled(cls, unit_field.name):
+                kwargs[unit_field.init_name] = _field_quantity(
+                    unit_field, value, units, ureg
+                )
+            if _has_array_spec(unit_field):
+                # Coerce the magnitude and check its shape
+                fresh.append(unit_field.attribute)
+        else:
+            # Custom converters may expect anything: run regular initialization
+            if units is not None:
+                if not isinstance(units, pint.Unit):
+                    units = parse_units(units, ureg)
+                value = units._REGISTRY.Quantity(value, units)
+            kwargs[unit_field.init_name] = value
+            fresh.append(unit_field.attribute)
+
+    return _construct(cls, kwargs, fresh)
+
+
+def _target_units(
+    unit_field: UnitField, context: Union[None, str, UnitContext]
+) -> Optional[pint.Unit]:
+    """
+    Return the units to which values of ``unit_field`` are converted by
+    :func:`convert_units`, or ``None`` if they are left unchanged.
+    """
+    declared = unit_field.units()
+
+    if context is None:
+        return declared
+
+    if isinstance(context, str):
+        return base_units(declared, context)
+
+    # Fields declared with a generator of the context follow it; others are
+    # matched by dimensionality
+    generators = context.registry.values()
+    if any(generator is unit_field.units for generator in generators):
+        return unit_field.units()
+
+    for generator in generators:
+        units = generator()
+        if units._REGISTRY is declared._REGISTRY and units_compatible(units, declared):
+            return units
+
+    return None
+
+
+def _convert_value(value: Any, target: pint.Unit) -> Any:
+    # Values without units (None, unset, or assigned bypassing converters)
+    # are left unchanged
+    units = getattr(value, "units", None)
+    if not isinstance(units, pint.Unit) or same_units(units, target):
+        return value
+    if not isinstance(value, pint.Quantity):  # E.g. LazyQuantity
+        return value.to(target)
+    return target._REGISTRY.Quantity(
+        convert_magnitude(value.magnitude, value.units, target), target
+    )
+
+
+def _convert_column(values: List[Any], target: pint.Unit) -> List[Any]:
+    """
+    Convert the values of a field across instances. Scalar quantities sharing
+    the same units are converted with a single vectorized operation.
+    """
+    first = values[0]
+
+    if isinstance(first, pint.Quantity) and all(
+        isinstance(v, pint.Quantity)
+        and isinstance(v.magnitude, (int, float))
+        and same_units(v.units, first.units)
+        for v in values
+    ):
+        factor = conversion_factor(first.units, target)
+        if factor is not None and factor != (1.0, 0.0):
+            import numpy as np
+
+            scale, offset = factor
+            magnitudes = np.fromiter(
+                (v.magnitude for v in values), dtype=float, count=len(values)
+            )
+            if _instrument._active:
+                _instrument._converted(first.units, target, magnitudes, factor)
+            magnitudes = (magnitudes * scale + offset).tolist()
+            Quantity = target._REGISTRY.Quantity
+            return [Quantity(m, target) for m in magnitudes]
+
+    return [_convert_value(value, target) for value in values]
+
+
+def convert_units(obj: Any, context: Union[None, str, UnitContext] = None) -> Any:
+    """
+    Convert all unit fields of an *attrs* instance, or of a sequence of
+    instances, to target units.
+
+    Target units are resolved once per class and call; conversion factors are
+    cached. For sequences, fields are processed column by column: scalar
+    magnitudes sharing the same units are converted with a single vectorized
+    operation. New instances are returned: converted values are assigned
+    without running converters and validators again. Values without units
+    (*e.g.* assigned in a :func:`.trusted` scope) and unset fields are left
+    unchanged.
+
+    :param obj:
+        An *attrs* instance, or an iterable of *attrs* instances.
+
+    :param context:
+        Target units specification:
+
+        * ``None``: the current declared units of each field;
+        * a unit system name (*e.g.* ``"SI"``, ``"cgs"``): the base units of
+          this system;
+        * a :class:`.UnitContext`: fields declared with a generator registered
+          in the context use its current units; other fields are converted to
+          the current units of the first entry with compatible units, or left
+          unchanged if there is none.
+
+    :returns:
+        A converted copy of ``obj``, or a list of converted copies.
+
+    .. rubric:: Example
+
+    >>> @attrs.define
+    ... class Motion:
+    ...     distance = pinttrs.field(units=ureg.km)
+    ...     speed = pinttrs.field(units=ureg.km / ureg.h)
+    >>> pinttrs.convert_units(Motion(1.0, 36.0), "SI")
+    Motion(distance=1000.0 m, speed=10.0 m/s)
+    >>> ctx = pinttrs.UnitContext({"length": ureg.mile})
+    >>> pinttrs.convert_units([Motion(1.609344, 1.0)], ctx)
+    [Motion(distance=1.0 mi, speed=1.0 km/h)]
+
+    .. versionadded:: 26.2.0
+    """
+    if attrs.has(obj.__class__):
+        return convert_units([obj], context)[0]
+
+    objs = list(obj)
+    result = [None] * len(objs)
+
+    # Group instances by class, preserving their positions
+    groups: Dict[type, List[int]] = {}
+    for i, instance in enumerate(objs):
+        groups.setdefault(instance.__class__, []).append(i)
+
+    for cls, indices in groups.items():
+        instances = [copy.copy(objs[i]) for i in indices]
+
+        for unit_field in fields_with_units(cls):
+            target = _target_units(unit_field, context)
+            if target is None:
+                continue
+
+            name = unit_field.name
+            with _instrument._labelled(cls, name):
+                values = _convert_column(
+                    [getattr(instance, name, attrs.NOTHING) for instance in instances],
+                    target,
+                )
+            for instance, value in zip(instances, values):
+                if value is not attrs.NOTHING:
+                    object.__setattr__(instance, name, value)
+
+        for i, instance in zip(indices, instances):
+            result[i] = instance
+
+    return result
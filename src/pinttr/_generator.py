@@ -1,10 +1,28 @@
+import itertools
 from contextlib import contextmanager
-from copy import copy
-from typing import Callable, Union
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, Tuple, Union
 
 import attrs
 import pint
 
+from . import _instrument
+
+#: Context-local unit overrides, as ``(generator, units)`` pairs indexed by
+#: generator ID. Mappings are never mutated: overriding sets a new mapping.
+_OVERRIDES: ContextVar[Dict[int, Tuple["UnitGenerator", Any]]] = ContextVar(
+    "pinttr_unit_overrides", default={}
+)
+
+#: Source of unique generation numbers (see :attr:`.UnitContext.generation`).
+_GENERATIONS = itertools.count(1)
+
+#: Generation of the context-local unit overrides, renewed whenever an override
+#: scope is entered (0 if no override is active).
+_OVERRIDE_GENERATION: ContextVar[int] = ContextVar(
+    "pinttr_override_generation", default=0
+)
+
 
 @attrs.define
 class UnitGenerator:
@@ -13,6 +31,13 @@ class UnitGenerator:
     Stored units can be contextually overridden using the
     :meth:`~pinttrs.UnitGenerator.override` method.
 
+    Unit generators can be shared by threads, including on free-threaded
+    Python builds: overrides only apply to the thread (or asyncio task) which
+    sets them. Consequently, the ``units`` attribute does not reflect active
+    overrides (call the generator to get the current units), and threads
+    started within an override scope do not inherit it, unless they run in a
+    copy of the current context (see :func:`contextvars.copy_context`).
+
     .. seealso:: :class:`~pinttrs.UnitContext`
 
     :Attributes / constructor arguments:
@@ -30,9 +55,20 @@ class UnitGenerator:
             is a callable (typically, another :class:`~pinttrs.UnitGenerator`),
             the result of its evaluation will be returned.
         """
-        if callable(self.units):
-            return self.units()
-        return self.units
+        if _instrument._active:
+            return _instrument._timed("resolve", None, self._resolve)
+        return self._resolve()
+
+    def _resolve(self) -> pint.Unit:
+        units = self.units
+        overrides = _OVERRIDES.get()
+        if overrides:
+            override = overrides.get(id(self))
+            if override is not None and override[0] is self:
+                units = override[1]
+        if callable(units):
+            return units()
+        return units
 
     @contextmanager
     def override(self, units: Union[pint.Unit, Callable, str]) -> None:
@@ -40,20 +76,42 @@ class UnitGenerator:
         Temporarily override the value of ``units``. The initial value of
         ``units`` is restored upon leaving context.
 
+        The override is backed by a :class:`contextvars.ContextVar`: it only
+        affects the current thread (or asyncio task), and the ``units``
+        attribute is left unchanged. Threads started within the context do not
+        see the override, unless they run in a copy of the current context
+        (see :func:`contextvars.copy_context`).
+
         :param units:
             Temporary replacement for ``units``. String values are interpreted
             based on the unit registry of currently stored units.
+
+        .. versionchanged:: 26.2.0
+           Overrides are context-local.
         """
-        units_old = copy(self.units)
+        with _override([(self, units)]):
+            yield
 
+
+@contextmanager
+def _override(
+    pairs: Iterable[Tuple[UnitGenerator, Union[pint.Unit, Callable, str]]],
+):
+    """
+    Temporarily override several unit generators, given as
+    ``(generator, units)`` pairs. The override mapping is copied once for all
+    pairs.
+    """
+    overrides = dict(_OVERRIDES.get())
+    for generator, units in pairs:
         if isinstance(units, str):  # Safeguard to convert strings
-            if callable(self.units):
-                self.units = self.units()._REGISTRY.Unit(units)
-            else:
-                self.units = self.units._REGISTRY.Unit(units)
-        else:
-            self.units = units
-        try:
-            yield
-        finally:
-            self.units = units_old
+            units = generator()._REGISTRY.Unit(units)
+        overrides[id(generator)] = (generator, units)
+
+    token = _OVERRIDES.set(overrides)
+    generation = _OVERRIDE_GENERATION.set(next(_GENERATIONS))
+    try:
+        yield
+    finally:
+        _OVERRIDE_GENERATION.reset(generation)
+        _OVERRIDES.reset(token)
@@ -0,0 +1,421 @@
+import os
+import random
+import sys
+import threading
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+import attrs
+
+#: Number of open :func:`instrument` and :func:`trace` scopes, in all threads.
+#: Instrumentation hooks only run if it is nonzero.
+_active = 0
+_active_lock = threading.Lock()
+
+#: Recorders of the :func:`instrument` and :func:`trace` scopes open in the
+#: current context.
+_RECORDERS: ContextVar[Tuple[Any, ...]] = ContextVar(
+    "pinttr_instrumentation", default=()
+)
+
+#: Class and field to which events are currently attributed.
+_LABEL: ContextVar[Optional[Tuple[str, str]]] = ContextVar(
+    "pinttr_instrumentation_label", default=None
+)
+
+#: Label of events which cannot be attributed to a field.
+_UNATTRIBUTED = ("*", "*")
+
+#: Frames from these locations are skipped when looking up call sites.
+_INTERNAL_PATHS = (
+    os.path.dirname(__file__) + os.sep,
+    os.path.dirname(attrs.__file__) + os.sep,
+    "<attrs generated",
+)
+
+
+class Instrumentation:
+    """
+    Counters and cumulative times of the operations recorded within
+    :func:`instrument` scopes. Instances are usually created by
+    :func:`instrument`.
+
+    :param callback:
+        If set, a callable invoked upon each recorded event as
+        ``callback(category, cls, field, elapsed)``, where ``cls`` and ``field``
+        are names and ``elapsed`` is a duration in seconds.
+
+    .. versionadded:: 26.2.0
+    """
+
+    __slots__ = ("callback", "_stats", "_lock")
+
+    def __init__(
+        self, callback: Optional[Callable[[str, str, str, float], Any]] = None
+    ):
+        self.callback = callback
+        self._stats: Dict[Tuple[str, str, str], List] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        count = sum(stats[0] for stats in self._stats.values())
+        return f"<Instrumentation ({count} events)>"
+
+    def _record(self, category: str, label: Tuple[str, str], elapsed: float):
+        key = (label[0], label[1], category)
+        with self._lock:
+            try:
+                stats = self._stats[key]
+            except KeyError:
+                stats = self._stats[key] = [0, 0.0]
+            stats[0] += 1
+            stats[1] += elapsed
+        if self.callback is not None:
+            self.callback(category, label[0], label[1], elapsed)
+
+    def _record_conversion(self, label, src, dst, magnitude):
+        pass
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]:
+        """
+        Return a copy of recorded statistics as nested dictionaries indexed by
+        class name, field name and event category. Leaves are dictionaries
+        with a ``"count"`` and a cumulative ``"time"`` (in seconds) entry.
+        Events which cannot be attributed to a field are listed under the
+        ``"*"`` class and field.
+        """
+        result = {}
+        with self._lock:
+            for (cls, field, category), (count, time) in self._stats.items():
+                result.setdefault(cls, {}).setdefault(field, {})[category] = {
+                    "count": count,
+                    "time": time,
+                }
+        return result
+
+    def reset(self) -> None:
+        """
+        Clear recorded statistics.
+        """
+        with self._lock:
+            self._stats.clear()
+
+
+@contextmanager
+def instrument(
+    callback: Optional[Callable[[str, str, str, float], Any]] = None,
+) -> Iterator[Instrumentation]:
+    """
+    Count and time unit conversions, validations and unit resolutions within
+    a scope.
+
+    The following event categories are recorded:
+
+    * ``"convert"``: calls to the converters installed by
+      :func:`pinttrs.field` (*i.e.* :func:`~pinttrs.converters.ensure_units`);
+    * ``"to"``: quantity conversions performed by
+      :func:`~pinttrs.converters.ensure_units`;
+    * ``"validate"``: calls to the validators installed by
+      :func:`pinttrs.field` (*e.g.*
+      :func:`~pinttrs.validators.has_compatible_units`);
+    * ``"resolve"``: evaluations of :class:`.UnitGenerator` objects;
+    * ``"parse"``: interpretations of unit strings.
+
+    Events are attributed to the class and field being converted or validated.
+    Validations are attributed to the class of the instance; conversions are
+    attributed to fields once an instance of their class has been validated
+    within an instrumented scope, to the class defining the field. Other
+    events are listed under the ``"*"`` class and field.
+
+    Recording is backed by a :class:`contextvars.ContextVar`: it only affects
+    the current thread (or asyncio task). Events are recorded by all open
+    scopes, each with its own :class:`Instrumentation` object: nested scopes
+    measure part of their enclosing scope. Outside instrumented scopes, the
+    cost of instrumentation hooks is a single global flag check.
+
+    :param callback:
+        If set, a callable invoked upon each recorded event (see
+        :class:`Instrumentation`), *e.g.* to forward events to a metrics
+        exporter.
+
+    :returns:
+        An :class:`Instrumentation` object holding statistics recorded in the
+        scope.
+
+    .. rubric:: Example
+
+    >>> @attrs.define
+    ... class Point:
+    ...     x = pinttrs.field(units=ureg.m)
+    >>> with pinttrs.instrument() as stats:
+    ...     p = Point(1.0)
+    ...     p.x = 2.0
+    >>> stats.snapshot()["Point"]["x"]["validate"]["count"]
+    2
+
+    .. versionadded:: 26.2.0
+    """
+    with _open(Instrumentation(callback)) as recorder:
+        yield recorder
+
+
+@attrs.frozen
+class ConversionRecord:
+    """
+    A conversion recorded by :func:`trace`.
+
+    :Attributes:
+
+        * **cls** (:class:`str`) – Name of the class owning the converted field
+          (``"*"`` if unknown).
+        * **field** (:class:`str`) – Name of the converted field (``"*"`` if
+          unknown).
+        * **src** (:class:`str`) – Source units.
+        * **dst** (:class:`str`) – Target units.
+        * **size** (:class:`int`) – Number of converted elements.
+        * **location** (:class:`str`) – Call site, as ``"path:line (function)"``:
+          the innermost frame outside Pinttrs and *attrs*.
+
+    .. versionadded:: 26.2.0
+    """
+
+    cls: str
+    field: str
+    src: str
+    dst: str
+    size: int
+    location: str
+
+
+class ConversionTrace:
+    """
+    Bounded buffer of the conversions recorded within :func:`trace` scopes.
+    Instances are usually created by :func:`trace`. Traces are iterable (over
+    :class:`ConversionRecord` objects, oldest first).
+
+    :param maxlen:
+        Maximum number of stored records. When the buffer is full, the oldest
+        records are discarded.
+
+    :param sample:
+        Fraction of conversions which are recorded.
+
+    :Attributes:
+
+        * **count** (:class:`int`) – Number of conversions which changed
+          magnitudes, including those which were not sampled or were
+          discarded.
+
+    .. versionadded:: 26.2.0
+    """
+
+    __slots__ = ("sample", "count", "_records", "_lock")
+
+    def __init__(self, maxlen: int = 1024, sample: float = 1.0):
+        if not 0.0 <= sample <= 1.0:
+            raise ValueError(f"sample rate must be in [0, 1], got {sample}")
+        self.sample = sample
+        self.count = 0
+        self._records: Deque[ConversionRecord] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<ConversionTrace ({len(self)} records, {self.count} conversions)>"
+
+    def __iter__(self) -> Iterator[ConversionRecord]:
+        with self._lock:
+            return iter(list(self._records))
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _record(self, category, label, elapsed):
+        pass
+
+    def _record_conversion(self, label, src, dst, magnitude):
+        with self._lock:
+            self.count += 1
+        if self.sample < 1.0 and random.random() >= self.sample:
+            return
+
+        record = ConversionRecord(
+            cls=label[0],
+            field=label[1],
+            src=str(src),
+            dst=str(dst),
+            size=int(getattr(magnitude, "size", 1)),
+            location=_call_site(),
+        )
+        with self._lock:
+            self._records.append(record)
+
+    def clear(self) -> None:
+        """
+        Discard stored records and reset the conversion count.
+        """
+        with self._lock:
+            self._records.clear()
+            self.count = 0
+
+
+@contextmanager
+def trace(maxlen: int = 1024, sample: float = 1.0) -> Iterator[ConversionTrace]:
+    """
+    Record the unit conversions which change magnitudes within a scope.
+
+    Conversions performed by :func:`~pinttrs.converters.ensure_units` (with
+    ``convert=True``), :func:`.interpret_units`, :func:`.from_dict`,
+    :func:`.structure`, :func:`.convert_units` and :class:`.LazyQuantity`
+    are recorded, unless source and target units only differ by name (the
+    conversion factor is 1). Each record holds the converted field, source
+    and target units, the number of converted elements and the call site.
+    This helps finding conversions which silently rescale (and copy) large
+    arrays, *e.g.* because a :class:`.UnitContext` override changed declared
+    units.
+
+    Like :func:`instrument`, tracing only affects the current thread (or
+    asyncio task) and costs a single global flag check when disabled. Fields
+    are identified as described in :func:`instrument`.
+
+    :param maxlen:
+        Maximum number of stored records (older records are discarded).
+
+    :param sample:
+        Fraction of conversions which are recorded, drawn at random. Call
+        sites are only looked up for sampled conversions.
+
+    :returns:
+        A :class:`ConversionTrace` holding the records.
+
+    .. rubric:: Example
+
+    >>> length = pinttrs.UnitGenerator(ureg.m)
+    >>> to_length = pinttrs.converters.ensure_units(default_units=length, convert=True)
+    >>> @attrs.define
+    ... class Track:
+    ...     x = pinttrs.field(units=length, converter=to_length)
+    >>> with pinttrs.trace() as conversions, length.override(ureg.km):
+    ...     track = Track(np.zeros(1000) * ureg.m)
+    >>> record = next(iter(conversions))
+    >>> record.src, record.dst, record.size
+    ('meter', 'kilometer', 1000)
+
+    .. versionadded:: 26.2.0
+    """
+    with _open(ConversionTrace(maxlen, sample)) as recorder:
+        yield recorder
+
+
+@contextmanager
+def _open(recorder: Any) -> Iterator[Any]:
+    """
+    Register ``recorder`` in the current context for the duration of a scope.
+    """
+    global _active
+
+    token = _RECORDERS.set(_RECORDERS.get() + (recorder,))
+    with _active_lock:
+        _active += 1
+    try:
+        yield recorder
+    finally:
+        with _active_lock:
+            _active -= 1
+        _RECORDERS.reset(token)
+
+
+def _call_site() -> str:
+    """
+    Return the location of the innermost frame outside Pinttrs and *attrs*.
+    """
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename.startswith(_INTERNAL_PATHS):
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>"
+    code = frame.f_code
+    return f"{code.co_filename}:{frame.f_lineno} ({code.co_name})"
+
+
+class _Labelled:
+    __slots__ = ("label", "token")
+
+    def __init__(self, label: Tuple[str, str]):
+        self.label = label
+        self.token = None
+
+    def __enter__(self):
+        self.token = _LABEL.set(self.label)
+
+    def __exit__(self, *exc_info):
+        _LABEL.reset(self.token)
+
+
+_UNLABELLED = nullcontext()
+
+
+def _labelled(cls: type, name: str) -> Any:
+    """
+    Return a context manager attributing events to a field of ``cls``, if
+    instrumentation is enabled.
+    """
+    if not _active:
+        return _UNLABELLED
+    return _Labelled((cls.__qualname__, name))
+
+
+def _timed(
+    category: str,
+    label: Optional[Tuple[str, str]],
+    func: Callable,
+    *args,
+) -> Any:
+    """
+    Call ``func(*args)`` and record its duration in the scopes open in the
+    current context. If ``label`` is ``None``, the event is attributed to the
+    field currently being converted or validated. Nested events are
+    attributed to ``label``.
+    """
+    recorders = _RECORDERS.get()
+    if not recorders:
+        return func(*args)
+
+    if label is None:
+        label = _LABEL.get() or _UNATTRIBUTED
+    token = _LABEL.set(label)
+    start = perf_counter()
+
+    try:
+        return func(*args)
+    finally:
+        elapsed = perf_counter() - start
+        _LABEL.reset(token)
+        for recorder in recorders:
+            recorder._record(category, label, elapsed)
+
+
+def _converted(src: Any, dst: Any, magnitude: Any, factor: Any = None) -> None:
+    """
+    Record a conversion of ``magnitude`` from ``src`` to ``dst`` units in the
+    :func:`trace` scopes open in the current context, if it changes the
+    magnitude. ``factor`` is the conversion factor, if known.
+    """
+    recorders = _RECORDERS.get()
+    if not recorders:
+        return
+
+    from ._cache import _parse_units, conversion_factor
+
+    if isinstance(dst, str):
+        dst = _parse_units(src._REGISTRY, dst)
+    if factor is None:
+        factor = conversion_factor(src, dst)
+    if factor == (1.0, 0.0):
+        return
+
+    label = _LABEL.get() or _UNATTRIBUTED
+    for recorder in recorders:
+        recorder._record_conversion(label, src, dst, magnitude)
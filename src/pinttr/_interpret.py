@@ -3,6 +3,8 @@ from typing import Any, Dict, Union
 
 import pint
 
+from . import _instrument
+from ._cache import parse_units
 from ._defaults import get_unit_registry
 
 
@@ -56,6 +58,9 @@ def interpret_units(
 
     .. versionchanged:: 1.1.0
        Support for converting quantity magnitude fields.
+
+    .. versionchanged:: 26.2.0
+       Unit strings are interpreted with a cache.
     """
     if ureg is None:
         ureg = get_unit_registry()
@@ -75,13 +80,17 @@ def interpret_units(
                 continue
 
             units = result[key]
+            if isinstance(units, str):
+                units = parse_units(units, ureg)
 
             # If magnitude value is a quantity, convert to requested units
             # (and thus check for unit compatibility)
             if isinstance(magnitude, pint.Quantity):
+                if _instrument._active:
+                    _instrument._converted(magnitude.units, units, magnitude.magnitude)
                 magnitude = magnitude.m_as(units)
 
-            result[magnitude_key] = ureg.Quantity(magnitude, result[key])
+            result[magnitude_key] = ureg.Quantity(magnitude, units)
             del result[key]
 
     return result
@@ -0,0 +1,298 @@
+import json
+import os
+import struct
+import zipfile
+from collections.abc import Mapping
+from typing import Any, Dict, Optional, Union
+
+import pint
+
+from ._cache import (
+    convert_magnitude,
+    format_units,
+    parse_units,
+    same_units,
+    units_compatible,
+)
+
+#: Suffix of unit sidecar files.
+_SIDECAR_SUFFIX = ".units.json"
+
+
+def _sidecar_path(path: Union[str, os.PathLike]) -> str:
+    return os.fspath(path) + _SIDECAR_SUFFIX
+
+
+def _read_npy_header(f) -> tuple:
+    """
+    Read the header of a ``.npy`` stream positioned at its start. Return the
+    shape, Fortran order flag and dtype.
+    """
+    import numpy as np
+
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(f)
+    return np.lib.format.read_array_header_2_0(f)
+
+
+def _load_npz_member(path: str, key: str, mmap_mode: Optional[str]) -> Any:
+    """
+    Load an array stored in an ``.npz`` archive. Uncompressed members are
+    memory-mapped in place; compressed members are read into memory.
+    """
+    import numpy as np
+
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo(f"{key}.npy")
+
+    if mmap_mode is None or info.compress_type != zipfile.ZIP_STORED:
+        with np.load(path) as npz:
+            return npz[key]
+
+    with open(path, "rb") as f:
+        # Skip the local file header, whose extra field may differ from that
+        # of the central directory
+        f.seek(info.header_offset + 26)
+        name_length, extra_length = struct.unpack("<HH", f.read(4))
+        f.seek(name_length + extra_length, os.SEEK_CUR)
+        shape, fortran_order, dtype = _read_npy_header(f)
+        offset = f.tell()
+
+    if 0 in shape:  # Empty arrays cannot be memory-mapped
+        return np.empty(shape, dtype=dtype)
+
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode=mmap_mode,
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+class LazyQuantity:
+    """
+    A quantity whose magnitude is stored in a ``.npy`` or ``.npz`` file and
+    loaded upon first access. Instances are usually created with
+    :func:`load_npy`.
+
+    Units are known without reading the file: lazy quantities pass the
+    :func:`~pinttrs.validators.has_compatible_units` validator, and
+    :func:`~pinttrs.converters.ensure_units` passes them through (or, with
+    ``convert=True``, returns a lazy quantity converted upon loading). The
+    data type and memory layout declared by a field are not applied to lazy
+    quantities, since this would read the file.
+
+    :param path:
+        Path to the ``.npy`` or ``.npz`` file.
+
+    :param units:
+        Units of the quantity.
+
+    :param key:
+        Name of the array in an ``.npz`` archive. Must be ``None`` for ``.npy``
+        files.
+
+    :param mmap_mode:
+        Memory-mapping mode (see :class:`numpy.memmap`). If ``None``, the
+        array is read into memory.
+
+    :param source_units:
+        Units in which the array is stored, if different from ``units``.
+
+    .. versionadded:: 26.2.0
+    """
+
+    __slots__ = ("path", "units", "key", "mmap_mode", "source_units", "_magnitude")
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        units: pint.Unit,
+        key: Optional[str] = None,
+        mmap_mode: Optional[str] = "r",
+        source_units: Optional[pint.Unit] = None,
+    ):
+        self.path = os.fspath(path)
+        self.units = units
+        self.key = key
+        self.mmap_mode = mmap_mode
+        self.source_units = units if source_units is None else source_units
+        self._magnitude = None
+
+    def __repr__(self) -> str:
+        location = self.path if self.key is None else f"{self.path}:{self.key}"
+        return f"<LazyQuantity({location!r}, '{format_units(self.units)}')>"
+
+    def __reduce__(self):
+        # The loaded magnitude is not pickled
+        return (
+            self.__class__,
+            (self.path, self.units, self.key, self.mmap_mode, self.source_units),
+        )
+
+    @property
+    def loaded(self) -> bool:
+        """
+        ``True`` if the magnitude has been loaded.
+        """
+        return self._magnitude is not None
+
+    def _source(self) -> Any:
+        import numpy as np
+
+        if self.key is None:
+            return np.load(self.path, mmap_mode=self.mmap_mode)
+        return _load_npz_member(self.path, self.key, self.mmap_mode)
+
+    @property
+    def magnitude(self) -> Any:
+        """
+        Magnitude, loaded upon first access and cached. If the stored units
+        are the quantity's units, this is a :class:`numpy.memmap` (unless
+        ``mmap_mode`` is ``None``); otherwise, the converted array is held in
+        memory.
+        """
+        if self._magnitude is None:
+            self._magnitude = convert_magnitude(
+                self._source(), self.source_units, self.units
+            )
+        return self._magnitude
+
+    m = magnitude
+
+    def load(self) -> pint.Quantity:
+        """
+        Return a :class:`pint.Quantity` wrapping the magnitude.
+        """
+        return self.units._REGISTRY.Quantity(self.magnitude, self.units)
+
+    def to(self, units: Union[pint.Unit, str]) -> "LazyQuantity":
+        """
+        Return a lazy quantity converted to ``units`` upon loading. The file is
+        not read.
+
+        :raises pint.DimensionalityError:
+            If ``units`` is incompatible with the quantity's units.
+        """
+        if isinstance(units, str):
+            units = parse_units(units, self.units._REGISTRY)
+
+        if same_units(units, self.units):
+            return self
+
+        # Check compatibility now rather than upon loading
+        if not units_compatible(self.units, units):
+            raise pint.DimensionalityError(self.units, units)
+
+        return LazyQuantity(
+            self.path, units, self.key, self.mmap_mode, self.source_units
+        )
+
+    def m_as(self, units: Union[pint.Unit, str]) -> Any:
+        """
+        Return the magnitude converted to ``units``.
+        """
+        return self.to(units).magnitude
+
+
+def save_npy(
+    path: Union[str, os.PathLike],
+    value: Union[pint.Quantity, Mapping],
+) -> None:
+    """
+    Save quantities to a NumPy file, with their units stored in a JSON sidecar
+    file (the path with a ``.units.json`` suffix).
+
+    :param path:
+        Path to the file.
+
+    :param value:
+        A quantity, written to an ``.npy`` file, or a mapping of quantities,
+        written to an uncompressed ``.npz`` archive (whose members can be
+        memory-mapped).
+
+    .. seealso:: :func:`load_npy`
+
+    .. versionadded:: 26.2.0
+    """
+    import numpy as np
+
+    path = os.fspath(path)
+
+    if isinstance(value, Mapping):
+        units = {key: format_units(q.units) for key, q in value.items()}
+        with open(path, "wb") as f:  # Prevent NumPy from appending a suffix
+            np.savez(f, **{key: q.magnitude for key, q in value.items()})
+    else:
+        units = format_units(value.units)
+        with open(path, "wb") as f:
+            np.save(f, value.magnitude)
+
+    with open(_sidecar_path(path), "w") as f:
+        json.dump({"units": units}, f)
+
+
+def load_npy(
+    path: Union[str, os.PathLike],
+    key: Optional[str] = None,
+    mmap_mode: Optional[str] = "r",
+    ureg: Any = None,
+) -> Union[LazyQuantity, Dict[str, LazyQuantity]]:
+    """
+    Open quantities saved by :func:`save_npy` as :class:`LazyQuantity`
+    objects. Only the unit sidecar file is read: array data is loaded upon
+    first access to the magnitude.
+
+    :param path:
+        Path to the ``.npy`` or ``.npz`` file.
+
+    :param key:
+        Name of the array to open in an ``.npz`` archive. If ``None``, all
+        arrays of the archive are opened.
+
+    :param mmap_mode:
+        Memory-mapping mode (see :class:`numpy.memmap`). If ``None``, arrays
+        are read into memory upon access.
+
+    :param ureg:
+        Unit registry used to interpret unit strings. If set to ``None``,
+        Pinttrs's registered unit registry is used.
+
+    :returns:
+        A lazy quantity, or a dictionary of lazy quantities indexed by array
+        names if ``path`` is an archive and ``key`` is ``None``.
+
+    .. rubric:: Example
+
+    >>> import os, tempfile
+    >>> @attrs.define
+    ... class Spectrum:
+    ...     w = pinttrs.field(units=ureg.nm)
+    >>> path = os.path.join(tempfile.mkdtemp(), "w.npy")
+    >>> pinttrs.save_npy(path, np.linspace(0.4, 0.7, 4) * ureg.um)
+    >>> spectrum = Spectrum(pinttrs.load_npy(path))
+    >>> spectrum.w.loaded
+    False
+    >>> spectrum.w.m_as("nm")
+    array([400., 500., 600., 700.])
+
+    .. versionadded:: 26.2.0
+    """
+    with open(_sidecar_path(path)) as f:
+        units = json.load(f)["units"]
+
+    if isinstance(units, str):
+        if key is not None:
+            raise ValueError(f"'{path}' is not an archive: 'key' must be None")
+        return LazyQuantity(path, parse_units(units, ureg), mmap_mode=mmap_mode)
+
+    if key is not None:
+        return LazyQuantity(path, parse_units(units[key], ureg), key, mmap_mode)
+
+    return {
+        key: LazyQuantity(path, parse_units(value, ureg), key, mmap_mode)
+        for key, value in units.items()
+    }
@@ -1,13 +1,16 @@
-from typing import Union
+from typing import Any, Optional, Tuple, Union
 
 import attr
 import pint
 from attr import NOTHING
 
+from ._cmp import _QuantityEq
 from ._generator import UnitGenerator
 from ._metadata import MetadataKey
+from ._repr import quantity_repr
+from ._trusted import UnitConverter, UnitValidator
 from .converters import ensure_units
-from .validators import has_compatible_units
+from .validators import has_compatible_shape, has_compatible_units
 
 
 def attrib(
@@ -26,6 +29,9 @@ def attrib(
     order=None,
     on_setattr=NOTHING,
     units: Union[None, pint.Unit, UnitGenerator] = None,
+    dtype: Any = None,
+    shape: Optional[Tuple[Optional[int], ...]] = None,
+    layout: Optional[str] = None,
 ):
     """
     Create a new attribute on a class, possibly with units. This function
@@ -33,20 +39,28 @@ def attrib(
 
     :param validator:
         If set to :class:`~attr.NOTHING` and ``units`` is not ``None``, defaults
-        to :func:`~pinttr.validators.has_compatible_units` (possibly wrapped in
-        :func:`attr.validators.optional` if ``default`` is ``None``).
-        Otherwise retains original behaviour.
+        to :func:`~pinttr.validators.has_compatible_units` (followed by
+        :func:`~pinttr.validators.has_compatible_shape` if ``shape`` is set,
+        possibly wrapped in :func:`attr.validators.optional` if ``default`` is
+        ``None``). Otherwise retains original behaviour.
 
     :param repr:
         If set to :class:`~attr.NOTHING` and ``units`` is not ``None``, defaults
-        to a callable printing quantities nicely.
+        to a callable printing quantities nicely. Large array magnitudes are
+        summarized (see :func:`~pinttr.set_repr_threshold`).
         Otherwise retains original behaviour.
 
     :param converter:
         If set to :class:`~attr.NOTHING` and ``units`` is not ``None``, defaults
         to :func:`ensure_units(default_units=units) <pinttr.converters.ensure_units>`
         (possibly wrapped in :func:`attr.converters.optional` if ``default`` is
-        ``None``). Otherwise retains original behaviour.
+        ``None``), with ``dtype`` and ``layout`` passed as ``dtype`` and
+        ``order``. Otherwise retains original behaviour.
+
+    :param eq:
+        Retains original behaviour. If a strategy created by
+        :func:`~pinttr.quantity_eq` without units is passed, comparison is
+        done in the field's units.
 
     :param on_setattr:
         If set to :class:`~attr.NOTHING` and ``units`` is not ``None``,
@@ -58,8 +72,38 @@ def attrib(
         Default units attached to the defined attribute. Accepts a
         :class:`UnitGenerator` instance. Has no effect if set to ``None``.
 
+    :param dtype:
+        Data type of array magnitudes. If set, the default converter converts
+        magnitudes to NumPy arrays of this type, without copying if they
+        already match. :class:`.LazyQuantity` values are not converted, so
+        that their file is not read. Requires ``units``.
+
+    :param shape:
+        Shape of array magnitudes, checked by the default validator. Items are
+        dimension lengths or ``None``, which matches any length. Requires
+        ``units``.
+
+    :param layout:
+        Memory layout of array magnitudes (``"C"`` or ``"F"``). If set, the
+        default converter makes magnitudes contiguous in this layout, without
+        copying if they already are. :class:`.LazyQuantity` values are not
+        converted. Requires ``units``.
+
     .. versionchanged:: 21.3.0
        Added prettier default repr.
+
+    .. versionchanged:: 26.2.0
+       Default converters and validators can be bypassed with
+       :func:`~pinttr.trusted`.
+
+    .. versionchanged:: 26.2.0
+       Added support for :func:`~pinttr.quantity_eq` comparison strategies.
+
+    .. versionchanged:: 26.2.0
+       The default repr summarizes large array magnitudes.
+
+    .. versionchanged:: 26.2.0
+       Added ``dtype``, ``shape`` and ``layout``.
     """
 
     # Initialize attr.ib arguments
@@ -79,21 +123,42 @@ def attrib(
 
         metadata[MetadataKey.UNITS] = unit_generator
 
+        # Set array magnitude specifications
+        if dtype is not None:
+            metadata[MetadataKey.DTYPE] = dtype
+        if shape is not None:
+            shape = tuple(shape)
+            metadata[MetadataKey.SHAPE] = shape
+        if layout is not None:
+            if layout not in {"C", "F"}:
+                raise ValueError("Argument 'layout' must be 'C' or 'F'")
+            metadata[MetadataKey.LAYOUT] = layout
+
         # Set field converter
         if converter is NOTHING:
+            converter = ensure_units(
+                default_units=unit_generator, dtype=dtype, order=layout
+            )
             if default is None:
-                converter = attr.converters.optional(
-                    ensure_units(default_units=unit_generator)
-                )
-            else:
-                converter = ensure_units(default_units=unit_generator)
+                converter = attr.converters.optional(converter)
+            converter = UnitConverter(converter)
 
         # Set field validator
         if validator is NOTHING:
-            if default is None:
-                validator = attr.validators.optional(has_compatible_units)
+            if shape is not None:
+                validator = attr.validators.and_(
+                    has_compatible_units, has_compatible_shape
+                )
             else:
                 validator = has_compatible_units
+            if default is None:
+                validator = attr.validators.optional(validator)
+            validator = UnitValidator(validator)
+
+        # Compare in field units if an unbound quantity comparison strategy
+        # is used
+        if isinstance(eq, _QuantityEq) and eq.units is None:
+            eq = eq.bind(unit_generator)
 
         # Ensure that unit conversion and validation is carried out upon setting
         if on_setattr is NOTHING:
@@ -101,14 +166,10 @@ def attrib(
 
         # Set field repr
         if repr is NOTHING:
+            repr = quantity_repr
 
-            def f(x):
-                if isinstance(x, pint.Quantity):
-                    return f"{x:~P}"
-                else:
-                    return x.__repr__()
-
-            repr = f
+    elif dtype is not None or shape is not None or layout is not None:
+        raise TypeError("Arguments 'dtype', 'shape' and 'layout' require 'units'")
 
     # If one of the following hasn't been set because units is unset, we set it
     # to the original default value
@@ -121,7 +182,7 @@ def attrib(
     if repr is NOTHING:
         repr = True
 
-    return attr.ib(
+    field = attr.ib(
         default=default,
         validator=validator,
         repr=repr,
@@ -137,3 +198,9 @@ def attrib(
         order=order,
         on_setattr=on_setattr,
     )
+
+    # Attribute conversions to the field from the first instance on
+    if isinstance(converter, UnitConverter):
+        converter._bind(field)
+
+    return field
@@ -0,0 +1,315 @@
+import functools
+import hashlib
+import inspect
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, Hashable, Optional, Tuple, Union
+
+import attrs
+import pint
+
+from ._cache import convert_magnitude, parse_units, same_units
+from ._context import UnitContext
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@attrs.frozen
+class CacheInfo:
+    """
+    Statistics of a function decorated with :func:`memoize`, returned by its
+    ``cache_info()`` method.
+
+    :Attributes:
+
+        * **hits** (:class:`int`) – Number of calls served from the cache.
+        * **misses** (:class:`int`) – Number of calls which ran the function.
+        * **evictions** (:class:`int`) – Number of entries discarded to honour
+          ``maxsize`` or ``maxbytes``.
+        * **expirations** (:class:`int`) – Number of entries discarded because
+          they outlived ``ttl``.
+        * **size** (:class:`int`) – Number of cached entries.
+        * **nbytes** (:class:`int`) – Estimated size of cached results, in
+          bytes.
+
+    .. versionadded:: 26.2.0
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    nbytes: int
+
+
+def _magnitude_key(magnitude: Any) -> Hashable:
+    """
+    Return a hashable key for a magnitude: scalars are keyed by value, arrays
+    by data type, shape and a digest of their buffer.
+    """
+    if np is not None and isinstance(magnitude, np.ndarray):
+        if magnitude.dtype.hasobject:
+            raise TypeError("cannot memoize arrays with object data type")
+        digest = hashlib.blake2b(
+            np.ascontiguousarray(magnitude), digest_size=16
+        ).digest()
+        return "ndarray", magnitude.dtype.str, magnitude.shape, digest
+    return magnitude
+
+
+def _value_key(value: Any) -> Hashable:
+    if isinstance(value, pint.Quantity):
+        return _magnitude_key(value.magnitude), value.units
+    return _magnitude_key(value)
+
+
+def _nbytes(value: Any) -> int:
+    """
+    Estimate the memory used by a cached result: array buffers are counted,
+    other objects are measured shallowly.
+    """
+    if isinstance(value, pint.Quantity):
+        value = value.magnitude
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_nbytes(x) for x in value)
+    nbytes = getattr(value, "nbytes", None)
+    return nbytes if isinstance(nbytes, int) else sys.getsizeof(value)
+
+
+class _Memoized:
+    """
+    Cache storage and bookkeeping of a function decorated with
+    :func:`memoize`.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        units: Mapping,
+        maxsize: Optional[int],
+        maxbytes: Optional[int],
+        ttl: Optional[float],
+        context: Optional[UnitContext],
+    ):
+        self.func = func
+        self.signature = inspect.signature(func)
+        unknown = set(units) - set(self.signature.parameters)
+        if unknown:
+            raise ValueError(
+                f"units declared for unknown parameters: {', '.join(sorted(unknown))}"
+            )
+        self.units = {
+            name: parse_units(u) if isinstance(u, str) else u
+            for name, u in units.items()
+        }
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self.context = context
+
+        # Entries are (result, nbytes, expiry) triplets, least recently used
+        # first
+        self.entries: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        self.nbytes = 0
+
+    def key(self, arguments: dict) -> Tuple[Hashable, dict]:
+        """
+        Compute the cache key of bound arguments. Arguments with declared
+        units are returned as ``(magnitude, units)`` pairs, converted to these
+        units; quantities are only created if the function is called.
+        """
+        declared = {}
+        for name, units in self.units.items():
+            value = arguments[name]
+            if value is None:
+                continue
+            if callable(units):  # E.g. a UnitGenerator
+                units = units()
+            if isinstance(value, pint.Quantity):
+                magnitude = value.magnitude
+                if not same_units(value.units, units):
+                    magnitude = convert_magnitude(magnitude, value.units, units)
+            else:
+                magnitude = value
+            declared[name] = magnitude, units
+
+        key = []
+        for name, value in arguments.items():
+            if name in declared:
+                magnitude, units = declared[name]
+                key.append((name, _magnitude_key(magnitude), units))
+                continue
+            kind = self.signature.parameters[name].kind
+            if kind is inspect.Parameter.VAR_POSITIONAL:
+                key.append((name, tuple(_value_key(x) for x in value)))
+            elif kind is inspect.Parameter.VAR_KEYWORD:
+                key.append(
+                    (name, tuple(sorted((k, _value_key(v)) for k, v in value.items())))
+                )
+            else:
+                key.append((name, _value_key(value)))
+        if self.context is not None:
+            key.append(self.context.generation)
+        return tuple(key), declared
+
+    def __call__(self, *args, **kwargs):
+        bound = self.signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key, declared = self.key(bound.arguments)
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry[2] >= time.monotonic():
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                self._discard(key)
+                self.expirations += 1
+            self.misses += 1
+
+        for name, (magnitude, units) in declared.items():
+            bound.arguments[name] = units._REGISTRY.Quantity(magnitude, units)
+
+        # Concurrent misses on the same key may compute the result twice
+        result = self.func(*bound.args, **bound.kwargs)
+        self._store(key, result)
+        return result
+
+    def _discard(self, key: Hashable) -> None:
+        self.nbytes -= self.entries.pop(key)[1]
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        nbytes = _nbytes(result)
+        if self.maxsize == 0 or (self.maxbytes is not None and nbytes > self.maxbytes):
+            return  # Would evict everything and still not fit
+        expiry = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+
+        with self.lock:
+            if key in self.entries:
+                self._discard(key)
+            self.entries[key] = (result, nbytes, expiry)
+            self.nbytes += nbytes
+
+            while (self.maxsize is not None and len(self.entries) > self.maxsize) or (
+                self.maxbytes is not None and self.nbytes > self.maxbytes
+            ):
+                self._discard(next(iter(self.entries)))
+                self.evictions += 1
+
+    def cache_info(self) -> CacheInfo:
+        with self.lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                expirations=self.expirations,
+                size=len(self.entries),
+                nbytes=self.nbytes,
+            )
+
+    def cache_clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+
+def memoize(
+    func: Optional[Callable] = None,
+    *,
+    units: Optional[Mapping[str, Union[pint.Unit, str, Callable]]] = None,
+    maxsize: Optional[int] = 128,
+    maxbytes: Optional[int] = None,
+    ttl: Optional[float] = None,
+    context: Optional[UnitContext] = None,
+) -> Callable:
+    """
+    Cache the results of a function taking quantities as arguments.
+
+    Unlike :func:`functools.lru_cache`, this decorator accepts array
+    quantities and recognizes equivalent quantities expressed in different
+    units:
+
+    * arguments with declared ``units`` are converted to them (unitless values
+      are interpreted in them) before being passed to the function, so that
+      ``1 km`` and ``1000 m`` share a cache entry;
+    * scalar magnitudes are keyed by value, arrays by data type, shape and a
+      digest of their data (arrays are not retained by the cache);
+    * if ``context`` is set, its :attr:`~.UnitContext.generation` is part of
+      the key: results computed under other unit overrides or registrations
+      are not reused.
+
+    Other arguments must be hashable. Cached results are returned as is: they
+    should not be modified in place.
+
+    The decorated function has a ``cache_info()`` method, which returns a
+    :class:`CacheInfo`, and a ``cache_clear()`` method, which discards all
+    entries and resets statistics. It is safe to call from multiple threads.
+
+    :param func:
+        Decorated function. This allows usage as ``@memoize`` without
+        arguments.
+
+    :param units:
+        Declared units of arguments, as a mapping of parameter names to
+        :class:`pint.Unit`, unit strings or callables returning units (*e.g.*
+        :class:`.UnitGenerator`, resolved upon each call).
+
+    :param maxsize:
+        Maximum number of entries. When it is exceeded, the least recently
+        used entries are discarded. If ``None``, the number of entries is
+        unbounded.
+
+    :param maxbytes:
+        If set, maximum estimated size of cached results, in bytes (array
+        results are counted by their buffer size). Least recently used entries
+        are discarded when it is exceeded; larger results are not cached.
+
+    :param ttl:
+        If set, lifetime of entries, in seconds.
+
+    :param context:
+        If set, a unit context on which results depend.
+
+    :raises ValueError:
+        If units are declared for parameters which ``func`` does not have.
+
+    .. rubric:: Example
+
+    >>> @pinttrs.memoize(units={"distance": "m", "duration": "s"})
+    ... def speed(distance, duration):
+    ...     return distance / duration
+    >>> speed(1.0 * ureg.km, 10.0 * ureg.s)
+    <Quantity(100.0, 'meter / second')>
+    >>> speed(1000.0 * ureg.m, 10.0)
+    <Quantity(100.0, 'meter / second')>
+    >>> speed.cache_info()
+    CacheInfo(hits=1, misses=1, evictions=0, expirations=0, size=1, nbytes=24)
+
+    .. versionadded:: 26.2.0
+    """
+
+    def decorator(func: Callable) -> Callable:
+        memoized = _Memoized(func, units or {}, maxsize, maxbytes, ttl, context)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return memoized(*args, **kwargs)
+
+        wrapper.cache_info = memoized.cache_info
+        wrapper.cache_clear = memoized.cache_clear
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
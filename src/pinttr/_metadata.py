@@ -11,3 +11,8 @@ class MetadataKey(enum.Enum):
 
     # Units compatible with this field (callable)
     UNITS = 0
+
+    # Array magnitude data type, shape and memory layout
+    DTYPE = 1
+    SHAPE = 2
+    LAYOUT = 3
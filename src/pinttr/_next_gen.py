@@ -2,7 +2,7 @@
 APIs in the style of attrs's next-generation APIs.
 """
 
-from typing import Union
+from typing import Any, Optional, Tuple, Union
 
 import pint
 from attr import NOTHING
@@ -26,12 +26,33 @@ def field(
     order=None,
     on_setattr=NOTHING,
     units: Union[None, pint.Unit, UnitGenerator] = None,
+    dtype: Any = None,
+    shape: Optional[Tuple[Optional[int], ...]] = None,
+    layout: Optional[str] = None,
 ):
     """
     Identical to :func:`pinttr.ib`, except keyword-only and with some arguments
     removed.
 
+    .. rubric:: Example
+
+    >>> @attrs.define
+    ... class Spectrum:
+    ...     radiance = pinttrs.field(
+    ...         units=ureg.W / ureg.m**2, dtype="float32", shape=(None, 3), layout="C"
+    ...     )
+    >>> spectrum = Spectrum([[1.0, 2.0, 3.0]])
+    >>> spectrum.radiance.magnitude.dtype
+    dtype('float32')
+    >>> Spectrum([1.0, 2.0])
+    Traceback (most recent call last):
+        ...
+    ValueError: incompatible shape (2,) used ... (allowed: (None, 3))
+
     .. versionadded:: 21.3.0
+
+    .. versionchanged:: 26.2.0
+       Added ``dtype``, ``shape`` and ``layout``.
     """
     return attrib(
         default=default,
@@ -47,4 +68,7 @@ def field(
         order=order,
         on_setattr=on_setattr,
         units=units,
+        dtype=dtype,
+        shape=shape,
+        layout=layout,
     )
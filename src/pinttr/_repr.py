@@ -0,0 +1,68 @@
+from typing import Any, Optional
+
+import pint
+
+from ._cache import format_units
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+#: Size above which array magnitudes are summarized (``None`` disables
+#: summarization).
+_repr_threshold: Optional[int] = 1000
+
+
+def set_repr_threshold(threshold: Optional[int]) -> None:
+    """
+    Set the size above which the default repr of unit fields summarizes
+    array-valued quantities.
+
+    :param threshold:
+        Total number of array elements which triggers summarization. If set to
+        ``None``, arrays are always fully printed.
+
+    .. versionadded:: 26.2.0
+    """
+    global _repr_threshold
+    if threshold is not None and threshold < 0:
+        raise ValueError("threshold must be a positive integer or None")
+    _repr_threshold = threshold
+
+
+def get_repr_threshold() -> Optional[int]:
+    """
+    Get the size above which the default repr of unit fields summarizes
+    array-valued quantities.
+
+    .. versionadded:: 26.2.0
+    """
+    return _repr_threshold
+
+
+def quantity_repr(x: Any) -> str:
+    """
+    Default repr for unit fields. Array magnitudes larger than the repr
+    threshold are summarized NumPy-style, with their shape and dtype; only the
+    leading and trailing elements are formatted.
+    """
+    if not isinstance(x, pint.Quantity):
+        return x.__repr__()
+
+    m = x.magnitude
+    threshold = _repr_threshold
+
+    if np is not None and isinstance(m, np.ndarray):
+        if threshold is None:
+            with np.printoptions(threshold=m.size + 1):
+                return f"{x:~P}"
+
+        if m.size > threshold:
+            summary = np.array2string(
+                m, threshold=threshold, max_line_width=np.inf
+            ).replace("\n", "")
+            units = format_units(x.units, "~P")
+            return f"{summary} {units} (shape={m.shape}, dtype={m.dtype})"
+
+    return f"{x:~P}"
@@ -0,0 +1,187 @@
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import attrs
+
+from ._generator import UnitGenerator
+from ._metadata import MetadataKey
+from ._trusted import UnitConverter, UnitValidator
+
+#: Name of the class attribute in which schemas are cached.
+_SCHEMA_ATTR = "__pinttr_schema__"
+
+
+def _init_name(attribute: attrs.Attribute) -> str:
+    """
+    Return the name under which ``attribute`` is passed to ``__init__()``.
+    """
+    alias = getattr(attribute, "alias", None)  # attrs >= 22.2
+    return alias if alias is not None else attribute.name.lstrip("_")
+
+
+@attrs.frozen
+class UnitField:
+    """
+    Description of a unit-enabled field, as listed by a :class:`UnitSchema`.
+
+    :Attributes:
+
+        * **name** (:class:`str`) – Attribute name.
+        * **init_name** (:class:`str`) – Name of the ``__init__()`` parameter
+          setting the attribute.
+        * **index** (:class:`int`) – Position of the attribute in
+          :func:`attrs.fields`.
+        * **units** (:class:`.UnitGenerator`) – Declared units.
+        * **optional** (:class:`bool`) – ``True`` if the field accepts ``None``.
+        * **default_converter** (:class:`bool`) – ``True`` if the field uses
+          the converter installed by :func:`pinttrs.field`.
+        * **default_validator** (:class:`bool`) – ``True`` if the field uses
+          the validator installed by :func:`pinttrs.field`.
+        * **dtype** – Declared data type of array magnitudes, or ``None``.
+        * **shape** (tuple or ``None``) – Declared shape of array magnitudes.
+        * **layout** (:class:`str` or ``None``) – Declared memory layout of
+          array magnitudes.
+        * **attribute** (:class:`attrs.Attribute`) – The attribute itself.
+
+    .. versionadded:: 26.2.0
+    """
+
+    name: str
+    init_name: str
+    index: int
+    units: UnitGenerator
+    optional: bool
+    default_converter: bool
+    default_validator: bool
+    dtype: Any
+    shape: Optional[Tuple[Optional[int], ...]]
+    layout: Optional[str]
+    attribute: attrs.Attribute = attrs.field(repr=False, eq=False)
+
+
+@attrs.frozen
+class UnitSchema:
+    """
+    Unit-enabled fields of an *attrs* class, as returned by
+    :func:`fields_with_units`. Schemas are iterable (over :class:`UnitField`
+    objects, in definition order) and can be indexed by attribute name.
+
+    :Attributes:
+
+        * **cls** (:class:`type`) – Described class.
+        * **fields** (tuple of :class:`UnitField`) – Unit-enabled fields.
+        * **names** (tuple of :class:`str`) – Names of unit-enabled fields.
+
+    .. versionadded:: 26.2.0
+    """
+
+    cls: type
+    fields: Tuple[UnitField, ...]
+    names: Tuple[str, ...] = attrs.field(init=False)
+    _by_name: Dict[str, UnitField] = attrs.field(init=False, repr=False, eq=False)
+
+    @names.default
+    def _names_default(self):
+        return tuple(field.name for field in self.fields)
+
+    @_by_name.default
+    def _by_name_default(self):
+        return {field.name: field for field in self.fields}
+
+    def __iter__(self) -> Iterator[UnitField]:
+        return iter(self.fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def __getitem__(self, name: str) -> UnitField:
+        return self._by_name[name]
+
+    def get(self, name: str) -> Optional[UnitField]:
+        """
+        Return the field named ``name``, or ``None`` if it has no units.
+        """
+        return self._by_name.get(name)
+
+
+def _has_array_spec(field: UnitField) -> bool:
+    """
+    Return ``True`` if ``field`` declares an array data type, shape or layout.
+    """
+    return not (field.dtype is None and field.shape is None and field.layout is None)
+
+
+def _build_schema(cls: type) -> UnitSchema:
+    fields = []
+
+    for index, attribute in enumerate(attrs.fields(cls)):
+        try:
+            units = attribute.metadata[MetadataKey.UNITS]
+        except KeyError:
+            continue
+
+        fields.append(
+            UnitField(
+                name=attribute.name,
+                init_name=_init_name(attribute),
+                index=index,
+                units=units,
+                optional=attribute.default is None,
+                default_converter=isinstance(attribute.converter, UnitConverter),
+                default_validator=isinstance(attribute.validator, UnitValidator),
+                dtype=attribute.metadata.get(MetadataKey.DTYPE),
+                shape=attribute.metadata.get(MetadataKey.SHAPE),
+                layout=attribute.metadata.get(MetadataKey.LAYOUT),
+                attribute=attribute,
+            )
+        )
+
+    return UnitSchema(cls=cls, fields=tuple(fields))
+
+
+def fields_with_units(cls: type) -> UnitSchema:
+    """
+    Return the schema listing the unit-enabled fields of an *attrs* class.
+
+    The schema is built upon first request and cached on the class; subsequent
+    calls are a single attribute lookup. Subclasses get their own schema.
+
+    :param cls:
+        An *attrs* class.
+
+    :returns:
+        The unit field schema of ``cls``.
+
+    :raises TypeError:
+        If ``cls`` is not a class.
+
+    :raises attrs.exceptions.NotAnAttrsClassError:
+        If ``cls`` is not an *attrs* class.
+
+    .. rubric:: Example
+
+    >>> @attrs.define
+    ... class Point:
+    ...     x = pinttrs.field(units=ureg.m)
+    ...     label = attrs.field(default="")
+    ...     t = pinttrs.field(default=None, units=ureg.s)
+    >>> schema = pinttrs.fields_with_units(Point)
+    >>> schema.names
+    ('x', 't')
+    >>> schema["t"].index, schema["t"].optional
+    (2, True)
+
+    .. versionadded:: 26.2.0
+    """
+    try:
+        return cls.__dict__[_SCHEMA_ATTR]
+    except KeyError:
+        pass
+    except AttributeError:
+        raise TypeError("Passed object must be a class.")
+
+    schema = _build_schema(cls)
+    setattr(cls, _SCHEMA_ATTR, schema)
+    return schema
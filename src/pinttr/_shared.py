@@ -0,0 +1,182 @@
+"""
+Read-only array views sharing a buffer, made private upon write (see
+:func:`pinttr.copy_on_write`).
+"""
+
+import threading
+import weakref
+from typing import Any, Dict
+
+import numpy as np
+import pint
+
+#: Guards the sharing of magnitudes.
+_share_lock = threading.Lock()
+
+
+class _Block:
+    """
+    Views sharing a buffer. Views are only tracked while they are alive.
+    """
+
+    __slots__ = ("views", "lock", "__weakref__")
+
+    def __init__(self):
+        # Arrays are unhashable: views are indexed by ID
+        self.views: Dict[int, weakref.ref] = {}
+        # Reentrant: views may be collected (and untracked) while it is held
+        self.lock = threading.RLock()
+
+    def add(self, view: np.ndarray) -> None:
+        key = id(view)
+        block = weakref.ref(self)
+
+        def remove(_):
+            self = block()
+            if self is not None:
+                with self.lock:
+                    self.views.pop(key, None)
+
+        with self.lock:
+            self.views[key] = weakref.ref(view, remove)
+
+    def detach(self, view: np.ndarray) -> bool:
+        """
+        Stop tracking ``view`` and return ``True`` if other views share the
+        buffer.
+        """
+        with self.lock:
+            self.views.pop(id(view), None)
+            return any(ref() is not None for ref in self.views.values())
+
+
+def _plain(x: Any) -> Any:
+    return x.view(np.ndarray) if isinstance(x, SharedArray) else x
+
+
+def _target(x: Any) -> Any:
+    return x._writable() if isinstance(x, SharedArray) else x
+
+
+class SharedArray(np.ndarray):
+    """
+    Read-only view of a buffer shared by several quantities.
+
+    Each view is the magnitude of a single quantity, its owner. Item
+    assignment and ufuncs writing to the view (*e.g.* in-place operators of
+    the owner) first replace the owner's magnitude with a private copy if the
+    buffer is still shared, or make the view writable otherwise. Views
+    derived from a shared array (slices, reshapes) are read-only.
+    """
+
+    def __array_finalize__(self, obj):
+        self._owner = None
+        block = getattr(obj, "_block", None)
+        if block is not None and np.may_share_memory(self, obj):
+            self._block = block
+            block.add(self)
+        else:
+            self._block = None
+
+    def __repr__(self) -> str:
+        return repr(self.view(np.ndarray))
+
+    def __reduce__(self):
+        # Pickled as a regular array
+        return np.array(self).__reduce__()
+
+    def __copy__(self) -> np.ndarray:
+        return np.array(self)
+
+    def __deepcopy__(self, memo) -> np.ndarray:
+        return np.array(self)
+
+    def __setitem__(self, key, value) -> None:
+        self._writable()[key] = value
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method == "at":  # Writes to the first operand
+            inputs = (_target(inputs[0]),) + inputs[1:]
+        inputs = tuple(_plain(x) for x in inputs)
+        out = kwargs.get("out")
+        if out:
+            kwargs["out"] = tuple(_target(x) for x in out)
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def _writable(self) -> np.ndarray:
+        """
+        Return an array to which writes to this view are applied, making the
+        owner's magnitude private if necessary.
+        """
+        block = self._block
+        owner = self._owner() if self._owner is not None else None
+        if block is None or owner is None:
+            # Unshared, or derived from a shared array: writes are applied to
+            # the view itself (and fail if it is read-only)
+            return self.view(np.ndarray)
+
+        current = owner._magnitude
+        if current is not self:  # Already made private
+            return current
+
+        shared = block.detach(self)
+        self._block = None
+
+        if not shared:
+            try:
+                self.flags.writeable = True
+                return self.view(np.ndarray)
+            except ValueError:  # The underlying buffer is read-only
+                pass
+
+        private = np.array(self.view(np.ndarray), order="K")
+        owner._magnitude = private
+        return private
+
+
+def _view(data: np.ndarray, block: _Block) -> SharedArray:
+    view = data.view(SharedArray)
+    view.flags.writeable = False
+    view._block = block
+    block.add(view)
+    return view
+
+
+def _owns(quantity: pint.Quantity) -> bool:
+    magnitude = quantity._magnitude
+    return (
+        isinstance(magnitude, SharedArray)
+        and magnitude._block is not None
+        and magnitude._owner is not None
+        and magnitude._owner() is quantity
+    )
+
+
+def own(quantity: pint.Quantity) -> pint.Quantity:
+    """
+    Return a new quantity owning a read-only view of the array magnitude of
+    ``quantity``, made private upon write. ``quantity`` is left unchanged.
+    """
+    magnitude = quantity._magnitude
+    # Views of a shared buffer join its block
+    block = getattr(magnitude, "_block", None) or _Block()
+    view = _view(_plain(magnitude), block)
+    owned = quantity.__class__(view, quantity._units)
+    view._owner = weakref.ref(owned)
+    return owned
+
+
+def share(quantity: pint.Quantity) -> pint.Quantity:
+    """
+    Return a new quantity sharing the array magnitude of ``quantity``, which
+    must own its magnitude (see :func:`own`). Both magnitudes are read-only
+    views, made private upon write.
+    """
+    with _share_lock:
+        if not _owns(quantity):
+            raise ValueError("quantity does not own its magnitude")
+        block = quantity._magnitude._block
+        view = _view(quantity._magnitude.view(np.ndarray), block)
+    shared = quantity.__class__(view, quantity._units)
+    view._owner = weakref.ref(shared)
+    return shared
@@ -0,0 +1,197 @@
+import os
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import attrs
+
+from . import _instrument
+
+#: Directory of this package, whose frames are skipped by
+#: :meth:`UnitConverter._bind`.
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+#: Context-local flag raised by :func:`trusted`.
+_TRUSTED: ContextVar[bool] = ContextVar("pinttr_trusted", default=False)
+
+#: Values passed through by unit converters and validators, indexed by the ID
+#: of the converter or validator (see :func:`_prepared`).
+_PREPARED: ContextVar[Optional[Dict[int, Tuple[Any, Any]]]] = ContextVar(
+    "pinttr_prepared", default=None
+)
+
+
+@contextmanager
+def trusted():
+    """
+    Skip the unit converters and validators installed by :func:`pinttrs.field`
+    within a scope.
+
+    Inside this context, fields created with :func:`pinttrs.field` (or
+    :func:`pinttr.attrib`) store assigned values as is: their default
+    :func:`~pinttrs.converters.ensure_units` converter and
+    :func:`~pinttrs.validators.has_compatible_units` validator are bypassed.
+    Converters and validators explicitly passed by the user still run.
+
+    The switch is backed by a :class:`contextvars.ContextVar`: it only affects
+    the current thread (or asyncio task), other threads remain fully validated.
+
+    .. warning::
+       Values assigned within this context are trusted to be quantities with
+       compatible units. Unitless values are *not* wrapped.
+
+    .. rubric:: Example
+
+    >>> @attrs.define
+    ... class Point:
+    ...     x = pinttrs.field(units=ureg.m)
+    >>> p = Point(1.0)
+    >>> with pinttrs.trusted():
+    ...     p.x = 2.0 * ureg.km
+    >>> p
+    Point(x=2.0 km)
+
+    .. versionadded:: 26.2.0
+    """
+    token = _TRUSTED.set(True)
+    try:
+        yield
+    finally:
+        _TRUSTED.reset(token)
+
+
+@contextmanager
+def _prepared(entries: Iterable[Tuple[Any, Any]]):
+    """
+    Within this scope, skip each of the given unit converters and validators
+    when it is called with the value it is paired with (already converted and
+    validated). Other calls, *e.g.* for objects created by default factories,
+    are processed as usual.
+    """
+    # Hooks are kept alive by the mapping: their IDs cannot be reused
+    token = _PREPARED.set({id(hook): (hook, value) for hook, value in entries})
+    try:
+        yield
+    finally:
+        _PREPARED.reset(token)
+
+
+def _is_prepared(hook: Any, value: Any) -> bool:
+    prepared = _PREPARED.get()
+    if prepared is None:
+        return False
+    entry = prepared.get(id(hook))
+    return entry is not None and entry[1] is value
+
+
+def is_trusted() -> bool:
+    """
+    Return ``True`` if called from within a :func:`trusted` scope.
+
+    .. versionadded:: 26.2.0
+    """
+    return _TRUSTED.get()
+
+
+class UnitConverter:
+    """
+    Wrapper marking a converter as installed by :func:`pinttr.attrib`. The
+    wrapped converter is skipped within a :func:`trusted` scope.
+
+    ``label`` holds the class and field names to which conversions are
+    attributed by :func:`.instrument`. It is bound by :func:`pinttr.attrib`
+    to the class body declaring the field (see :meth:`_bind`), or otherwise
+    set by :class:`UnitValidator`.
+    """
+
+    __slots__ = ("converter", "label", "_origin")
+
+    def __init__(self, converter: Callable[[Any], Any]):
+        self.converter = converter
+        self.label: Optional[Tuple[str, str]] = None
+        self._origin: Optional[Tuple[Dict[str, Any], Any]] = None
+
+    def __call__(self, value):
+        if _TRUSTED.get() or _is_prepared(self, value):
+            return value
+        if _instrument._active:
+            if self._origin is not None:
+                self._resolve_label()
+            return _instrument._timed("convert", self.label, self.converter, value)
+        return self.converter(value)
+
+    def _bind(self, field: Any) -> None:
+        """
+        Record the class body namespace in which ``field`` (the object
+        returned by :func:`attrs.field` for this converter) is declared. The
+        label is resolved from it upon first instrumented conversion, since
+        the field name is only known once the class body has run. Fields not
+        declared in a class body are labelled by :class:`UnitValidator`.
+        """
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+            frame = frame.f_back
+        if frame is not None:
+            namespace = frame.f_locals
+            if "__qualname__" in namespace and "__module__" in namespace:
+                self._origin = (namespace, field)
+
+    def _resolve_label(self) -> None:
+        namespace, field = self._origin
+        self._origin = None
+        if self.label is not None:
+            return
+        for name, value in namespace.items():
+            if value is field:
+                self.label = (namespace["__qualname__"], name)
+                return
+
+    def __repr__(self):
+        return f"<pinttr unit converter {self.converter!r}>"
+
+
+class UnitValidator:
+    """
+    Wrapper marking a validator as installed by :func:`pinttr.attrib`. The
+    wrapped validator is skipped within a :func:`trusted` scope.
+    """
+
+    __slots__ = ("validator",)
+
+    def __init__(self, validator: Callable[[Any, Any, Any], Any]):
+        self.validator = validator
+
+    def __call__(self, instance, attribute, value):
+        if _TRUSTED.get() or _is_prepared(self, value):
+            return
+        if _instrument._active:
+            label = (type(instance).__qualname__, attribute.name)
+            converter = attribute.converter
+            if isinstance(converter, UnitConverter) and converter.label is None:
+                converter.label = _owner_label(type(instance), attribute)
+            _instrument._timed(
+                "validate", label, self.validator, instance, attribute, value
+            )
+            return
+        self.validator(instance, attribute, value)
+
+    def __repr__(self):
+        return f"<pinttr unit validator {self.validator!r}>"
+
+
+def _owner_label(cls: type, attribute) -> Tuple[str, str]:
+    """
+    Return the names of the class defining ``attribute`` (``cls`` or one of
+    its bases) and of the attribute.
+    """
+    if getattr(attribute, "inherited", False):
+        for base in cls.__mro__[1:]:
+            if not attrs.has(base):
+                continue
+            base_attribute = getattr(attrs.fields(base), attribute.name, None)
+            if base_attribute is not None and not base_attribute.inherited:
+                cls = base
+                break
+
+    return cls.__qualname__, attribute.name
@@ -1,12 +1,15 @@
 from collections.abc import Mapping
 from functools import partial
-from typing import Any, Callable, Union
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
 
 import attrs
 import pint
 
+from . import _chunked, _instrument
+from ._cache import convert_magnitude, format_units, parse_units
 from ._defaults import get_unit_registry
 from ._generator import UnitGenerator
+from ._lazy import LazyQuantity
 
 
 def to_units(units: Union[pint.Unit, UnitGenerator]) -> Callable[[Any], pint.Quantity]:
@@ -29,6 +32,8 @@ def ensure_units(
     *,
     default_units: Union[pint.Unit, Callable],
     convert: bool = False,
+    dtype: Any = None,
+    order: Optional[str] = None,
 ) -> Any:
     """
     Ensure that a value is wrapped in a Pint quantity container.
@@ -50,7 +55,20 @@ def ensure_units(
 
     :param convert:
         If ``True``, ``maybe_value`` will also be converted to ``default_units``
-        if it is a :class:`pint.Quantity`.
+        if it is a :class:`pint.Quantity`. A :class:`~pinttrs.LazyQuantity`
+        is converted lazily, without loading its magnitude.
+
+    :param dtype:
+        If set, the magnitude is converted to a NumPy array with this data
+        type. No copy is made if the magnitude already matches.
+
+    :param order:
+        If set (``"C"`` or ``"F"``), the magnitude is converted to a NumPy
+        array with this memory layout. No copy is made if the magnitude
+        already matches.
+
+        :class:`~pinttrs.LazyQuantity` objects are passed through unchanged
+        by ``dtype`` and ``order``, so that their file is not read.
 
     :returns:
         Converted ``maybe_value`` if specified; otherwise, a converter function.
@@ -100,13 +118,25 @@ def ensure_units(
     .. versionchanged:: 26.1.0
        The first argument is now optional, which allows both deferred and
        immediate executions.
+
+    .. versionchanged:: 26.2.0
+       :class:`~pinttrs.LazyQuantity` objects are passed through.
+
+    .. versionchanged:: 26.2.0
+       Added ``dtype`` and ``order``.
     """
 
     if maybe_value is attrs.NOTHING:
         if not isinstance(default_units, (pint.Unit, UnitGenerator)):
             raise TypeError("Argument 'units' must be a pint.Units or a UnitGenerator")
 
-        return partial(ensure_units, default_units=default_units, convert=convert)
+        return partial(
+            ensure_units,
+            default_units=default_units,
+            convert=convert,
+            dtype=dtype,
+            order=order,
+        )
 
     value = maybe_value
 
@@ -118,13 +148,79 @@ def ensure_units(
     if not isinstance(units, pint.Unit):
         raise TypeError("Argument 'units' must be a pint.Units or a UnitGenerator")
 
+    coerce = dtype is not None or order is not None
+
+    if isinstance(value, LazyQuantity):
+        return value.to(units) if convert else value
+
     if isinstance(value, pint.Quantity):
         if convert:
-            return value.to(units)
-        else:
-            return value
+            if _chunked._is_large(value.magnitude):
+                value = units._REGISTRY.Quantity(
+                    convert_magnitude(value.magnitude, value.units, units), units
+                )
+            elif _instrument._active:
+                converted = _instrument._timed("to", None, value.to, units)
+                _instrument._converted(value.units, units, value.magnitude)
+                value = converted
+            else:
+                value = value.to(units)
+        if coerce:
+            magnitude = value.magnitude
+            coerced = _coerce_magnitude(magnitude, dtype, order)
+            if coerced is not magnitude:
+                value = value._REGISTRY.Quantity(coerced, value.units)
+        return value
+
+    if coerce:
+        return units._REGISTRY.Quantity(_coerce_magnitude(value, dtype, order), units)
+
+    return value * units
+
+
+def _coerce_magnitude(magnitude: Any, dtype: Any, order: Optional[str]) -> Any:
+    """
+    Convert a magnitude to a NumPy array with the requested data type and
+    memory layout, without copying if it already matches. Array subclasses
+    (*e.g.* shared copy-on-write views) are preserved.
+    """
+    import numpy as np
+
+    return np.asanyarray(magnitude, dtype=dtype, order=order)
+
+
+def _split_mapping(value: Mapping) -> Tuple[Any, Any]:
+    """
+    Extract the magnitude and units from a mapping, as specified by
+    :func:`to_quantity`.
+
+    :raises ValueError:
+        If a magnitude or unit key is missing, or if unhandled keys are
+        supplied.
+    """
+    value = dict(value)
+    for k_m in ["value", "magnitude", "m"]:
+        try:
+            magnitude = value.pop(k_m)
+        except KeyError:
+            continue
+        break
+    else:
+        raise ValueError("Supplied value has no magnitude")
+
+    for k_u in ["units", "unit", "u"]:
+        try:
+            units = value.pop(k_u)
+        except KeyError:
+            continue
+        break
     else:
-        return value * units
+        raise ValueError("Supplied value has no units")
+
+    if len(value) > 0:
+        raise ValueError(f"Supplied value has extra unused keys {list(value.keys())}")
+
+    return magnitude, units
 
 
 def to_quantity(value: Any) -> Any:
@@ -141,10 +237,11 @@ def to_quantity(value: Any) -> Any:
       must be supplied as the ``value``, ``magnitude`` or ``m`` keys (resp.
       ``units``, ``unit`` or ``u``).
     * :class:`xarray.DataArray`: the magnitude is the underlying data array
-      (converted to a NumPy array) and units are read from the ``units``
-      attribute. If the ``units`` attribute is missing, the DataArray is
-      returned unchanged. If the xarray dependency is not installed, conversion
-      is skipped.
+      (:attr:`~xarray.DataArray.data`) and units are read from the ``units``
+      attribute. The data is neither copied nor computed: a Dask-backed
+      DataArray yields a quantity wrapping the lazy Dask array. If the
+      ``units`` attribute is missing, the DataArray is returned unchanged. If
+      the xarray dependency is not installed, conversion is skipped.
 
     .. warning::
        * This converter uses the global unit registry from
@@ -196,6 +293,9 @@ def to_quantity(value: Any) -> Any:
 
     .. versionadded:: 26.1.0
        When converting dictionaries, units can be specified using the ``unit`` field.
+
+    .. versionchanged:: 26.2.0
+       DataArray data is no longer converted to a NumPy array.
     """
 
     ureg = get_unit_registry()
@@ -206,8 +306,9 @@ def to_quantity(value: Any) -> Any:
 
         if isinstance(value, xr.DataArray):
             if hasattr(value, "attrs") and "units" in value.attrs:
-                magnitude = value.values
-                units = value.attrs["units"]
+                # Wrap the backing (possibly lazy) array without loading it
+                magnitude = value.data
+                units = parse_units(value.attrs["units"], ureg)
                 value = ureg.Quantity(magnitude, units)
             return value
     except ImportError:
@@ -215,30 +316,92 @@ def to_quantity(value: Any) -> Any:
 
     # Handle mappings (dict-like objects)
     if isinstance(value, Mapping):
-        value = dict(value)
-        for k_m in ["value", "magnitude", "m"]:
-            try:
-                magnitude = value.pop(k_m)
-            except KeyError:
-                continue
-            break
-        else:
-            raise ValueError("Supplied value has no magnitude")
-
-        for k_u in ["units", "unit", "u"]:
-            try:
-                units = value.pop(k_u)
-            except KeyError:
-                continue
-            break
-        else:
-            raise ValueError("Supplied value has no units")
-
-        if len(value) > 0:
-            raise ValueError(
-                f"Supplied value has extra unused keys {list(value.keys())}"
-            )
-
+        magnitude, units = _split_mapping(value)
+        if isinstance(units, str):
+            units = parse_units(units, ureg)
         value = ureg.Quantity(magnitude, units)
 
     return value
+
+
+def to_quantities(dataset: Any, coords: bool = False) -> Dict[Hashable, Any]:
+    """
+    Convert the variables of an :class:`xarray.Dataset` to Pint quantities
+    with :func:`to_quantity`. Unit strings are interpreted once per distinct
+    string, and the data of variables is neither copied nor computed.
+
+    :param dataset:
+        Dataset to convert.
+
+    :param coords:
+        If ``True``, coordinate variables are also converted.
+
+    :returns:
+        A dictionary indexed by variable names. Variables with a ``units``
+        attribute are converted to quantities; other variables are returned
+        as DataArrays.
+
+    .. rubric:: Example
+
+    >>> ds = xr.Dataset(
+    ...     {"t": ("x", [280.0, 290.0], {"units": "K"}), "flag": ("x", [0, 1])},
+    ...     coords={"x": ("x", [0.0, 1.0], {"units": "km"})},
+    ... )
+    >>> quantities = to_quantities(ds)
+    >>> quantities["t"]
+    <Quantity([280. 290.], 'kelvin')>
+    >>> quantities["flag"]
+    <xarray.DataArray 'flag' (x: 2)>...
+    >>> to_quantities(ds, coords=True)["x"]
+    <Quantity([0. 1.], 'kilometer')>
+
+    .. versionadded:: 26.2.0
+    """
+    variables = dict(dataset.data_vars)
+    if coords:
+        variables.update(dataset.coords)
+
+    return {name: to_quantity(variable) for name, variable in variables.items()}
+
+
+def to_dataarray(
+    quantity: pint.Quantity,
+    dims: Any = None,
+    coords: Any = None,
+    name: Optional[Hashable] = None,
+    attrs: Optional[Mapping] = None,
+) -> Any:
+    """
+    Convert a Pint quantity to an :class:`xarray.DataArray` with a ``units``
+    attribute, the inverse of :func:`to_quantity`. The magnitude is wrapped
+    without copying.
+
+    :param quantity:
+        Quantity to convert.
+
+    :param dims, coords, name:
+        Passed to the :class:`~xarray.DataArray` constructor.
+
+    :param attrs:
+        Additional attributes.
+
+    :returns:
+        A DataArray wrapping the magnitude of ``quantity``.
+
+    .. rubric:: Example
+
+    >>> to_dataarray(np.array([1.0, 2.0]) * ureg.km, dims="x")
+    <xarray.DataArray (x: 2)>...
+    array([1., 2.])
+    Dimensions without coordinates: x
+    Attributes:
+        units:    kilometer
+
+    .. versionadded:: 26.2.0
+    """
+    import xarray as xr
+
+    attrs = {**(attrs or {}), "units": format_units(quantity.units)}
+    return xr.DataArray(
+        quantity.magnitude, dims=dims, coords=coords, name=name, attrs=attrs
+    )
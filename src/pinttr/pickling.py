@@ -0,0 +1,337 @@
+"""
+Compact pickling of quantities, units, unit generators and unit contexts.
+
+By default, Pint quantities are pickled with their unit containers and are
+rebuilt against the application registry. The reducers defined in this module
+instead pickle units as interned strings, resolved upon unpickling against the
+default Pinttrs registry (see :func:`pinttrs.get_unit_registry`) with a parse
+cache. Unit generators keep their identity: a generator pickled several times
+is unpickled as a single object in a given process, and a generator sent back
+to its original process resolves to the original object. The default unit
+registry, *e.g.* referenced by a :class:`.UnitContext`, is pickled by
+reference.
+
+Large array magnitudes can optionally be transferred through
+:mod:`multiprocessing.shared_memory` instead of being serialized.
+"""
+
+import io
+import pickle
+import sys
+import uuid
+import weakref
+from multiprocessing.reduction import ForkingPickler
+from typing import Any, Dict, List, Optional
+
+import pint
+
+from ._cache import format_units, parse_units
+from ._defaults import get_unit_registry
+from ._generator import UnitGenerator
+
+__all__ = [
+    "Pickler",
+    "dumps",
+    "loads",
+    "register",
+    "release_shared_memory",
+    "unregister",
+]
+
+#: Size (in bytes) above which array magnitudes are transferred through shared
+#: memory by reducers registered with :func:`register`.
+_shared_memory_threshold: Optional[int] = None
+
+#: Shared memory blocks created by this process.
+_created: List[Any] = []
+
+#: Shared memory blocks attached by this process, indexed by name.
+_attached: Dict[str, Any] = {}
+
+#: Generator tokens, indexed by generator ID.
+_tokens: Dict[int, str] = {}
+
+#: Generators, indexed by token.
+_generators: "weakref.WeakValueDictionary[str, UnitGenerator]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+# ------------------------------------------------------------------------------
+#                                 Rebuilders
+# ------------------------------------------------------------------------------
+
+
+def _rebuild_unit(units: str) -> pint.Unit:
+    return parse_units(units)
+
+
+def _rebuild_quantity(magnitude: Any, units: str) -> pint.Quantity:
+    units = parse_units(units)
+    return units._REGISTRY.Quantity(magnitude, units)
+
+
+def _rebuild_shared_quantity(
+    name: str, shape: tuple, dtype: str, units: str
+) -> pint.Quantity:
+    import numpy as np
+
+    try:
+        shm = _attached[name]
+    except KeyError:
+        shm = _attach(name)
+        _attached[name] = shm
+
+    magnitude = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    return _rebuild_quantity(magnitude, units)
+
+
+def _rebuild_generator(token: str, units: Any) -> UnitGenerator:
+    try:
+        return _generators[token]
+    except KeyError:
+        pass
+
+    generator = UnitGenerator(units)
+    _register_token(generator, token)
+    return generator
+
+
+def _rebuild_registry() -> pint.UnitRegistry:
+    return get_unit_registry()
+
+
+def _attach(name: str):
+    from multiprocessing import shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    # Prevent the resource tracker from unlinking the block when this process
+    # exits: it is owned by the creating process
+    from multiprocessing import resource_tracker
+
+    shm = shared_memory.SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _register_token(generator: UnitGenerator, token: str) -> None:
+    key = id(generator)
+    _tokens[key] = token
+    _generators[token] = generator
+    weakref.finalize(generator, _tokens.pop, key, None)
+
+
+# ------------------------------------------------------------------------------
+#                                  Reducers
+# ------------------------------------------------------------------------------
+
+
+def _reduce_unit(units: pint.Unit):
+    return _rebuild_unit, (sys.intern(format_units(units)),)
+
+
+def _reduce_quantity(quantity: pint.Quantity, threshold: Optional[int] = None):
+    units = sys.intern(format_units(quantity.units))
+    magnitude = quantity.magnitude
+
+    if threshold is not None and getattr(magnitude, "nbytes", -1) >= threshold:
+        from multiprocessing import shared_memory
+
+        import numpy as np
+
+        if not magnitude.dtype.hasobject and magnitude.nbytes > 0:
+            shm = shared_memory.SharedMemory(create=True, size=magnitude.nbytes)
+            np.ndarray(magnitude.shape, dtype=magnitude.dtype, buffer=shm.buf)[...] = (
+                magnitude
+            )
+            _created.append(shm)
+            return _rebuild_shared_quantity, (
+                shm.name,
+                magnitude.shape,
+                magnitude.dtype.str,
+                units,
+            )
+
+    return _rebuild_quantity, (magnitude, units)
+
+
+def _reduce_quantity_shared(quantity: pint.Quantity):
+    return _reduce_quantity(quantity, _shared_memory_threshold)
+
+
+def _reduce_registry(ureg: pint.UnitRegistry):
+    # Only the default registry can be resolved in other processes
+    if ureg is get_unit_registry():
+        return _rebuild_registry, ()
+    return NotImplemented
+
+
+def _reduce_generator(generator: UnitGenerator):
+    try:
+        token = _tokens[id(generator)]
+    except KeyError:
+        token = uuid.uuid4().hex
+        _register_token(generator, token)
+
+    return _rebuild_generator, (token, generator.units)
+
+
+class Pickler(pickle.Pickler):
+    """
+    A :class:`pickle.Pickler` using the compact reducers of this module.
+
+    :param file:
+        Binary file object to write to.
+
+    :param protocol:
+        Pickle protocol (defaults to :data:`pickle.HIGHEST_PROTOCOL`).
+
+    :param shared_memory_threshold:
+        Size (in bytes) above which array magnitudes are copied to a
+        :class:`~multiprocessing.shared_memory.SharedMemory` block instead of
+        being serialized. Blocks are owned by the pickling process and must be
+        released with :func:`release_shared_memory` once unpickled. If
+        ``None``, shared memory is not used.
+    """
+
+    def __init__(
+        self,
+        file,
+        protocol: Optional[int] = pickle.HIGHEST_PROTOCOL,
+        shared_memory_threshold: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(file, protocol, **kwargs)
+        self.shared_memory_threshold = shared_memory_threshold
+
+    def reducer_override(self, obj):
+        # Quantity and Unit types are specific to each registry
+        if isinstance(obj, pint.Quantity):
+            return _reduce_quantity(obj, self.shared_memory_threshold)
+        if isinstance(obj, pint.Unit):
+            return _reduce_unit(obj)
+        if isinstance(obj, UnitGenerator):
+            return _reduce_generator(obj)
+        if isinstance(obj, (pint.UnitRegistry, pint.ApplicationRegistry)):
+            return _reduce_registry(obj)
+        return NotImplemented
+
+
+def dumps(
+    obj: Any,
+    protocol: Optional[int] = pickle.HIGHEST_PROTOCOL,
+    shared_memory_threshold: Optional[int] = None,
+) -> bytes:
+    """
+    Pickle ``obj`` using the compact reducers of this module.
+
+    :param obj:
+        Object to pickle.
+
+    :param protocol:
+        Pickle protocol.
+
+    :param shared_memory_threshold:
+        See :class:`Pickler`.
+
+    :returns:
+        Pickled data, which can be loaded with :func:`pickle.loads`.
+
+    .. rubric:: Example
+
+    >>> from pinttrs import pickling
+    >>> import pickle
+    >>> pickle.loads(pickling.dumps(1.0 * ureg.km))
+    <Quantity(1.0, 'kilometer')>
+    """
+    f = io.BytesIO()
+    Pickler(f, protocol, shared_memory_threshold=shared_memory_threshold).dump(obj)
+    return f.getvalue()
+
+
+def loads(data: bytes) -> Any:
+    """
+    Unpickle data produced by :func:`dumps`. Equivalent to
+    :func:`pickle.loads`.
+    """
+    return pickle.loads(data)
+
+
+def register(shared_memory_threshold: Optional[int] = None) -> None:
+    """
+    Register the compact reducers of this module with
+    :class:`multiprocessing.reduction.ForkingPickler`, which serializes data
+    exchanged with :mod:`multiprocessing` and :mod:`concurrent.futures`
+    process pools.
+
+    Reducers are registered for the quantity and unit types of the current
+    default registry. To also use them for results sent back by workers, call
+    this function in workers, *e.g.* as a process pool initializer:
+
+    .. code:: python
+
+       with ProcessPoolExecutor(initializer=pinttrs.pickling.register) as pool:
+           ...
+
+    :param shared_memory_threshold:
+        See :class:`Pickler`.
+    """
+    global _shared_memory_threshold
+    _shared_memory_threshold = shared_memory_threshold
+
+    ureg = get_unit_registry()
+    quantity_types = {pint.Quantity, type(ureg.Quantity(1.0, ""))}
+    unit_types = {pint.Unit, type(ureg.Unit(""))}
+
+    for cls in quantity_types:
+        ForkingPickler.register(cls, _reduce_quantity_shared)
+    for cls in unit_types:
+        ForkingPickler.register(cls, _reduce_unit)
+    ForkingPickler.register(UnitGenerator, _reduce_generator)
+    ForkingPickler.register(type(ureg), _reduce_registry)
+
+
+def unregister() -> None:
+    """
+    Remove reducers registered by :func:`register`.
+    """
+    global _shared_memory_threshold
+    _shared_memory_threshold = None
+
+    reducers = (
+        _reduce_quantity_shared,
+        _reduce_unit,
+        _reduce_generator,
+        _reduce_registry,
+    )
+    for cls, reducer in list(ForkingPickler._extra_reducers.items()):
+        if reducer in reducers:
+            del ForkingPickler._extra_reducers[cls]
+
+
+def release_shared_memory() -> None:
+    """
+    Release shared memory blocks used by this process to transfer large
+    magnitudes.
+
+    * Blocks created when pickling are unlinked: arrays unpickled from them
+      must no longer be used by other processes. This should be called by the
+      sending process once its workers are done, *e.g.* after collecting
+      results.
+    * Blocks attached when unpickling are closed, unless arrays referencing
+      them are still alive. Workers may call this function at the start or
+      the end of each task.
+    """
+    while _created:
+        shm = _created.pop()
+        shm.close()
+        shm.unlink()
+
+    for name, shm in list(_attached.items()):
+        try:
+            shm.close()
+        except BufferError:  # Still referenced by an array
+            continue
+        del _attached[name]
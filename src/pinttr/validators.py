@@ -1,3 +1,8 @@
+from typing import Any, Dict, Optional, Tuple
+
+import pint
+
+from ._cache import convert_magnitude
 from ._metadata import MetadataKey
 from .exceptions import UnitsError
 from .util import units_compatible
@@ -28,6 +33,14 @@ def has_compatible_units(instance, attribute, value):
         If units are incompatible or if a unitless value is provided.
     """
 
+    _check_units(attribute, value)
+
+
+def _check_units(attribute, value) -> pint.Unit:
+    """
+    Check that ``value`` has units compatible with those declared for
+    ``attribute`` and return the declared units.
+    """
     compatible_units = attribute.metadata[MetadataKey.UNITS]()
 
     try:
@@ -48,3 +61,244 @@ def has_compatible_units(instance, attribute, value):
             f"used to set field '{attribute.name}' "
             f"(requires units '{compatible_units}').",
         )
+
+    return compatible_units
+
+
+def has_compatible_shape(instance, attribute, value):
+    """
+    Validate if the magnitude of ``value`` has the shape declared for
+    ``attribute``.
+
+    The declared shape is a tuple whose items are either dimension lengths or
+    ``None``, which matches any length. Fields without a declared shape are
+    not checked.
+
+    Only works with unit-enabled fields created with :func:`pinttrs.field` or
+    :func:`pinttr.attrib` with the ``shape`` argument.
+
+    :param instance:
+        The class instance being validated.
+
+    :param attribute:
+        The attrs attribute being validated.
+
+    :param value:
+        The value to validate (should be a Pint quantity).
+
+    :raises ValueError:
+        If the shape of the magnitude of ``value`` does not match the declared
+        shape.
+
+    .. versionadded:: 26.2.0
+    """
+    shape = attribute.metadata.get(MetadataKey.SHAPE)
+    if shape is None:
+        return
+
+    actual = getattr(getattr(value, "magnitude", value), "shape", ())
+
+    if len(actual) != len(shape) or any(
+        expected is not None and expected != length
+        for expected, length in zip(shape, actual)
+    ):
+        raise ValueError(
+            f"incompatible shape {actual} used to set field '{attribute.name}' "
+            f"(allowed: {shape})"
+        )
+
+
+def _describe_failure(value, magnitude, ok) -> str:
+    """
+    Describe the first element of ``value`` for which the Boolean array ``ok``
+    is ``False``, for error messages.
+    """
+    import numpy as np
+
+    if ok.ndim == 0:
+        return f"value {magnitude} {value.units:~P}"
+
+    index = tuple(int(i) for i in np.unravel_index(np.argmin(ok), ok.shape))
+    position = index[0] if len(index) == 1 else index
+    return f"value {magnitude[index]} {value.units:~P} at index {position}"
+
+
+class _InRange:
+    """
+    Range validator created by :func:`in_range`. Bounds converted to the units
+    of validated values are cached.
+    """
+
+    __slots__ = ("min", "max", "min_inclusive", "max_inclusive", "_bounds")
+
+    def __init__(self, min, max, min_inclusive, max_inclusive):
+        self.min = min
+        self.max = max
+        self.min_inclusive = min_inclusive
+        self.max_inclusive = max_inclusive
+        self._bounds: Dict[Tuple, Tuple[Optional[Any], Optional[Any]]] = {}
+
+    def __repr__(self):
+        lower = "[" if self.min_inclusive else "("
+        upper = "]" if self.max_inclusive else ")"
+        return f"<in_range validator {lower}{self.min}, {self.max}{upper}>"
+
+    def _convert_bound(self, bound, declared: pint.Unit, units: pint.Unit):
+        if bound is None:
+            return None
+        if isinstance(bound, pint.Quantity):
+            return convert_magnitude(bound.magnitude, bound.units, units)
+        return convert_magnitude(bound, declared, units)
+
+    def bounds(self, declared: pint.Unit, units: pint.Unit) -> Tuple:
+        """
+        Return the bound magnitudes in ``units``; unitless bounds are
+        interpreted in ``declared`` units.
+        """
+        key = (units._REGISTRY, declared._units, units._units)
+        try:
+            return self._bounds[key]
+        except KeyError:
+            pass
+
+        bounds = (
+            self._convert_bound(self.min, declared, units),
+            self._convert_bound(self.max, declared, units),
+        )
+        self._bounds[key] = bounds
+        return bounds
+
+    def __call__(self, instance, attribute, value):
+        import numpy as np
+
+        declared = _check_units(attribute, value)
+        lower, upper = self.bounds(declared, value.units)
+        magnitude = np.asarray(value.magnitude)
+
+        ok = None
+        if lower is not None:
+            ok = magnitude >= lower if self.min_inclusive else magnitude > lower
+        if upper is not None:
+            ok_upper = magnitude <= upper if self.max_inclusive else magnitude < upper
+            ok = ok_upper if ok is None else ok & ok_upper
+
+        if ok is None or ok.all():
+            return
+
+        lower_str = "[" if self.min_inclusive else "("
+        upper_str = "]" if self.max_inclusive else ")"
+        raise ValueError(
+            f"{_describe_failure(value, magnitude, ok)} "
+            f"used to set field '{attribute.name}' is out of range "
+            f"{lower_str}{'-inf' if lower is None else lower}, "
+            f"{'inf' if upper is None else upper}{upper_str} {value.units:~P}"
+        )
+
+
+def in_range(
+    min: Any = None,
+    max: Any = None,
+    *,
+    min_inclusive: bool = True,
+    max_inclusive: bool = True,
+):
+    """
+    Create a validator checking that a quantity lies within bounds.
+
+    Bounds may be quantities or unitless values, interpreted in the declared
+    units of the validated field. They are converted once per combination of
+    declared and value units, and array magnitudes are checked with a single
+    vectorized comparison. The validator also checks unit compatibility like
+    :func:`has_compatible_units`, which it therefore replaces.
+
+    Only works with unit-enabled fields created with :func:`pinttrs.field` or
+    :func:`pinttr.attrib`.
+
+    :param min:
+        Lower bound. If ``None``, values are not bounded from below.
+
+    :param max:
+        Upper bound. If ``None``, values are not bounded from above.
+
+    :param min_inclusive:
+        If ``False``, values equal to ``min`` fail validation.
+
+    :param max_inclusive:
+        If ``False``, values equal to ``max`` fail validation.
+
+    :returns:
+        A validator.
+
+    :raises UnitsError:
+        Upon validation, if units are incompatible or if a unitless value is
+        provided.
+
+    :raises ValueError:
+        Upon validation, if a value is out of bounds. The message reports the
+        first failing element.
+
+    .. rubric:: Example
+
+    >>> from pinttrs.validators import in_range
+    >>> @attrs.define
+    ... class Flight:
+    ...     altitude = pinttrs.field(
+    ...         units=ureg.m, validator=in_range(0.0, 100.0 * ureg.km)
+    ...     )
+    >>> Flight([1.0, 2.0] * ureg.km)
+    Flight(altitude=[1.0 2.0] km)
+    >>> Flight([1.0, 200.0] * ureg.km)
+    Traceback (most recent call last):
+        ...
+    ValueError: value 200.0 km at index 1 ... is out of range [0.0, 100.0] km
+
+    .. versionadded:: 26.2.0
+    """
+    return _InRange(min, max, min_inclusive, max_inclusive)
+
+
+_positive = in_range(0, None, min_inclusive=False)
+
+
+def positive(instance, attribute, value):
+    """
+    Validate that a quantity is strictly positive when expressed in the
+    declared units of ``attribute``. Unit compatibility is also checked
+    (see :func:`in_range`).
+
+    :raises UnitsError:
+        If units are incompatible or if a unitless value is provided.
+
+    :raises ValueError:
+        If a value is not strictly positive.
+
+    .. versionadded:: 26.2.0
+    """
+    _positive(instance, attribute, value)
+
+
+def finite(instance, attribute, value):
+    """
+    Validate that the magnitude of a quantity is finite (neither infinite nor
+    NaN). Unit compatibility is also checked (see :func:`in_range`).
+
+    :raises UnitsError:
+        If units are incompatible or if a unitless value is provided.
+
+    :raises ValueError:
+        If a value is not finite. The message reports the first failing
+        element.
+
+    .. versionadded:: 26.2.0
+    """
+    import numpy as np
+
+    _check_units(attribute, value)
+    magnitude = np.asarray(value.magnitude)
+    ok = np.isfinite(magnitude)
+
+    if not ok.all():
+        raise ValueError(
+            f"{_describe_failure(value, magnitude, ok)} "
+            f"used to set field '{attribute.name}' is not finite"
+        )
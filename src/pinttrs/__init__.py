@@ -1,27 +1,96 @@
 from pinttr import (
+    CacheInfo,
+    ConversionRecord,
+    ConversionTrace,
+    Instrumentation,
+    LazyQuantity,
     UnitContext,
+    UnitField,
     UnitGenerator,
+    UnitSchema,
     __version__,
+    aiter_records,
+    aload_records,
     attrib,
+    convert_array,
+    convert_units,
+    copy_on_write,
+    evolve,
     field,
+    fields_with_units,
+    from_dict,
+    get_conversion_threshold,
+    get_repr_threshold,
     get_unit_registry,
+    instrument,
+    interpret_records,
     interpret_units,
+    is_trusted,
+    iter_columns,
+    load_binary,
+    load_npy,
+    memoize,
+    quantity_eq,
+    read_columns,
+    save_binary,
+    save_npy,
+    set_conversion_threshold,
+    set_repr_threshold,
     set_unit_registry,
+    structure,
+    trace,
+    trusted,
+    unstructure,
 )
 
-from . import converters, exceptions, util, validators
+from . import converters, exceptions, pickling, util, validators
 
 __all__ = [
+    "CacheInfo",
+    "ConversionRecord",
+    "ConversionTrace",
+    "Instrumentation",
+    "LazyQuantity",
     "UnitContext",
+    "UnitField",
     "UnitGenerator",
+    "UnitSchema",
     "__version__",
+    "aiter_records",
+    "aload_records",
     "attrib",
+    "convert_array",
+    "convert_units",
     "converters",
+    "copy_on_write",
+    "evolve",
     "exceptions",
     "field",
+    "fields_with_units",
+    "from_dict",
+    "get_conversion_threshold",
+    "get_repr_threshold",
     "get_unit_registry",
+    "instrument",
+    "interpret_records",
     "interpret_units",
+    "is_trusted",
+    "iter_columns",
+    "load_binary",
+    "load_npy",
+    "memoize",
+    "pickling",
+    "quantity_eq",
+    "read_columns",
+    "save_binary",
+    "save_npy",
+    "set_conversion_threshold",
+    "set_repr_threshold",
     "set_unit_registry",
+    "structure",
+    "trace",
+    "trusted",
+    "unstructure",
     "util",
     "validators",
 ]
@@ -1,12 +1,47 @@
+from pinttr import CacheInfo as CacheInfo
+from pinttr import ConversionRecord as ConversionRecord
+from pinttr import ConversionTrace as ConversionTrace
+from pinttr import Instrumentation as Instrumentation
+from pinttr import LazyQuantity as LazyQuantity
 from pinttr import UnitContext as UnitContext
+from pinttr import UnitField as UnitField
 from pinttr import UnitGenerator as UnitGenerator
+from pinttr import UnitSchema as UnitSchema
 from pinttr import __version__ as __version__
+from pinttr import aiter_records as aiter_records
+from pinttr import aload_records as aload_records
 from pinttr import attrib as attrib
+from pinttr import convert_array as convert_array
+from pinttr import convert_units as convert_units
 from pinttr import converters as converters
+from pinttr import copy_on_write as copy_on_write
+from pinttr import evolve as evolve
 from pinttr import exceptions as exceptions
 from pinttr import field as field
+from pinttr import fields_with_units as fields_with_units
+from pinttr import from_dict as from_dict
+from pinttr import get_conversion_threshold as get_conversion_threshold
+from pinttr import get_repr_threshold as get_repr_threshold
 from pinttr import get_unit_registry as get_unit_registry
+from pinttr import instrument as instrument
+from pinttr import interpret_records as interpret_records
 from pinttr import interpret_units as interpret_units
+from pinttr import is_trusted as is_trusted
+from pinttr import iter_columns as iter_columns
+from pinttr import load_binary as load_binary
+from pinttr import load_npy as load_npy
+from pinttr import memoize as memoize
+from pinttr import pickling as pickling
+from pinttr import quantity_eq as quantity_eq
+from pinttr import read_columns as read_columns
+from pinttr import save_binary as save_binary
+from pinttr import save_npy as save_npy
+from pinttr import set_conversion_threshold as set_conversion_threshold
+from pinttr import set_repr_threshold as set_repr_threshold
 from pinttr import set_unit_registry as set_unit_registry
+from pinttr import structure as structure
+from pinttr import trace as trace
+from pinttr import trusted as trusted
+from pinttr import unstructure as unstructure
 from pinttr import util as util
 from pinttr import validators as validators
@@ -0,0 +1 @@
+from pinttr.pickling import *  # noqa
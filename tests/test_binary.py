@@ -0,0 +1,136 @@
+import io
+import json
+import sys
+
+import attrs
+import numpy as np
+import pytest
+
+import pinttr
+from pinttr.exceptions import UnitsError
+
+ureg = pinttr.get_unit_registry()
+
+
+@attrs.define
+class Inner:
+    x = pinttr.field(units=ureg.m)
+
+
+@attrs.define
+class Spectrum:
+    w = pinttr.field(units=ureg.nm)
+    f = pinttr.field(units=ureg.W)
+    t = pinttr.field(default=1.0, units=ureg.s)
+    label = attrs.field(default="")
+    raw = attrs.field(default=None)
+    inner = attrs.field(default=None)
+
+
+def test_binary_roundtrip(tmp_path):
+    """
+    Unit tests for :func:`pinttr.save_binary` and :func:`pinttr.load_binary`.
+    """
+    path = tmp_path / "spectrum.bin"
+    obj = Spectrum(
+        w=np.linspace(400.0, 700.0, 31) * ureg.nm,
+        f=np.asfortranarray(np.arange(12.0, dtype=np.float32).reshape(3, 4)),
+        t=2.0 * ureg.ms,
+        label="a",
+        raw=np.arange(10)[::2],
+        inner=Inner(1.0 * ureg.km),
+    )
+    pinttr.save_binary(obj, path)
+
+    # Arrays are memory-mapped by default
+    result = pinttr.load_binary(path)
+    assert isinstance(result.w.magnitude, np.memmap)
+    assert not result.w.magnitude.flags.writeable
+    assert np.array_equal(result.w.magnitude, obj.w.magnitude)
+    assert result.w.units == ureg.nm
+    assert result.f.magnitude.dtype == np.float32
+    assert result.f.magnitude.flags.f_contiguous
+    assert np.array_equal(result.f.magnitude, obj.f.magnitude)
+    assert result.t == 2.0 * ureg.ms
+    assert result.label == "a"
+    assert np.array_equal(result.raw, [0, 2, 4, 6, 8])
+    assert result.inner == Inner(1.0 * ureg.km)
+
+    # Arrays can be read into memory
+    result = pinttr.load_binary(path, mmap_mode=None)
+    assert not isinstance(result.w.magnitude, np.memmap)
+    assert np.array_equal(result.f.magnitude, obj.f.magnitude)
+
+
+def test_binary_file_object(tmp_path):
+    """
+    Files can be written to file objects, loaded data goes through converters
+    and validators.
+    """
+    with pinttr.trusted():
+        obj = Inner(np.array([1.0, 2.0]) * ureg.s)
+    buffer = io.BytesIO()
+    pinttr.save_binary(obj, buffer)
+    path = tmp_path / "inner.bin"
+    path.write_bytes(buffer.getvalue())
+
+    with pytest.raises(UnitsError):
+        pinttr.load_binary(path)
+
+
+def test_binary_errors(tmp_path):
+    path = tmp_path / "invalid.bin"
+    path.write_bytes(b"invalid")
+    with pytest.raises(ValueError):
+        pinttr.load_binary(path)
+
+    with pytest.raises(TypeError):
+        pinttr.save_binary(
+            Spectrum(w=1.0, f=np.array([None, 1.0])), tmp_path / "obj.bin"
+        )
+
+    # Only attrs classes are instantiated, including nested ones
+    path = tmp_path / "spectrum.bin"
+    pinttr.save_binary(Spectrum(w=1.0, f=1.0, inner=Inner(1.0)), path)
+    data = path.read_bytes()
+    header_size = int.from_bytes(data[8:16], "little")
+    header = json.loads(data[16 : 16 + header_size])
+
+    def tamper(header):
+        encoded = json.dumps(header).encode().ljust(header_size)
+        path.write_bytes(data[:16] + encoded + data[16 + header_size :])
+
+    tamper({**header, "class": "os:getcwd"})
+    with pytest.raises(TypeError, match="not an attrs class"):
+        pinttr.load_binary(path)
+
+    fields = {**header["fields"]}
+    fields["inner"] = {**fields["inner"], "class": "os:getcwd"}
+    tamper({**header, "fields": fields})
+    with pytest.raises(TypeError, match="not an attrs class"):
+        pinttr.load_binary(path)
+
+    # With cls, nested classes are never imported from the header
+    fields["inner"] = {**fields["inner"], "class": "pinttr_untrusted:Payload"}
+    tamper({**header, "fields": fields})
+    with pytest.raises(TypeError, match="nor an allowed class"):
+        pinttr.load_binary(path, cls=Spectrum)
+    assert "pinttr_untrusted" not in sys.modules
+
+
+def test_binary_nested_classes(tmp_path):
+    # With cls, nested classes are the declared field types or allowed classes
+    @attrs.define
+    class Typed:
+        inner: Inner = attrs.field()
+
+    path = tmp_path / "typed.bin"
+    pinttr.save_binary(Typed(Inner(1.0)), path)
+    assert pinttr.load_binary(path, cls=Typed).inner == Inner(1.0)
+
+    path = tmp_path / "spectrum.bin"
+    pinttr.save_binary(Spectrum(w=1.0, f=1.0, inner=Inner(1.0)), path)
+    with pytest.raises(TypeError, match="nor an allowed class"):
+        pinttr.load_binary(path, cls=Spectrum)
+    result = pinttr.load_binary(path, cls=Spectrum, classes=[Inner])
+    assert result.inner == Inner(1.0)
@@ -0,0 +1,100 @@
+import attrs
+import numpy as np
+import pint
+import pytest
+
+import pinttr
+from pinttr import _chunked
+from pinttr.converters import ensure_units
+
+ureg = pinttr.get_unit_registry()
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    # Exercise the multi-threaded path with small arrays on any machine
+    monkeypatch.setattr(_chunked, "_BLOCK_SIZE", 8)
+    monkeypatch.setattr(_chunked.os, "cpu_count", lambda: 4)
+    default = pinttr.get_conversion_threshold()
+    pinttr.set_conversion_threshold(16)
+    yield
+    pinttr.set_conversion_threshold(default)
+
+
+@pytest.mark.parametrize(
+    "src, dst",
+    [(ureg.km, ureg.m), (ureg.degC, ureg.K), (ureg.m, ureg.m)],
+    ids=["scale", "offset", "identity"],
+)
+@pytest.mark.parametrize("shape", [(5,), (100,), (10, 13)])
+def test_convert_array(small_blocks, src, dst, shape):
+    """
+    Unit tests for :func:`pinttr.convert_array`.
+    """
+    x = np.random.default_rng(0).random(shape) * src
+    expected = x.to(dst)
+
+    # Result is allocated
+    result = pinttr.convert_array(x, dst)
+    assert result.units == dst
+    np.testing.assert_allclose(result.magnitude, expected.magnitude)
+
+    # Result is written to a preallocated array
+    out = np.empty(shape)
+    result = pinttr.convert_array(x, str(dst), out=out)
+    assert result.magnitude is out
+    np.testing.assert_allclose(out, expected.magnitude)
+
+    # Conversion can be performed in place
+    magnitude = x.magnitude.copy()
+    pinttr.convert_array(magnitude * src, dst, out=magnitude)
+    np.testing.assert_allclose(magnitude, expected.magnitude)
+
+    # Non-contiguous arrays are supported
+    result = pinttr.convert_array(x.T, dst, out=np.empty(shape[::-1]))
+    np.testing.assert_allclose(result.magnitude, expected.magnitude.T)
+
+
+def test_convert_array_errors():
+    x = np.zeros(3) * ureg.km
+
+    with pytest.raises(pint.DimensionalityError):
+        pinttr.convert_array(x, ureg.s)
+
+    with pytest.raises(ValueError, match="shape"):
+        pinttr.convert_array(x, ureg.m, out=np.empty(4))
+
+
+def test_conversion_threshold(small_blocks, monkeypatch):
+    """
+    Unit tests for :func:`pinttr.set_conversion_threshold`.
+    """
+    calls = []
+    convert_blocks = _chunked._convert_blocks
+
+    def spy(*args, **kwargs):
+        calls.append(args[0].size)
+        return convert_blocks(*args, **kwargs)
+
+    monkeypatch.setattr(_chunked, "_convert_blocks", spy)
+
+    # Large arrays converted by ensure_units and from_dict are chunked
+    @attrs.define
+    class MyClass:
+        x = pinttr.field(units=ureg.m)
+
+    small, large = np.ones(10) * ureg.km, np.ones(20) * ureg.km
+    for x in [small, large]:
+        converted = ensure_units(x, default_units=ureg.m, convert=True)
+        np.testing.assert_array_equal(converted.magnitude, 1000.0)
+    obj = pinttr.from_dict(MyClass, {"x": np.ones(20), "x_units": "km"})
+    np.testing.assert_array_equal(obj.x.magnitude, 1000.0)
+    assert calls == [20, 20]
+
+    # Chunking can be disabled
+    pinttr.set_conversion_threshold(None)
+    ensure_units(large, default_units=ureg.m, convert=True)
+    assert calls == [20, 20]
+
+    with pytest.raises(ValueError):
+        pinttr.set_conversion_threshold(-1)
@@ -0,0 +1,88 @@
+import attrs
+import numpy as np
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+
+def test_quantity_eq_scalar():
+    """
+    Unit tests for :func:`pinttr.quantity_eq` (scalar values).
+    """
+
+    @attrs.frozen
+    class MyClass:
+        x = pinttr.field(units=ureg.m, eq=pinttr.quantity_eq(), on_setattr=None)
+        y = pinttr.field(
+            default=None,
+            units=ureg.m,
+            eq=pinttr.quantity_eq(atol=1e-6),
+            on_setattr=None,
+        )
+
+    # Values are compared in field units
+    assert MyClass(1.0 * ureg.km) == MyClass(1000.0)
+    assert hash(MyClass(1.0 * ureg.km)) == hash(MyClass(1000.0))
+    assert MyClass(1.0) != MyClass(2.0)
+
+    # Tolerance is applied if requested
+    assert MyClass(1.0, 1.0) == MyClass(1.0, 1.0 + 1e-9)
+    assert MyClass(1.0, 1.0) != MyClass(1.0, 1.1)
+    assert hash(MyClass(1.0, 1.0)) == hash(MyClass(1.0, 1.0 + 1e-9))
+
+    # Optional values are handled
+    assert MyClass(1.0, None) == MyClass(1.0, None)
+    assert MyClass(1.0, None) != MyClass(1.0, 1.0)
+
+
+def test_quantity_eq_array():
+    """
+    Unit tests for :func:`pinttr.quantity_eq` (array values).
+    """
+
+    @attrs.define(eq=True, hash=True)
+    class MyClass:
+        x = pinttr.field(units=ureg.m, eq=pinttr.quantity_eq())
+
+    a = np.array([1.0, 2.0, 3.0])
+
+    # Comparison does not raise and is unit-aware
+    assert MyClass(a) == MyClass(a * 1e-3 * ureg.km)
+    assert MyClass(a) != MyClass(a + 1.0)
+    assert MyClass(a) != MyClass(np.array([1.0, 2.0]))
+    assert hash(MyClass(a)) == hash(MyClass(a.copy()))
+
+    # Hashes of read-only arrays are cached
+    b = np.arange(3.0)
+    b.flags.writeable = False
+    key = pinttr.quantity_eq(ureg.m)
+    assert key(ureg.Quantity(b, "m"))._hash is not None
+    assert hash(key(ureg.Quantity(b, "m"))) == hash(key(b * ureg.m))
+    assert key(ureg.Quantity(b.copy(), "m"))._hash is None
+
+    # Read-only views are hashed upon each call
+    c = np.arange(3.0)
+    view = c[:]
+    view.flags.writeable = False
+    h = hash(key(ureg.Quantity(view, "m")))
+    assert key(ureg.Quantity(view, "m"))._hash is None
+    c[0] = 10.0
+    assert hash(key(ureg.Quantity(view, "m"))) != h
+
+    # Tolerance
+    key = pinttr.quantity_eq(ureg.m, rtol=1e-6)
+    assert key(a * ureg.m) == key(a * (1.0 + 1e-9) * ureg.m)
+
+
+def test_quantity_eq_unbound():
+    """
+    Unbound strategies compare in base units.
+    """
+    key = pinttr.quantity_eq()
+    assert key(1.0 * ureg.km) == key(1000.0 * ureg.m)
+    assert key(1.0 * ureg.km) != key(1.0 * ureg.s)
+
+    with pytest.raises(TypeError):
+        pinttr.quantity_eq("m")
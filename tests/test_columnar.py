@@ -0,0 +1,188 @@
+import attrs
+import numpy as np
+import pint
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+CSV = """t,altitude,status
+s,km,
+0,1.5,ok
+1,1.6,ok
+2,,fail
+"""
+
+
+@attrs.define
+class Track:
+    t = pinttr.field(units=ureg.s)
+    altitude = pinttr.field(units=ureg.m)
+    status = attrs.field()
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "telemetry.csv"
+    path.write_text(CSV)
+    return path
+
+
+def test_iter_columns(csv_path):
+    """
+    Unit tests for :func:`pinttr.iter_columns`.
+    """
+    chunks = list(pinttr.iter_columns(csv_path, chunk_size=2))
+    assert len(chunks) == 2
+    assert chunks[0]["altitude"].units == ureg.km
+    np.testing.assert_array_equal(chunks[0]["t"].magnitude, [0.0, 1.0])
+    assert np.isnan(chunks[1]["altitude"].magnitude[0])
+    np.testing.assert_array_equal(chunks[1]["status"], ["fail"])
+
+    # Chunks are converted to instances
+    tracks = list(pinttr.iter_columns(csv_path, cls=Track, chunk_size=2))
+    assert tracks[0].altitude.units == ureg.m
+    np.testing.assert_array_equal(tracks[0].altitude.magnitude, [1500.0, 1600.0])
+
+    # Units can be overridden
+    chunks = list(pinttr.iter_columns(csv_path, units={"t": "ms"}))
+    assert chunks[0]["t"].units == ureg.ms
+
+
+def test_read_columns(csv_path, tmp_path):
+    """
+    Unit tests for :func:`pinttr.read_columns`.
+    """
+    columns = pinttr.read_columns(csv_path, chunk_size=2)
+    np.testing.assert_array_equal(columns["t"].magnitude, [0.0, 1.0, 2.0])
+    assert columns["t"].units == ureg.s
+    np.testing.assert_array_equal(columns["status"], ["ok", "ok", "fail"])
+
+    track = pinttr.read_columns(csv_path, cls=Track)
+    np.testing.assert_array_equal(track.t.magnitude, [0.0, 1.0, 2.0])
+
+    # Files without a units row
+    path = tmp_path / "no_units.csv"
+    path.write_text("x;y\n1;2\n")
+    columns = pinttr.read_columns(
+        path, units={"x": ureg.m}, units_row=False, delimiter=";"
+    )
+    assert columns["x"] == ureg.Quantity([1.0], "m")
+    np.testing.assert_array_equal(columns["y"], [2.0])
+
+    # Non-numeric values in columns with units raise
+    path.write_text("x\nm\na\n")
+    with pytest.raises(ValueError):
+        pinttr.read_columns(path)
+
+    # Blank lines are skipped
+    path.write_text("x,y\nm,\n1,2\n\n3,4\n\n")
+    columns = pinttr.read_columns(path, chunk_size=1)
+    np.testing.assert_array_equal(columns["x"].m_as("m"), [1.0, 3.0])
+    np.testing.assert_array_equal(columns["y"], [2.0, 4.0])
+
+    # Numeric columns without units are converted to floats (lossy)
+    path.write_text("id,x\n,m\n007,1\n")
+    np.testing.assert_array_equal(pinttr.read_columns(path)["id"], [7.0])
+
+    # Empty files and missing units rows raise
+    path.write_text("")
+    with pytest.raises(ValueError, match="empty CSV: no header row"):
+        pinttr.read_columns(path)
+    path.write_text("x,y\n")
+    with pytest.raises(ValueError, match="no units row"):
+        pinttr.read_columns(path)
+
+    # Rows must have as many fields as the header
+    path.write_text("x,y\nm,\n1,2\n3\n")
+    with pytest.raises(ValueError, match="line 4: expected 2 fields, got 1"):
+        pinttr.read_columns(path)
+
+
+def test_read_columns_parquet(tmp_path):
+    """
+    Parquet files are read with pyarrow, with units from column metadata.
+    """
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    schema = pa.schema(
+        [
+            pa.field("t", pa.float64(), metadata={"units": "s"}),
+            pa.field("altitude", pa.float64(), metadata={"units": "km"}),
+            pa.field("status", pa.string()),
+        ]
+    )
+    table = pa.table(
+        {"t": [0.0, 1.0], "altitude": [1.5, 1.6], "status": ["ok", "ok"]},
+        schema=schema,
+    )
+    path = tmp_path / "telemetry.parquet"
+    pq.write_table(table, path)
+
+    track = pinttr.read_columns(path, cls=Track, chunk_size=1)
+    np.testing.assert_array_equal(track.altitude.magnitude, [1500.0, 1600.0])
+    assert list(track.status) == ["ok", "ok"]
+
+
+def test_interpret_records():
+    """
+    Unit tests for :func:`pinttr.interpret_records`.
+    """
+    records = [
+        {"t": float(i), "t_units": "s", "altitude": 1.5, "altitude_units": "km"}
+        for i in range(10)
+    ]
+    records[3]["altitude_units"] = "m"
+    records[5]["status"] = "fail"
+    del records[7]["altitude"], records[7]["altitude_units"]
+
+    expected = np.full(10, 1.5)
+    expected[3] = 1.5e-3
+    expected[7] = np.nan
+
+    # In process, then with a process pool: results are identical and ordered
+    for kwargs in [{}, {"chunk_size": 3, "max_workers": 2}]:
+        columns = pinttr.interpret_records(records, **kwargs)
+        np.testing.assert_array_equal(columns["t"].magnitude, np.arange(10.0))
+        assert columns["altitude"].units == ureg.km
+        np.testing.assert_allclose(columns["altitude"].magnitude, expected)
+        assert list(columns["status"]) == [None] * 5 + ["fail"] + [None] * 4
+
+    # Instances
+    records = [
+        {"t": 1.0, "t_units": "ms", "altitude": 1.0, "altitude_units": "km"},
+        {"t": 2.0, "t_units": "ms", "status": "ok"},
+    ]
+    obj = pinttr.interpret_records(records, cls=Track)
+    np.testing.assert_array_equal(obj.t.magnitude, [1e-3, 2e-3])
+    np.testing.assert_array_equal(obj.altitude.magnitude, [1000.0, np.nan])
+    assert list(obj.status) == [None, "ok"]
+
+    # Magnitudes without units
+    with pytest.raises(ValueError):
+        pinttr.interpret_records([{"t": 1.0, "t_units": "s"}, {"t": 1.0}])
+    with pytest.raises(ValueError):
+        pinttr.interpret_records(
+            [{"t": 1.0, "t_units": "s"}, {"t": 1.0}], chunk_size=1, max_workers=1
+        )
+
+    assert pinttr.interpret_records([]) == {}
+
+    # Quantities are interpreted in their own units
+    records = [{"x": 1.0, "x_units": "km"}, {"x": 500.0 * ureg.m}, {"x": 2.0 * ureg.km}]
+    for kwargs in [{}, {"chunk_size": 1, "max_workers": 2}]:
+        columns = pinttr.interpret_records(records, **kwargs)
+        np.testing.assert_allclose(columns["x"].m_as("km"), [1.0, 0.5, 2.0])
+
+
+def test_interpret_records_registry():
+    # Units are interpreted in the current process, with the given registry
+    other = pint.UnitRegistry()
+    other.define("smoot = 1.7018 m")
+    records = [{"x": 1.0, "x_units": "m"}, {"x": 1.0, "x_units": "smoot"}]
+    for kwargs in [{}, {"chunk_size": 1, "max_workers": 2}]:
+        columns = pinttr.interpret_records(records, ureg=other, **kwargs)
+        assert columns["x"].units == other.m
+        np.testing.assert_allclose(columns["x"].magnitude, [1.0, 1.7018])
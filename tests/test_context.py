@@ -1,4 +1,5 @@
 import enum
+import threading
 
 import pytest
 
@@ -115,12 +116,52 @@ def test_unit_context_override():
     assert unit_context.get("time") == ureg.s
     assert unit_context.get("speed") == ureg.Unit("m/s")
 
+    # Dicts and kwargs can be mixed; all entries are overridden at once
+    with unit_context.override({PhysicalQuantity.LENGTH: "km"}, time="h"):
+        assert unit_context.get("speed") == ureg.Unit("km/h")
+        assert unit_context.registry[PhysicalQuantity.LENGTH].units == ureg.m
+    assert unit_context.get("speed") == ureg.Unit("m/s")
+
     # Override with something else than a dict or kwargs fails
     with pytest.raises(TypeError):
         with unit_context.override(1.0):
             pass
 
 
+def test_unit_context_threads():
+    """
+    Lookups from other threads never observe unconverted entries or overrides.
+    """
+    unit_context = UnitContext({"length": ureg.m}, interpret_str=True)
+    stop = threading.Event()
+    errors = []
+
+    def reader():
+        while not stop.is_set():
+            try:
+                units = unit_context.get_all()
+            except Exception as e:
+                errors.append(e)
+                continue
+            if units["length"] != ureg.m or any(
+                not isinstance(u, type(ureg.m)) for u in units.values()
+            ):
+                errors.append(units)
+
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for i in range(200):
+        unit_context[f"key{i}"] = "km"
+        with unit_context.override(length="km"):
+            pass
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+
+
 def test_unit_context_deferred():
     unit_context = UnitContext(key_converter=PhysicalQuantity)
     unit_context.update(
@@ -1,7 +1,7 @@
 import pytest
 
 from pinttr import UnitGenerator, get_unit_registry
-from pinttr.converters import ensure_units, to_quantity
+from pinttr.converters import ensure_units, to_dataarray, to_quantities, to_quantity
 from pinttr.exceptions import DimensionalityError
 
 ureg = get_unit_registry()
@@ -102,3 +102,76 @@ def test_to_quantity_xarray():
     assert isinstance(result_2d, ureg.Quantity)
     assert np.array_equal(result_2d.magnitude, np.array([[1.0, 2.0], [3.0, 4.0]]))
     assert result_2d.units == ureg.km
+
+
+def test_to_quantity_xarray_lazy():
+    """DataArray data is wrapped without being copied or computed."""
+    xr = pytest.importorskip("xarray")
+    import numpy as np
+
+    data = xr.DataArray(np.arange(3.0), attrs={"units": "m"})
+    assert to_quantity(data).magnitude is data.data
+
+    da = pytest.importorskip("dask.array")
+    data = xr.DataArray(da.ones(4, chunks=2), attrs={"units": "m"})
+    result = to_quantity(data)
+    assert isinstance(result.magnitude, da.Array)
+    assert result.magnitude.chunks == ((2, 2),)
+
+
+def test_to_quantities():
+    """Test conversion of xarray Dataset variables to Pint quantities."""
+    xr = pytest.importorskip("xarray")
+    import numpy as np
+
+    ds = xr.Dataset(
+        {"t": ("x", [280.0, 290.0], {"units": "K"}), "flag": ("x", [0, 1])},
+        coords={"x": ("x", [0.0, 1.0], {"units": "km"})},
+    )
+    result = to_quantities(ds)
+    assert set(result) == {"t", "flag"}
+    assert result["t"].units == ureg.K
+    assert result["t"].magnitude is ds["t"].data
+    assert isinstance(result["flag"], xr.DataArray)
+
+    result = to_quantities(ds, coords=True)
+    assert np.array_equal(result["x"].magnitude, [0.0, 1.0])
+    assert result["x"].units == ureg.km
+
+
+def test_to_dataarray():
+    """Test conversion of Pint quantities to xarray DataArrays."""
+    xr = pytest.importorskip("xarray")
+    import numpy as np
+
+    q = np.arange(3.0) * ureg.km
+    result = to_dataarray(q, dims="x", attrs={"long_name": "distance"})
+    assert isinstance(result, xr.DataArray)
+    assert result.attrs == {"long_name": "distance", "units": "kilometer"}
+    assert result.data is q.magnitude
+
+    # Round trip
+    assert to_quantity(result).units == ureg.km
+
+
+def test_ensure_units_dtype_order():
+    """Magnitudes are coerced to the requested data type and memory layout."""
+    np = pytest.importorskip("numpy")
+
+    result = ensure_units([1, 2], default_units=ureg.m, dtype="float32")
+    assert result.magnitude.dtype == np.float32
+    assert result.units == ureg.m
+
+    a = np.ones((4, 4))[:, ::2]
+    result = ensure_units(a * ureg.km, default_units=ureg.m, order="C")
+    assert result.magnitude.flags.c_contiguous
+    assert result.units == ureg.km
+
+    # No copy is made if the magnitude matches
+    q = np.ones(3) * ureg.m
+    assert ensure_units(q, default_units=ureg.m, dtype=float, order="C") is q
+
+    converter = ensure_units(default_units=ureg.m, convert=True, dtype="float32")
+    result = converter(np.ones(2) * ureg.km)
+    assert result.magnitude.dtype == np.float32
+    assert result.units == ureg.m
@@ -0,0 +1,163 @@
+import copy
+import gc
+import pickle
+
+import attrs
+import numpy as np
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+
+@pinttr.copy_on_write
+@attrs.define
+class Snapshot:
+    x = pinttr.field(units=ureg.m)
+    t = pinttr.field(units=ureg.s, default=0.0)
+    tags: list = attrs.field(factory=list)
+
+
+@pytest.mark.parametrize(
+    "copier",
+    [copy.copy, copy.deepcopy, attrs.evolve, pinttr.evolve],
+    ids=["copy", "deepcopy", "attrs.evolve", "evolve"],
+)
+def test_copy_on_write(copier):
+    """
+    Unit tests for :func:`pinttr.copy_on_write`.
+    """
+    a = Snapshot(np.zeros(4))
+    b = copier(a)
+
+    # Buffers are shared and read-only
+    assert b.x is not a.x
+    assert np.shares_memory(a.x.magnitude, b.x.magnitude)
+    assert not a.x.magnitude.flags.writeable
+    assert b.t == a.t
+
+    # Writes make the written field private
+    b.x[0] = 1.0 * ureg.m
+    a.x += 2.0 * ureg.m
+    np.testing.assert_array_equal(a.x.magnitude, [2.0, 2.0, 2.0, 2.0])
+    np.testing.assert_array_equal(b.x.magnitude, [1.0, 0.0, 0.0, 0.0])
+    assert not np.shares_memory(a.x.magnitude, b.x.magnitude)
+
+
+def test_copy_on_write_other_fields():
+    a = Snapshot(np.zeros(4), tags=["a"])
+    assert copy.copy(a).tags is a.tags
+    assert copy.deepcopy(a).tags == a.tags
+    assert copy.deepcopy(a).tags is not a.tags
+
+    # Scalar quantities are not affected
+    a = Snapshot(1.0)
+    assert copy.deepcopy(a) == a
+
+
+def test_copy_on_write_sole_owner():
+    # Once copies are gone, writes are applied in place
+    a = Snapshot(np.zeros(4))
+    b = copy.deepcopy(a)
+    del b
+    gc.collect()
+    magnitude = a.x.magnitude
+    a.x.magnitude[0] = 1.0
+    assert a.x.magnitude is magnitude
+    assert magnitude.flags.writeable
+    np.testing.assert_array_equal(magnitude, [1.0, 0.0, 0.0, 0.0])
+
+
+def test_copy_on_write_views():
+    a = Snapshot(np.arange(4.0))
+    b = copy.deepcopy(a)
+
+    # Derived views and non-ufunc writes are read-only while shared
+    with pytest.raises(ValueError, match="read-only"):
+        a.x.magnitude.reshape(2, 2)[0, 0] = 1.0
+    with pytest.raises(ValueError, match="read-only"):
+        np.copyto(a.x.magnitude, 1.0)
+
+    # Shared magnitudes behave as regular arrays otherwise
+    assert type((a.x * 2.0).magnitude) is np.ndarray
+    assert repr(a.x.magnitude) == "array([0., 1., 2., 3.])"
+    assert a.x.to("km").magnitude[1] == 0.001
+    assert type(copy.deepcopy(a.x).magnitude) is np.ndarray
+    unpickled = pickle.loads(pickle.dumps(b))
+    assert type(unpickled.x.magnitude) is np.ndarray
+    np.testing.assert_array_equal(unpickled.x.magnitude, b.x.magnitude)
+
+
+def test_copy_on_write_read_only():
+    # Magnitudes are read-only even if never shared, until a tracked write
+    a = Snapshot(np.zeros(4))
+    with pytest.raises(ValueError, match="read-only"):
+        np.copyto(a.x.magnitude, 1.0)
+    with pytest.raises(ValueError, match="read-only"):
+        a.x.magnitude[1:][0] = 1.0
+    a.x.magnitude[0] = 1.0
+    np.copyto(a.x.magnitude, 2.0)
+    np.testing.assert_array_equal(a.x.magnitude, [2.0, 2.0, 2.0, 2.0])
+
+
+def test_copy_on_write_caller():
+    # Quantities passed by the caller are not modified
+    q = np.zeros(4) * ureg.m
+    a = Snapshot(q)
+    b = copy.deepcopy(a)
+    assert type(q.magnitude) is np.ndarray
+    assert q.magnitude.flags.writeable
+    assert np.shares_memory(q.magnitude, a.x.magnitude)
+
+    # Nor are quantities assigned after initialization
+    a.x = q
+    c = copy.deepcopy(a)
+    assert type(q.magnitude) is np.ndarray
+    assert q.magnitude.flags.writeable
+    assert np.shares_memory(a.x.magnitude, c.x.magnitude)
+
+    # Quantities of other instances join their block
+    d = Snapshot(b.x)
+    d.x[0] = 1.0 * ureg.m
+    b.x[1] = 2.0 * ureg.m
+    np.testing.assert_array_equal(b.x.magnitude, [0.0, 2.0, 0.0, 0.0])
+    np.testing.assert_array_equal(d.x.magnitude, [1.0, 0.0, 0.0, 0.0])
+
+
+def test_copy_on_write_subclass():
+    @attrs.define
+    class Extended(Snapshot):
+        y = pinttr.field(units=ureg.m, default=None)
+
+    q = np.zeros(4) * ureg.m
+    a = Extended(np.zeros(4), y=q)
+    b = copy.deepcopy(a)
+    assert np.shares_memory(a.x.magnitude, b.x.magnitude)
+    assert np.shares_memory(a.y.magnitude, b.y.magnitude)
+    assert q.magnitude.flags.writeable
+    b.y[0] = 1.0 * ureg.m
+    np.testing.assert_array_equal(a.y.magnitude, [0.0, 0.0, 0.0, 0.0])
+
+
+@pytest.mark.parametrize(
+    "copier", [copy.deepcopy, attrs.evolve], ids=["deepcopy", "attrs.evolve"]
+)
+def test_copy_on_write_array_spec(copier):
+    # Converters coercing magnitudes to plain arrays keep the buffer shared
+    @pinttr.copy_on_write
+    @attrs.define
+    class Typed:
+        x = pinttr.field(units=ureg.m, dtype="float64")
+
+    a = Typed(np.zeros(3))
+    b = copier(a)
+    assert np.shares_memory(a.x.magnitude, b.x.magnitude)
+    b.x[0] = 5.0 * ureg.m
+    np.testing.assert_array_equal(a.x.magnitude, [0.0, 0.0, 0.0])
+    np.testing.assert_array_equal(b.x.magnitude, [5.0, 0.0, 0.0])
+
+
+def test_copy_on_write_errors():
+    with pytest.raises(TypeError, match="attrs class"):
+        pinttr.copy_on_write(object)
@@ -13,8 +13,12 @@ def test_set_unit_registry():
     assert ureg is not pinttr.get_unit_registry()
 
     # We can change it to the value we like
-    pinttr.set_unit_registry(ureg)
-    assert ureg is pinttr.get_unit_registry()
+    default = pinttr.get_unit_registry()
+    try:
+        pinttr.set_unit_registry(ureg)
+        assert ureg is pinttr.get_unit_registry()
+    finally:
+        pinttr.set_unit_registry(default)
 
     # But it must be a pint.UnitRegistry
     with pytest.raises(TypeError):
@@ -0,0 +1,313 @@
+import attrs
+import pytest
+
+import pinttr
+from pinttr.converters import ensure_units
+from pinttr.exceptions import UnitsError
+
+ureg = pinttr.get_unit_registry()
+
+
+def test_evolve():
+    """
+    Unit tests for :func:`pinttr.evolve`.
+    """
+    calls = []
+
+    def counting_validator(instance, attribute, value):
+        calls.append(attribute.name)
+
+    @attrs.define
+    class MyClass:
+        x = pinttr.field(units=ureg.m)
+        t = pinttr.field(units=ureg.s)
+        _label = attrs.field(default="", validator=counting_validator)
+        n = attrs.field(init=False, default=0)
+
+    obj = MyClass(1.0, 2.0, label="a")
+    calls.clear()
+
+    # Changed unit fields are converted and validated
+    new = pinttr.evolve(obj, x=3.0)
+    assert new.x == 3.0 * ureg.m
+    assert new.t is obj.t
+    assert new._label == "a"
+    # User validators run as with attrs.evolve()
+    assert calls == ["_label"]
+
+    with pytest.raises(UnitsError):
+        pinttr.evolve(obj, x=1.0 * ureg.s)
+
+    # Private attributes are passed with their init name
+    assert pinttr.evolve(obj, label="b")._label == "b"
+
+    # Unknown fields raise
+    with pytest.raises(TypeError):
+        pinttr.evolve(obj, y=1.0)
+
+    # Unchanged unit fields are not re-validated
+    with pinttr.trusted():
+        obj.t = 1.0 * ureg.m
+    assert pinttr.evolve(obj, x=2.0).t == 1.0 * ureg.m
+
+
+def test_evolve_frozen():
+    """
+    :func:`pinttr.evolve` works with frozen classes.
+    """
+
+    @attrs.frozen
+    class MyClass:
+        x = pinttr.field(units=ureg.m, on_setattr=None)
+        y = pinttr.field(default=None, units=ureg.m, on_setattr=None)
+
+    obj = MyClass(1.0)
+    assert pinttr.evolve(obj, y=1.0) == MyClass(1.0, 1.0)
+    assert pinttr.evolve(obj, y=None).y is None
+
+
+def test_construct_nested():
+    """
+    Objects created while constructing an instance (*e.g.* by default
+    factories) are converted and validated.
+    """
+
+    @attrs.define
+    class Part:
+        v = pinttr.field(units=ureg.m)
+        w = pinttr.field(default=None, units=ureg.s)
+
+    @attrs.define
+    class Whole:
+        a = pinttr.field(units=ureg.m)
+        part = attrs.field(factory=lambda: Part(1.0))
+
+    for obj in [
+        pinttr.from_dict(Whole, {"a": 3.0}),
+        pinttr.evolve(Whole(2.0), a=3.0),
+        pinttr.structure(Whole, {"a": 3.0}),
+    ]:
+        assert obj.a == 3.0 * ureg.m
+        assert obj.part.v == 1.0 * ureg.m
+
+    # Validators of nested objects run, also for values passed through
+    @attrs.define
+    class Broken:
+        a = pinttr.field(units=ureg.m)
+        part = attrs.field(default=None)
+
+        def __attrs_post_init__(self):
+            self.part = Part(1.0, w=self.a)
+
+    with pytest.raises(UnitsError):
+        pinttr.from_dict(Broken, {"a": 3.0})
+
+
+@attrs.define
+class Inner:
+    x = pinttr.field(units=ureg.m)
+
+
+@attrs.define
+class Outer:
+    t = pinttr.field(units=ureg.s)
+    inner: Inner = attrs.field()
+    _label = attrs.field(default="")
+    points = attrs.field(factory=list)
+
+
+def test_unstructure():
+    """
+    Unit tests for :func:`pinttr.unstructure`.
+    """
+    obj = Outer(1.0, Inner(1.0 * ureg.km), "a", [1.0 * ureg.m])
+    assert pinttr.unstructure(obj) == {
+        "t": {"value": 1.0, "units": "second"},
+        "inner": {"x": {"value": 1.0, "units": "kilometer"}},
+        "_label": "a",
+        "points": [{"value": 1.0, "units": "meter"}],
+    }
+
+
+def test_structure():
+    """
+    Unit tests for :func:`pinttr.structure`.
+    """
+    obj = Outer(1.0, Inner(1.0 * ureg.km), "a", [1.0 * ureg.m, (2.0 * ureg.s,)])
+
+    # Round trip
+    assert pinttr.structure(Outer, pinttr.unstructure(obj)) == obj
+
+    # Sets are unstructured as lists
+    obj = Outer(1.0, Inner(1.0), points={1.0 * ureg.m})
+    assert pinttr.unstructure(obj)["points"] == [{"value": 1.0, "units": "meter"}]
+    assert pinttr.structure(Outer, pinttr.unstructure(obj)).points == [1.0 * ureg.m]
+
+    # Init names are accepted, mapping key variants are supported
+    result = pinttr.structure(
+        Outer, {"t": {"m": 1.0, "u": "ms"}, "inner": {"x": 2.0}, "label": "b"}
+    )
+    assert result.t == 1.0 * ureg.ms
+    assert result.inner.x == 2.0 * ureg.m
+    assert result._label == "b"
+
+    # Values are checked if they don't have the declared units
+    with pytest.raises(UnitsError):
+        pinttr.structure(Inner, {"x": {"value": 1.0, "units": "s"}})
+    with pytest.raises(UnitsError):
+        pinttr.structure(Inner, {"x": 1.0 * ureg.s})
+    with pytest.raises(ValueError):
+        pinttr.structure(Inner, {"x": {"value": 1.0}})
+
+    # Missing fields are reported by __init__()
+    with pytest.raises(TypeError):
+        pinttr.structure(Inner, {})
+
+
+def test_from_dict():
+    """
+    Unit tests for :func:`pinttr.from_dict`.
+    """
+
+    @attrs.define
+    class MyClass:
+        x = pinttr.field(units=ureg.m)
+        _angle = pinttr.field(default=None, units=ureg.deg)
+        y = pinttr.field(
+            default=0.0,
+            units=ureg.m,
+            converter=lambda x: ensure_units(2.0 * x, default_units=ureg.m),
+        )
+        label = attrs.field(default="")
+
+    # Magnitude and units keys
+    obj = pinttr.from_dict(MyClass, {"x": 1.0, "x_units": "km", "label": "a"})
+    assert obj.x.units == ureg.m and obj.x.magnitude == 1000.0
+    assert obj.label == "a"
+
+    # Mappings and quantities, private attributes
+    obj = pinttr.from_dict(
+        MyClass, {"x": {"m": 1.0, "u": "cm"}, "angle": 1.0 * ureg.rad}
+    )
+    assert obj.x.units == ureg.m and obj.x.magnitude == 0.01
+    assert obj._angle.units == ureg.deg
+    # A quantity magnitude is converted to the units of the units key
+    obj = pinttr.from_dict(MyClass, {"x": 1.0 * ureg.km, "x_units": "cm"})
+    assert obj.x.units == ureg.m and obj.x.magnitude == 1000.0
+
+    # Unitless magnitudes are interpreted in the declared units
+    assert pinttr.from_dict(MyClass, {"x": 1.0}).x == 1.0 * ureg.m
+    assert pinttr.from_dict(MyClass, {"x": 1.0, "angle": None})._angle is None
+
+    # Custom converters still run
+    assert pinttr.from_dict(MyClass, {"x": 1.0, "y": 1.0}).y == 2.0 * ureg.m
+    obj = pinttr.from_dict(MyClass, {"x": 1.0, "y": 1.0, "y_units": "km"})
+    assert obj.y == 2.0 * ureg.km
+
+    # Incompatible units raise
+    with pytest.raises(UnitsError):
+        pinttr.from_dict(MyClass, {"x": 1.0, "x_units": "s"})
+    with pytest.raises(UnitsError):
+        pinttr.from_dict(MyClass, {"x": 1.0, "angle": 1.0 * ureg.dimensionless})
+
+    # Unknown keys are reported by __init__()
+    with pytest.raises(TypeError):
+        pinttr.from_dict(MyClass, {"x": 1.0, "z": 1.0})
+
+
+def test_array_fields():
+    """
+    Structuring functions coerce array magnitudes and check their shape.
+    """
+    np = pytest.importorskip("numpy")
+
+    @attrs.define
+    class MyClass:
+        x = pinttr.field(units=ureg.m, dtype="float32", shape=(2,))
+
+    obj = pinttr.structure(MyClass, {"x": {"value": [1.0, 2.0], "units": "m"}})
+    assert obj.x.magnitude.dtype == np.float32
+    obj = pinttr.from_dict(MyClass, {"x": [1.0, 2.0], "x_units": "km"})
+    assert obj.x.magnitude.dtype == np.float32
+    np.testing.assert_array_equal(obj.x.magnitude, [1000.0, 2000.0])
+
+    with pytest.raises(ValueError):
+        pinttr.from_dict(MyClass, {"x": [1.0, 2.0, 3.0]})
+    with pytest.raises(ValueError):
+        pinttr.structure(MyClass, {"x": [1.0] * ureg.m})
+
+
+def test_convert_units():
+    """
+    Unit tests for :func:`pinttr.convert_units`.
+    """
+    np = pytest.importorskip("numpy")
+    length = pinttr.UnitGenerator(ureg.km)
+    calls = []
+
+    def counting_validator(instance, attribute, value):
+        calls.append(attribute.name)
+
+    @attrs.define
+    class MyClass:
+        x = pinttr.field(units=length, validator=counting_validator)
+        v = pinttr.field(units=ureg.km / ureg.h)
+        t = pinttr.field(default=None, units=ureg.s)
+        label = attrs.field(default="")
+
+    obj = MyClass(1.0, 36.0, label="a")
+    calls.clear()
+
+    # Declared units
+    with length.override(ureg.m):
+        result = pinttr.convert_units(obj)
+    assert result.x.magnitude == 1000.0 and result.x.units == ureg.m
+    assert result.v is obj.v
+    assert result.label == "a"
+    assert result is not obj and obj.x.units == ureg.km
+    # Validators do not run
+    assert not calls
+
+    # Unit systems
+    result = pinttr.convert_units(obj, "SI")
+    assert result.v.magnitude == pytest.approx(10.0)
+    assert result.v.units == ureg.m / ureg.s
+    assert result.t is None
+
+    # Unit contexts
+    ctx = pinttr.UnitContext({"length": length, "time": ureg.ms, "other": ureg.mile})
+    with ctx.override(length="cm"):
+        result = pinttr.convert_units(obj, ctx)
+    assert result.x.units == ureg.cm
+    assert result.v.units == ureg.km / ureg.h
+
+    # Sequences are converted column by column
+    objs = [MyClass(float(i), 1.0, 1.0 * ureg.ms) for i in range(3)]
+    objs.append(MyClass(np.arange(2.0), 1.0))
+    result = pinttr.convert_units(objs, "SI")
+    assert [r.x.magnitude for r in result[:3]] == [0.0, 1000.0, 2000.0]
+    assert all(r.x.units == ureg.m for r in result)
+    assert result[0].t.magnitude == pytest.approx(1e-3)
+    np.testing.assert_array_equal(result[3].x.magnitude, [0.0, 1000.0])
+    assert result[3].t is None
+
+    # Values without units and unset fields are left unchanged
+    with pinttr.trusted():
+        plain = MyClass(1.0, np.ones(2))
+    result = pinttr.convert_units([plain, obj], "SI")
+    assert result[0].x == 1.0
+    np.testing.assert_array_equal(result[0].v, [1.0, 1.0])
+    assert result[1].x == 1000.0 * ureg.m
+
+    @attrs.define(slots=False)
+    class Unset:
+        x = pinttr.field(units=ureg.km, init=False)
+
+    assert not hasattr(pinttr.convert_units(Unset(), "SI"), "x")
+
+    # Frozen classes are supported
+    @attrs.frozen
+    class Frozen:
+        x = pinttr.field(units=ureg.km, on_setattr=None)
+
+    assert pinttr.convert_units(Frozen(1.0), "SI").x == 1000.0 * ureg.m
@@ -1,3 +1,7 @@
+import asyncio
+import contextvars
+import threading
+
 import pinttr
 from pinttr import UnitGenerator
 
@@ -59,3 +63,45 @@ def test_unit_generator():
         assert g_length() == ureg.km
     assert g_speed() == ureg.m / ureg.s
     assert g_length() == ureg.m
+
+
+def test_unit_generator_override_threads():
+    """
+    Overrides only apply to the thread or task which sets them.
+    """
+    g_length = UnitGenerator(ureg.m)
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def worker(units):
+        with g_length.override(units):
+            barrier.wait()  # All threads override simultaneously
+            for _ in range(100):
+                if g_length() != units:
+                    errors.append(g_length())
+            barrier.wait()
+
+    units = [ureg.m, ureg.km, ureg.cm, ureg.mm, ureg.mile, ureg.ft, ureg.nm, ureg.um]
+    threads = [threading.Thread(target=worker, args=(u,)) for u in units]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert g_length() == ureg.m and g_length.units == ureg.m
+
+    # Overrides propagate to copied contexts
+    with g_length.override(ureg.km):
+        assert contextvars.copy_context().run(g_length) == ureg.km
+
+    # Concurrent asyncio tasks are isolated
+    async def task(units):
+        with g_length.override(units):
+            await asyncio.sleep(0)
+            return g_length()
+
+    async def main():
+        return await asyncio.gather(task(ureg.km), task(ureg.cm))
+
+    assert asyncio.run(main()) == [ureg.km, ureg.cm]
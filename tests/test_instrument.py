@@ -0,0 +1,166 @@
+import threading
+
+import attrs
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+length = pinttr.UnitGenerator(ureg.m)
+
+
+@attrs.define
+class Base:
+    x = pinttr.field(units=length)
+
+
+@attrs.define
+class Child(Base):
+    t = pinttr.field(default=0.0, units=ureg.s)
+
+
+def test_instrument():
+    """
+    Unit tests for :func:`pinttr.instrument`.
+    """
+    # Nothing is recorded outside instrumented scopes
+    Child(1.0)
+
+    with pinttr.instrument() as stats:
+        Child(1.0 * ureg.km)
+        stats.reset()
+        obj = Child(1.0 * ureg.km)
+        obj.x = 1.0
+
+    snapshot = stats.snapshot()
+    # Validations are attributed to the instance class, conversions to the
+    # class defining the field
+    assert snapshot["Child"]["x"]["validate"]["count"] == 2
+    assert snapshot["Base"]["x"]["convert"]["count"] == 2
+    assert snapshot["Child"]["t"]["convert"]["count"] == 1
+    # Unit resolutions are attributed to the field being processed
+    assert snapshot["Base"]["x"]["resolve"]["count"] == 2
+    assert snapshot["Child"]["x"]["resolve"]["count"] == 2
+    assert snapshot["Child"]["x"]["validate"]["time"] > 0.0
+
+    # Trusted scopes are not recorded
+    with pinttr.instrument() as stats, pinttr.trusted():
+        Child(1.0 * ureg.m)
+    assert stats.snapshot() == {}
+
+    # Unattributed events, callbacks
+    events = []
+    with pinttr.instrument(callback=lambda *args: events.append(args[:3])) as stats:
+        pinttr.converters.ensure_units(
+            1.0 * ureg.km, default_units=ureg.m, convert=True
+        )
+        pinttr.converters.to_quantity({"value": 1.0, "units": "km"})
+    assert stats.snapshot()["*"]["*"]["to"]["count"] == 1
+    assert ("parse", "*", "*") in events
+
+
+def test_instrument_first_instance():
+    """
+    Conversions are attributed to fields from the first instance on.
+    """
+
+    @attrs.define
+    class Local:
+        x = pinttr.field(units=ureg.m)
+
+    with pinttr.instrument() as stats:
+        Local(1.0 * ureg.km)
+
+    snapshot = stats.snapshot()
+    assert snapshot[Local.__qualname__]["x"]["convert"]["count"] == 1
+    assert "convert" not in snapshot.get("*", {}).get("*", {})
+
+
+def test_instrument_scopes():
+    """
+    Instrumented scopes can be nested and only affect the current thread.
+    """
+
+    def count(stats):
+        return stats.snapshot()["Base"]["x"]["validate"]["count"]
+
+    with pinttr.instrument() as outer:
+        Base(1.0)
+        with pinttr.instrument() as inner:
+            Base(1.0)
+        thread = threading.Thread(target=Base, args=(1.0,))
+        thread.start()
+        thread.join()
+
+    assert count(outer) == 2
+    assert count(inner) == 1
+    assert pinttr._instrument._active == 0
+
+
+@attrs.define
+class Track:
+    x = pinttr.field(
+        units=length,
+        converter=pinttr.converters.ensure_units(default_units=length, convert=True),
+    )
+
+
+def test_trace():
+    """
+    Unit tests for :func:`pinttr.trace`.
+    """
+    np = pytest.importorskip("numpy")
+
+    with pinttr.trace(maxlen=2) as conversions:
+        # Conversions which don't change magnitudes are not recorded
+        Track(np.zeros(10) * ureg.m)
+        Track(1.0 * ureg.meter)
+        assert conversions.count == 0
+
+        with length.override(ureg.km):
+            Track(np.zeros(10) * ureg.m)
+        pinttr.interpret_units({"y": 1.0 * ureg.km, "y_units": "m"})
+        pinttr.from_dict(Base, {"x": np.zeros(3) * ureg.cm})
+
+    # The buffer is bounded
+    assert conversions.count == 3
+    records = list(conversions)
+    assert len(records) == 2
+    assert records[0] == pinttr.ConversionRecord(
+        cls="*",
+        field="*",
+        src="kilometer",
+        dst="meter",
+        size=1,
+        location=records[0].location,
+    )
+    assert records[1].src == "centimeter" and records[1].size == 3
+    # Call sites are located outside the library
+    assert records[1].location.startswith(__file__)
+
+    # Sampling
+    with pinttr.trace(sample=0.0) as conversions:
+        pinttr.convert_units(Base(1.0), "cgs")
+    assert conversions.count == 1 and len(conversions) == 0
+
+    with pytest.raises(ValueError):
+        with pinttr.trace(sample=2.0):
+            pass
+
+
+def test_trace_fields():
+    """
+    Traced conversions are attributed to fields when they are known.
+    """
+    with pinttr.trace() as conversions:
+        pinttr.from_dict(Child, {"x": 1.0, "x_units": "km"})
+        pinttr.convert_units([Child(1.0), Child(2.0)], "cgs")
+        # Custom converters are not attributed
+        with length.override(ureg.km):
+            Track(1.0 * ureg.m)
+
+    assert [(r.cls, r.field, r.size) for r in conversions] == [
+        ("Child", "x", 1),
+        ("Child", "x", 2),
+        ("*", "*", 1),
+    ]
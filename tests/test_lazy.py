@@ -0,0 +1,114 @@
+import pickle
+
+import attrs
+import numpy as np
+import pint
+import pytest
+
+import pinttr
+from pinttr.converters import ensure_units
+from pinttr.exceptions import UnitsError
+
+ureg = pinttr.get_unit_registry()
+
+
+@attrs.define
+class Spectrum:
+    w = pinttr.field(units=ureg.nm)
+    radiance = pinttr.field(default=None, units=ureg.W / ureg.m**2 / ureg.nm)
+
+
+def test_load_npy(tmp_path):
+    """
+    Unit tests for :func:`pinttr.load_npy`.
+    """
+    path = tmp_path / "w.npy"
+    pinttr.save_npy(path, np.linspace(0.4, 0.7, 4) * ureg.um)
+    assert (tmp_path / "w.npy.units.json").is_file()
+
+    # Instances are created without reading data
+    obj = Spectrum(pinttr.load_npy(path))
+    assert isinstance(obj.w, pinttr.LazyQuantity)
+    assert not obj.w.loaded
+    assert obj.w.units == ureg.um
+    assert "w.npy" in repr(obj)
+
+    # The magnitude is memory-mapped upon first access
+    assert isinstance(obj.w.magnitude, np.memmap)
+    assert obj.w.loaded
+    np.testing.assert_allclose(obj.w.load().m_as(ureg.nm), [400, 500, 600, 700])
+
+    # Incompatible units are detected from the sidecar
+    with pytest.raises(UnitsError):
+        Spectrum(1.0, pinttr.load_npy(path))
+
+    with pytest.raises(ValueError):
+        pinttr.load_npy(path, key="w")
+
+
+def test_load_npz(tmp_path):
+    """
+    Archives are opened as dictionaries of lazy quantities.
+    """
+    path = tmp_path / "spectrum.npz"
+    radiance = np.asfortranarray(np.random.random((3, 2)))
+    pinttr.save_npy(
+        path,
+        {"w": np.arange(3.0) * ureg.nm, "radiance": radiance * ureg("W/m^2/nm")},
+    )
+
+    quantities = pinttr.load_npy(path)
+    assert set(quantities) == {"w", "radiance"}
+    obj = Spectrum(**quantities)
+    assert isinstance(obj.radiance.magnitude, np.memmap)
+    np.testing.assert_array_equal(obj.radiance.magnitude, radiance)
+    np.testing.assert_array_equal(obj.w.magnitude, np.arange(3.0))
+
+    # Arrays are read into memory if memory-mapping is disabled
+    w = pinttr.load_npy(path, key="w", mmap_mode=None)
+    assert not isinstance(w.magnitude, np.memmap)
+
+
+def test_lazy_quantity_convert(tmp_path):
+    """
+    Lazy quantities are converted without reading data.
+    """
+    path = tmp_path / "w.npy"
+    pinttr.save_npy(path, np.arange(3.0) * ureg.um)
+    lazy = pinttr.load_npy(path)
+
+    converted = ensure_units(lazy, default_units=ureg.nm, convert=True)
+    assert isinstance(converted, pinttr.LazyQuantity)
+    assert converted.units == ureg.nm
+    assert not converted.loaded and not lazy.loaded
+    np.testing.assert_allclose(converted.magnitude, [0.0, 1000.0, 2000.0])
+    assert not lazy.loaded
+
+    assert ensure_units(lazy, default_units=ureg.nm) is lazy
+    assert lazy.to("um") is lazy
+    with pytest.raises(pint.DimensionalityError):
+        lazy.to(ureg.s)
+
+    # Pickling does not include the loaded magnitude
+    assert pickle.loads(pickle.dumps(converted)).units == ureg.nm
+
+
+def test_lazy_quantity_records(tmp_path):
+    path = tmp_path / "w.npy"
+    pinttr.save_npy(path, np.linspace(0.4, 0.7, 4) * ureg.um)
+
+    # from_dict() converts lazy quantities lazily
+    obj = pinttr.from_dict(Spectrum, {"w": pinttr.load_npy(path)})
+    assert isinstance(obj.w, pinttr.LazyQuantity)
+    assert obj.w.units == ureg.nm and not obj.w.loaded
+    np.testing.assert_allclose(obj.w.magnitude, [400.0, 500.0, 600.0, 700.0])
+    with pytest.raises(UnitsError):
+        pinttr.from_dict(Spectrum, {"w": pinttr.load_npy(path), "w_units": "s"})
+    with pytest.raises(UnitsError):
+        pinttr.from_dict(Spectrum, {"radiance": pinttr.load_npy(path), "w": 1.0})
+
+    # unstructure() loads them
+    d = pinttr.unstructure(Spectrum(pinttr.load_npy(path)))
+    assert d["w"]["units"] == "micrometer"
+    np.testing.assert_allclose(d["w"]["value"], [0.4, 0.5, 0.6, 0.7])
+    assert pinttr.structure(Spectrum, d).w.units == ureg.um
@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+import attrs
+import pytest
+
+import pinttr
+from pinttr.converters import to_quantity
+from pinttr.exceptions import UnitsError
+
+ureg = pinttr.get_unit_registry()
+length = pinttr.UnitGenerator(ureg.m)
+
+
+@attrs.define
+class Scene:
+    altitude = pinttr.field(units=length)
+    label = attrs.field(default="")
+
+
+def _write(tmp_path, documents):
+    paths = []
+    for i, document in enumerate(documents):
+        path = tmp_path / f"scene{i}.json"
+        path.write_text(json.dumps(document))
+        paths.append(path)
+    return paths
+
+
+def test_aload_records(tmp_path):
+    """
+    Unit tests for :func:`pinttr.aload_records`.
+    """
+    paths = _write(
+        tmp_path, [{"altitude": float(i), "altitude_units": "km"} for i in range(20)]
+    )
+
+    # Unit interpretation, results in input order
+    results = asyncio.run(pinttr.aload_records(paths, max_workers=4))
+    assert [r["altitude"] for r in results] == [i * ureg.km for i in range(20)]
+
+    # Instances; unit overrides of the calling task apply
+    async def load():
+        with length.override(ureg.cm):
+            return await pinttr.aload_records(paths[:2], cls=Scene)
+
+    results = asyncio.run(load())
+    assert results == [Scene(0.0 * ureg.cm), Scene(1e5 * ureg.cm)]
+    assert results[1].altitude.units == ureg.cm
+
+    # Custom processing
+    paths = _write(tmp_path, [{"value": 1.0, "units": "m"}])
+    results = asyncio.run(pinttr.aload_records(paths, transform=to_quantity))
+    assert results == [1.0 * ureg.m]
+
+    # Errors are raised
+    paths = _write(tmp_path, [{"altitude": 1.0, "altitude_units": "s"}])
+    with pytest.raises(UnitsError):
+        asyncio.run(pinttr.aload_records(paths, cls=Scene))
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(pinttr.aload_records([tmp_path / "missing.json"]))
+
+
+def test_aiter_records(tmp_path):
+    """
+    Unit tests for :func:`pinttr.aiter_records`.
+    """
+    paths = _write(
+        tmp_path, [{"altitude": float(i), "altitude_units": "m"} for i in range(10)]
+    )
+
+    async def load():
+        return [item async for item in pinttr.aiter_records(paths, cls=Scene)]
+
+    results = asyncio.run(load())
+    assert sorted(path for path, _ in results) == sorted(paths)
+    assert all(
+        scene.altitude.magnitude == int(path.stem[5:]) for path, scene in results
+    )
+
+
+def test_aiter_records_yaml(tmp_path):
+    """
+    YAML files are read with PyYAML.
+    """
+    yaml = pytest.importorskip("yaml")
+    path = tmp_path / "scene.yaml"
+    path.write_text(yaml.safe_dump({"altitude": 1.0, "altitude_units": "km"}))
+
+    async def load_yaml():
+        return [item async for item in pinttr.aiter_records([path], cls=Scene)]
+
+    assert asyncio.run(load_yaml()) == [(path, Scene(1.0 * ureg.km))]
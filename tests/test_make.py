@@ -79,3 +79,46 @@ def test_attrib_converter_validator():
     assert a.field == 1.0 * ureg.m
     with pytest.raises(UnitsError):
         a.field = 1.0 * ureg.s
+
+
+def test_attrib_array():
+    """
+    Unit tests for :func:`pinttrs._make.attrib` (array data type, shape and
+    layout).
+    """
+    np = pytest.importorskip("numpy")
+
+    @attrs.define
+    class MyClass:
+        field = pinttr.attrib(
+            default=None, units=ureg.m, dtype="float32", shape=(None, 2), layout="C"
+        )
+
+    # Magnitudes are coerced to the declared data type and layout
+    obj = MyClass([[1, 2], [3, 4]])
+    assert obj.field.magnitude.dtype == np.float32
+    assert obj.field.units == ureg.m
+    obj.field = np.ones((2, 4))[:, ::2] * ureg.km
+    assert obj.field.magnitude.flags.c_contiguous
+    assert obj.field.units == ureg.km
+    assert MyClass().field is None
+
+    # Matching magnitudes are not copied
+    magnitude = np.zeros((3, 2), dtype="float32")
+    assert MyClass(magnitude).field.magnitude is magnitude
+
+    # Shapes are validated
+    with pytest.raises(ValueError):
+        MyClass([1.0, 2.0])
+    with pytest.raises(ValueError):
+        MyClass([[1.0, 2.0, 3.0]])
+
+    # Array specifications are recorded as metadata
+    field = pinttr.attrib(units=ureg.m, shape=[3], layout="F")
+    assert field.metadata[MetadataKey.SHAPE] == (3,)
+    assert field.metadata[MetadataKey.LAYOUT] == "F"
+
+    with pytest.raises(ValueError):
+        pinttr.attrib(units=ureg.m, layout="K")
+    with pytest.raises(TypeError):
+        pinttr.attrib(dtype=float)
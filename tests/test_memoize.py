@@ -0,0 +1,136 @@
+import time
+
+import numpy as np
+import pint
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+
+def test_memoize_units():
+    """
+    Unit tests for :func:`pinttr.memoize`: argument normalization and keys.
+    """
+    calls = []
+
+    @pinttr.memoize(units={"x": ureg.m})
+    def f(x, scale=1.0):
+        calls.append(x)
+        return x * scale
+
+    # Equivalent quantities share an entry and are passed in declared units
+    assert f(1.0 * ureg.km) == 1000.0 * ureg.m
+    assert f(1000.0 * ureg.m) == 1000.0 * ureg.m
+    assert f(1000.0) == 1000.0 * ureg.m
+    assert f(1000.0 * ureg.m, scale=1.0) == 1000.0 * ureg.m
+    assert calls == [1000.0 * ureg.m]
+    assert calls[0].units == ureg.m
+
+    # Other arguments are part of the key
+    f(1.0 * ureg.km, 2.0)
+    assert len(calls) == 2
+
+    # Incompatible units are rejected
+    with pytest.raises(pint.DimensionalityError):
+        f(1.0 * ureg.s)
+
+    with pytest.raises(ValueError, match="unknown parameters"):
+        pinttr.memoize(units={"y": ureg.m})(lambda x: x)
+
+
+def test_memoize_arrays():
+    calls = []
+
+    @pinttr.memoize(units={"x": "m"})
+    def total(x):
+        calls.append(x)
+        return x.sum()
+
+    x = np.arange(10.0)
+    assert total(x * ureg.km) == 45000.0 * ureg.m
+    assert total(x * 1000.0 * ureg.m) == 45000.0 * ureg.m
+    # Non-contiguous arrays are keyed by content
+    assert total(np.arange(20.0)[::2] * ureg.km) == 90000.0 * ureg.m
+    assert len(calls) == 2
+
+    # Arrays are keyed by data type and shape
+    total(x.astype(np.float32) * ureg.km)
+    total(x.reshape(2, 5) * ureg.km)
+    assert len(calls) == 4
+
+    # Undeclared array arguments are keyed with their units
+    @pinttr.memoize
+    def identity(x):
+        calls.append(x)
+        return x
+
+    identity(x * ureg.km)
+    identity(x * ureg.km)
+    identity(x * 1000.0 * ureg.m)
+    assert len(calls) == 6
+
+
+def test_memoize_context():
+    length = pinttr.UnitGenerator(ureg.m)
+    ctx = pinttr.UnitContext({"length": length})
+    calls = []
+
+    @pinttr.memoize(units={"x": length}, context=ctx)
+    def f(x):
+        calls.append(x)
+        return x.to(ctx["length"])
+
+    assert f(1.0 * ureg.km) == 1000.0 * ureg.m
+    with ctx.override(length="km"):
+        # Declared units are resolved upon each call
+        assert f(1.0 * ureg.km) == 1.0 * ureg.km
+        assert calls[-1].units == ureg.km
+    assert f(1.0 * ureg.km) == 1000.0 * ureg.m
+    assert len(calls) == 2
+
+    # Registrations renew the context generation
+    generation = ctx.generation
+    ctx["time"] = ureg.s
+    assert ctx.generation != generation
+    f(1.0 * ureg.km)
+    assert len(calls) == 3
+
+
+def test_memoize_eviction():
+    # LRU eviction
+    @pinttr.memoize(maxsize=2)
+    def f(x):
+        return x
+
+    f(1), f(2), f(1), f(3)
+    info = f.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.size) == (1, 3, 1, 2)
+    f(1)  # Most recently used entries are kept
+    assert f.cache_info().hits == 2
+
+    f.cache_clear()
+    assert f.cache_info() == pinttr.CacheInfo(0, 0, 0, 0, 0, 0)
+
+    # Size-based eviction
+    @pinttr.memoize(maxsize=None, maxbytes=1500)
+    def zeros(n):
+        return np.zeros(n) * ureg.m
+
+    zeros(100), zeros(100), zeros(110)
+    info = zeros.cache_info()
+    assert (info.evictions, info.size, info.nbytes) == (1, 1, 880)
+    zeros(1000)  # Too large to be cached
+    assert zeros.cache_info().size == 1
+
+    # Expiration
+    @pinttr.memoize(ttl=0.01)
+    def g(x):
+        return x
+
+    g(1), g(1)
+    time.sleep(0.02)
+    g(1)
+    info = g.cache_info()
+    assert (info.hits, info.misses, info.expirations) == (1, 2, 1)
@@ -0,0 +1,84 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import attrs
+import numpy as np
+
+import pinttr
+from pinttr import pickling
+
+ureg = pinttr.get_unit_registry()
+
+
+@attrs.define
+class MyClass:
+    x = pinttr.field(units=ureg.m)
+    t = pinttr.field(default=None, units=ureg.s)
+
+
+def _identity(x):
+    return x
+
+
+def test_dumps():
+    """
+    Unit tests for :func:`pinttr.pickling.dumps`.
+    """
+    # Quantities and units round-trip with compact unit strings
+    q = 1.0 * ureg.km / ureg.s
+    assert len(pickling.dumps(q)) < len(pickle.dumps(q))
+    assert pickle.loads(pickling.dumps(q)) == q
+    assert pickle.loads(pickling.dumps(ureg.degC)) == ureg.degC
+
+    obj = MyClass(np.arange(3.0), 1.0)
+    result = pickle.loads(pickling.dumps(obj))
+    assert np.array_equal(result.x.m, obj.x.m) and result.t == obj.t
+
+    # Unit generators keep their identity
+    generator = pinttr.UnitGenerator(ureg.m)
+    a, b = pickle.loads(pickling.dumps([generator, generator]))
+    assert a is b
+    assert pickle.loads(pickling.dumps(generator)) is generator
+
+    # The default registry is pickled by reference
+    ctx = pinttr.UnitContext({"x": ureg.m}, ureg=ureg)
+    result = pickle.loads(pickling.dumps(ctx))
+    assert result.ureg is ureg
+    assert result.registry["x"] is ctx.registry["x"]
+
+
+def test_shared_memory():
+    """
+    Large magnitudes are transferred through shared memory.
+    """
+    q = ureg.Quantity(np.arange(1000.0), "m")
+    try:
+        data = pickling.dumps(q, shared_memory_threshold=1000)
+        assert len(data) < 1000
+        result = pickle.loads(data)
+        assert np.array_equal(result.m, q.m)
+        # Small arrays are serialized
+        data = pickling.dumps(q[:10], shared_memory_threshold=1000)
+        assert np.array_equal(pickle.loads(data).m, q.m[:10])
+    finally:
+        pickling.release_shared_memory()
+
+
+def test_register():
+    """
+    Unit tests for :func:`pinttr.pickling.register`.
+    """
+    generator = pinttr.UnitGenerator(ureg.m)
+    q = ureg.Quantity(np.arange(1000.0), "m")
+
+    pickling.register(shared_memory_threshold=1000)
+    try:
+        with ProcessPoolExecutor(1, initializer=pickling.register) as pool:
+            result = pool.submit(_identity, [generator, q, 1.0 * ureg.s]).result()
+    finally:
+        pickling.unregister()
+        pickling.release_shared_memory()
+
+    assert result[0] is generator
+    assert np.array_equal(result[1].m, q.m)
+    assert result[2] == 1.0 * ureg.s
@@ -0,0 +1,49 @@
+import attrs
+import numpy as np
+import pytest
+
+import pinttr
+
+ureg = pinttr.get_unit_registry()
+
+
+@attrs.define
+class MyClass:
+    x = pinttr.field(units=ureg.m)
+
+
+def test_repr():
+    """
+    Unit tests for the default repr of unit fields.
+    """
+    # Scalars and small arrays are printed in full
+    assert repr(MyClass(1.0)) == "MyClass(x=1.0 m)"
+    assert repr(MyClass(np.array([1.0, 2.0]))) == "MyClass(x=[1.0 2.0] m)"
+
+    # Large arrays are summarized
+    r = repr(MyClass(np.arange(10000.0)))
+    assert "..." in r
+    assert "shape=(10000,)" in r
+    assert "dtype=float64" in r
+    assert r.endswith(" m (shape=(10000,), dtype=float64))")
+
+
+def test_repr_threshold():
+    """
+    Unit tests for :func:`pinttr.set_repr_threshold`.
+    """
+    default = pinttr.get_repr_threshold()
+
+    try:
+        pinttr.set_repr_threshold(10)
+        assert "shape=(11,)" in repr(MyClass(np.arange(11.0)))
+        assert "shape" not in repr(MyClass(np.arange(10.0)))
+
+        # Summarization can be disabled
+        pinttr.set_repr_threshold(None)
+        assert "..." not in repr(MyClass(np.arange(10000.0)))
+
+        with pytest.raises(ValueError):
+            pinttr.set_repr_threshold(-1)
+    finally:
+        pinttr.set_repr_threshold(default)
@@ -0,0 +1,56 @@
+import attrs
+import pytest
+
+import pinttr
+from pinttr import UnitGenerator
+
+ureg = pinttr.get_unit_registry()
+
+
+def test_fields_with_units():
+    """
+    Unit tests for :func:`pinttr.fields_with_units`.
+    """
+    ugen = UnitGenerator(ureg.s)
+
+    @attrs.define
+    class MyClass:
+        x = pinttr.field(units=ureg.m)
+        label = attrs.field(default="")
+        _t = pinttr.field(default=None, units=ugen)
+        y = pinttr.field(default=0.0, units=ureg.m, converter=float)
+
+    schema = pinttr.fields_with_units(MyClass)
+    assert schema.names == ("x", "_t", "y")
+    assert len(schema) == 3
+    assert [f.index for f in schema] == [0, 2, 3]
+    assert "x" in schema and "label" not in schema
+    assert schema.get("label") is None
+
+    t = schema["_t"]
+    assert t.init_name == "t"
+    assert t.units is ugen
+    assert t.optional
+    assert t.default_converter and t.default_validator
+    assert t.attribute is attrs.fields(MyClass)._t
+
+    # User-defined converters are detected
+    assert not schema["y"].default_converter
+    assert schema["y"].default_validator
+
+    # Schemas are cached on the class
+    assert pinttr.fields_with_units(MyClass) is schema
+
+    # Subclasses get their own schema
+    @attrs.define
+    class MyChildClass(MyClass):
+        z = pinttr.field(default=0.0, units=ureg.m)
+
+    assert pinttr.fields_with_units(MyChildClass).names == ("x", "_t", "y", "z")
+    assert pinttr.fields_with_units(MyClass) is schema
+
+    # Instances and non-attrs classes are rejected
+    with pytest.raises(TypeError):
+        pinttr.fields_with_units(MyClass(1.0))
+    with pytest.raises(attrs.exceptions.NotAnAttrsClassError):
+        pinttr.fields_with_units(int)
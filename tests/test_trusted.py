@@ -0,0 +1,82 @@
+import threading
+
+import attrs
+import pytest
+
+import pinttr
+from pinttr.exceptions import UnitsError
+
+ureg = pinttr.get_unit_registry()
+
+
+def test_trusted():
+    """
+    Unit tests for :func:`pinttr.trusted`.
+    """
+
+    def user_validator(instance, attribute, value):
+        if value.magnitude < 0.0:
+            raise ValueError("negative")
+
+    @attrs.define
+    class MyClass:
+        x = pinttr.field(units=ureg.m)
+        y = pinttr.field(default=None, units=ureg.m)
+        z = pinttr.field(default=0.0, units=ureg.m, validator=user_validator)
+
+    assert not pinttr.is_trusted()
+
+    # Default converters and validators are bypassed
+    obj = MyClass(1.0)
+    with pinttr.trusted():
+        assert pinttr.is_trusted()
+        obj.x = 1.0 * ureg.s
+        obj.y = 1.0
+    assert obj.x == 1.0 * ureg.s
+    assert obj.y == 1.0
+    assert not pinttr.is_trusted()
+
+    # Regular behaviour is restored upon leaving the context
+    with pytest.raises(UnitsError):
+        obj.x = 1.0 * ureg.s
+
+    # User validators keep running
+    with pinttr.trusted():
+        with pytest.raises(ValueError):
+            obj.z = -1.0 * ureg.m
+
+    # Instantiation is also affected
+    with pinttr.trusted():
+        assert MyClass(x=1.0 * ureg.s, z=0.0 * ureg.m).x == 1.0 * ureg.s
+
+
+def test_trusted_threads():
+    """
+    Other threads remain fully validated while a thread is in a trusted scope.
+    """
+
+    @attrs.define
+    class MyClass:
+        x = pinttr.field(units=ureg.m)
+
+    entered = threading.Event()
+    done = threading.Event()
+    errors = []
+
+    def worker():
+        entered.wait()
+        try:
+            MyClass(1.0 * ureg.s)
+        except UnitsError as e:
+            errors.append(e)
+        finally:
+            done.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    with pinttr.trusted():
+        entered.set()
+        done.wait()
+    thread.join()
+
+    assert len(errors) == 1
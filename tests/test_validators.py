@@ -3,7 +3,13 @@ import pint
 import pinttr
 import pytest
 from pinttr.exceptions import UnitsError
-from pinttr.validators import has_compatible_units
+from pinttr.validators import (
+    finite,
+    has_compatible_shape,
+    has_compatible_units,
+    in_range,
+    positive,
+)
 
 
 def test_has_compatible_units():
@@ -39,3 +45,94 @@ def test_has_compatible_units():
     # Validation fails if value has no units
     with pytest.raises(UnitsError):
         MyClass(angle=1.0)
+
+
+def test_has_compatible_shape():
+    """
+    Unit tests for :func:`pinttr.validators.has_compatible_shape`.
+    """
+    np = pytest.importorskip("numpy")
+    ureg = pint.UnitRegistry()
+
+    @attrs.define
+    class MyClass:
+        x = pinttr.field(units=ureg.m, shape=(None, 3), converter=None)
+        y = pinttr.field(
+            units=ureg.m, converter=None, validator=has_compatible_shape, default=1.0
+        )
+
+    MyClass(np.zeros((2, 3)) * ureg.m)
+    MyClass(np.zeros((0, 3)) * ureg.m)
+    # Fields without a declared shape are not checked
+    MyClass(np.zeros((2, 3)) * ureg.m, np.zeros(4))
+
+    with pytest.raises(ValueError, match="incompatible shape"):
+        MyClass(np.zeros(3) * ureg.m)
+    with pytest.raises(ValueError):
+        MyClass(np.zeros((2, 4)) * ureg.m)
+    with pytest.raises(ValueError):
+        MyClass(1.0 * ureg.m)
+
+
+def test_in_range():
+    """
+    Unit tests for :func:`pinttr.validators.in_range`.
+    """
+    np = pytest.importorskip("numpy")
+    ureg = pinttr.get_unit_registry()
+
+    @attrs.define
+    class MyClass:
+        altitude = pinttr.field(
+            units=ureg.m, validator=in_range(0.0, 100.0 * ureg.km), converter=None
+        )
+        t = pinttr.field(
+            default=0.0 * ureg.s,
+            units=ureg.s,
+            validator=in_range(max=1.0, max_inclusive=False),
+        )
+
+    # Bounds are converted to value units; unitless bounds are interpreted
+    # in declared units
+    MyClass(np.array([0.0, 100.0]) * ureg.km)
+    MyClass(1e5 * ureg.m)
+    MyClass(0.0 * ureg.m, 999.0 * ureg.ms)
+
+    with pytest.raises(ValueError, match=r"value 200.0 km at index 1"):
+        MyClass(np.array([1.0, 200.0, 300.0]) * ureg.km)
+    with pytest.raises(ValueError, match=r"at index \(1, 0\)"):
+        MyClass(np.array([[1.0, 2.0], [-1.0, 2.0]]) * ureg.m)
+    with pytest.raises(ValueError, match="out of range"):
+        MyClass(0.0 * ureg.m, 1.0 * ureg.s)
+
+    # Units are checked
+    with pytest.raises(UnitsError):
+        MyClass(1.0 * ureg.s)
+    with pytest.raises(UnitsError):
+        MyClass(1.0)
+
+
+def test_positive_finite():
+    """
+    Unit tests for :func:`pinttr.validators.positive` and
+    :func:`pinttr.validators.finite`.
+    """
+    np = pytest.importorskip("numpy")
+    ureg = pinttr.get_unit_registry()
+
+    @attrs.define
+    class MyClass:
+        t = pinttr.field(units=ureg.K, validator=positive)
+        x = pinttr.field(default=0.0, units=ureg.m, validator=finite)
+
+    MyClass(np.array([1.0, 2.0]) * ureg.K)
+    MyClass(1.0 * ureg.mK)
+    with pytest.raises(ValueError):
+        MyClass(-1.0 * ureg.mK)
+    with pytest.raises(ValueError, match="at index 0"):
+        MyClass(np.array([0.0, 1.0]) * ureg.K)
+
+    with pytest.raises(ValueError, match="value nan m at index 1 .* not finite"):
+        MyClass(1.0, [0.0, np.nan])
+    with pytest.raises(UnitsError):
+        MyClass(1.0, 1.0 * ureg.s)